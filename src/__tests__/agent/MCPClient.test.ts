@@ -0,0 +1,169 @@
+import { describe, expect, test, jest, afterEach } from '@jest/globals';
+import { Tool, CallToolResult } from '@modelcontextprotocol/sdk/types.js';
+import { MCPClient } from '../../agent/mcp/MCPClient.js';
+
+type CallToolMock = jest.Mock<(params: { name: string; arguments?: Record<string, any> }) => Promise<CallToolResult>>;
+
+const tool = (name: string, readOnly: boolean): Tool => ({
+  name,
+  inputSchema: { type: 'object' },
+  annotations: { readOnlyHint: readOnly },
+});
+
+// An MCPClient wired to a stub SDK client instead of a spawned server
+function createClient(callTool: CallToolMock, tools: Tool[] = []): MCPClient {
+  const client = new MCPClient({ command: 'node', args: [] });
+  (client as any).client = { callTool };
+  for (const t of tools) {
+    (client as any).tools.set(t.name, t);
+  }
+  return client;
+}
+
+const textResult = (text: string): CallToolResult => ({ content: [{ type: 'text', text }] });
+
+describe('MCPClient', () => {
+  describe('callTools', () => {
+    test('should return results in call order', async () => {
+      const callTool: CallToolMock = jest.fn(async ({ name }) => {
+        await new Promise(resolve => setTimeout(resolve, name === 'writeA' ? 20 : 0));
+        return textResult(name);
+      });
+      const client = createClient(callTool, [tool('writeA', false), tool('writeB', false)]);
+
+      const results = await client.callTools([
+        { name: 'writeA', arguments: {} },
+        { name: 'writeB', arguments: {} },
+      ]);
+
+      expect(results.map(r => r.name)).toEqual(['writeA', 'writeB']);
+      expect(results.every(r => r.success)).toBe(true);
+    });
+
+    test('should skip calls not yet started after a failure with stopOnError', async () => {
+      const callTool: CallToolMock = jest.fn(async ({ name }) => {
+        if (name === 'writeA') throw new Error('boom');
+        return textResult(name);
+      });
+      const client = createClient(callTool, [tool('writeA', false), tool('writeB', false)]);
+
+      const results = await client.callTools([
+        { name: 'writeA', arguments: {} },
+        { name: 'writeB', arguments: {} },
+      ], { maxConcurrent: 1, stopOnError: true });
+
+      expect(callTool).toHaveBeenCalledTimes(1);
+      expect(results[0]).toMatchObject({ success: false, error: 'boom' });
+      expect(results[1]).toMatchObject({ success: false, error: 'Skipped after earlier failure in batch' });
+    });
+
+    test('should run every call without stopOnError', async () => {
+      const callTool: CallToolMock = jest.fn(async ({ name }) => {
+        if (name === 'writeA') throw new Error('boom');
+        return textResult(name);
+      });
+      const client = createClient(callTool, [tool('writeA', false), tool('writeB', false)]);
+
+      const results = await client.callTools([
+        { name: 'writeA', arguments: {} },
+        { name: 'writeB', arguments: {} },
+      ], { maxConcurrent: 1 });
+
+      expect(callTool).toHaveBeenCalledTimes(2);
+      expect(results[1].success).toBe(true);
+    });
+  });
+
+  describe('result cache', () => {
+    const tools = [
+      tool('searchDevices', true),
+      tool('getDeviceDetails', true),
+      tool('getLocalAdminPassword', true),
+      tool('updateInventory', false),
+    ];
+
+    afterEach(() => {
+      jest.restoreAllMocks();
+    });
+
+    test('should reuse the result of an identical read-only call', async () => {
+      const callTool: CallToolMock = jest.fn(async () => textResult('devices'));
+      const client = createClient(callTool, tools);
+
+      const first = await client.callTool({ name: 'searchDevices', arguments: { query: 'mac', limit: 5 } });
+      const second = await client.callTool({ name: 'searchDevices', arguments: { limit: 5, query: 'mac' } });
+
+      expect(callTool).toHaveBeenCalledTimes(1);
+      expect(second).toEqual(first);
+    });
+
+    test('should hand each caller its own copy of a cached result', async () => {
+      const callTool: CallToolMock = jest.fn(async () => textResult('devices'));
+      const client = createClient(callTool, tools);
+
+      const first = await client.callTool({ name: 'searchDevices', arguments: {} });
+      (first.content[0] as any).text = 'mutated';
+      const second = await client.callTool({ name: 'searchDevices', arguments: {} });
+      (second.content[0] as any).text = 'mutated again';
+      const third = await client.callTool({ name: 'searchDevices', arguments: {} });
+
+      expect((third.content[0] as any).text).toBe('devices');
+    });
+
+    test('should expire detail lookups sooner than searches', async () => {
+      const callTool: CallToolMock = jest.fn(async ({ name }) => textResult(name));
+      const client = createClient(callTool, tools);
+      const now = Date.now();
+
+      await client.callTool({ name: 'searchDevices', arguments: {} });
+      await client.callTool({ name: 'getDeviceDetails', arguments: { deviceId: '1' } });
+      jest.spyOn(Date, 'now').mockReturnValue(now + 6000);
+      await client.callTool({ name: 'searchDevices', arguments: {} });
+      await client.callTool({ name: 'getDeviceDetails', arguments: { deviceId: '1' } });
+
+      expect(callTool.mock.calls.map(([params]) => params.name)).toEqual([
+        'searchDevices',
+        'getDeviceDetails',
+        'getDeviceDetails',
+      ]);
+    });
+
+    test('should never cache volatile reads', async () => {
+      const callTool: CallToolMock = jest.fn(async () => textResult('secret'));
+      const client = createClient(callTool, tools);
+
+      await client.callTool({ name: 'getLocalAdminPassword', arguments: { clientManagementId: 'a' } });
+      await client.callTool({ name: 'getLocalAdminPassword', arguments: { clientManagementId: 'a' } });
+
+      expect(callTool).toHaveBeenCalledTimes(2);
+    });
+
+    test('should invalidate cached reads on a write', async () => {
+      const callTool: CallToolMock = jest.fn(async ({ name }) => textResult(name));
+      const client = createClient(callTool, tools);
+
+      await client.callTool({ name: 'searchDevices', arguments: {} });
+      await client.callTool({ name: 'updateInventory', arguments: { deviceId: '1' } });
+      await client.callTool({ name: 'searchDevices', arguments: {} });
+
+      expect(callTool).toHaveBeenCalledTimes(3);
+    });
+
+    test('should not cache a read that was in flight during a write', async () => {
+      let finishRead: (result: CallToolResult) => void = () => {};
+      const callTool: CallToolMock = jest.fn(({ name }) => name === 'searchDevices' && callTool.mock.calls.length === 1
+        ? new Promise<CallToolResult>(resolve => { finishRead = resolve; })
+        : Promise.resolve(textResult(name)));
+      const client = createClient(callTool, tools);
+
+      const staleRead = client.callTool({ name: 'searchDevices', arguments: {} });
+      await client.callTool({ name: 'updateInventory', arguments: { deviceId: '1' } });
+      finishRead(textResult('before write'));
+      await staleRead;
+      const fresh = await client.callTool({ name: 'searchDevices', arguments: {} });
+
+      expect(callTool).toHaveBeenCalledTimes(3);
+      expect((fresh.content[0] as any).text).toBe('searchDevices');
+    });
+  });
+});
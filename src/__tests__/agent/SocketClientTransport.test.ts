@@ -0,0 +1,68 @@
+import { describe, expect, test, afterEach } from '@jest/globals';
+import * as net from 'net';
+import * as os from 'os';
+import * as path from 'path';
+import { Client } from '@modelcontextprotocol/sdk/client/index.js';
+import { Server } from '@modelcontextprotocol/sdk/server/index.js';
+import { StdioServerTransport } from '@modelcontextprotocol/sdk/server/stdio.js';
+import { ListToolsRequestSchema } from '@modelcontextprotocol/sdk/types.js';
+import { SocketClientTransport } from '../../agent/mcp/SocketClientTransport.js';
+
+describe('SocketClientTransport', () => {
+  const socketPath = path.join(os.tmpdir(), `jamf-mcp-test-${process.pid}.sock`);
+  let socketServer: net.Server | null = null;
+  let accepted: net.Socket[] = [];
+
+  afterEach(async () => {
+    if (socketServer) {
+      await new Promise<void>((resolve) => socketServer!.close(() => resolve()));
+      socketServer = null;
+    }
+    accepted = [];
+  });
+
+  // An MCP server on the socket, framed the same way src/index.ts serves it
+  const listen = async (): Promise<void> => {
+    socketServer = net.createServer((socket) => {
+      accepted.push(socket);
+      const server = new Server({ name: 'test-server', version: '1.0.0' }, { capabilities: { tools: {} } });
+      server.setRequestHandler(ListToolsRequestSchema, async () => ({
+        tools: [{ name: 'searchDevices', inputSchema: { type: 'object' } }],
+      }));
+      server.connect(new StdioServerTransport(socket, socket));
+      socket.on('close', () => server.close().catch(() => {}));
+    });
+    await new Promise<void>((resolve) => socketServer!.listen(socketPath, resolve));
+  };
+
+  test('should round-trip MCP requests over the socket', async () => {
+    await listen();
+    const client = new Client({ name: 'test-client', version: '1.0.0' }, { capabilities: {} });
+
+    await client.connect(new SocketClientTransport(socketPath));
+    const result = await client.listTools();
+    await client.close();
+
+    expect(result.tools.map(t => t.name)).toEqual(['searchDevices']);
+  });
+
+  test('should report close when the server ends the connection', async () => {
+    await listen();
+    const transport = new SocketClientTransport(socketPath);
+    const closed = new Promise<void>((resolve) => { transport.onclose = resolve; });
+
+    await transport.start();
+    while (accepted.length === 0) {
+      await new Promise(resolve => setImmediate(resolve));
+    }
+    accepted.forEach(socket => socket.destroy());
+
+    await expect(closed).resolves.toBeUndefined();
+  });
+
+  test('should reject start when nothing is listening', async () => {
+    const transport = new SocketClientTransport(path.join(os.tmpdir(), `jamf-mcp-missing-${process.pid}.sock`));
+
+    await expect(transport.start()).rejects.toThrow();
+  });
+});
@@ -1,5 +1,7 @@
 import { describe, expect, test, jest, beforeEach, afterEach } from '@jest/globals';
 import { Request, Response, NextFunction } from 'express';
+import jwt from 'jsonwebtoken';
+import { createHmac } from 'crypto';
 import { authMiddleware, cleanupAuthMiddleware } from '../../server/auth-middleware.js';
 
 describe('Auth Middleware', () => {
@@ -112,6 +114,33 @@ describe('Auth Middleware', () => {
       expect(mockNext).not.toHaveBeenCalled();
     });
 
+    test('should accept a valid dev mode token on repeated requests', async () => {
+      process.env.OAUTH_PROVIDER = 'dev';
+      process.env.NODE_ENV = 'development';
+      process.env.JWT_SECRET = 'test-secret';
+      const token = jwt.sign({ sub: 'user-1' }, 'test-secret', { expiresIn: '1h' });
+      mockReq.headers = { authorization: `Bearer ${token}` };
+
+      await authMiddleware(mockReq as Request, mockRes as Response, mockNext);
+      await authMiddleware(mockReq as Request, mockRes as Response, mockNext);
+
+      expect(mockNext).toHaveBeenCalledTimes(2);
+      expect(mockRes.status).not.toHaveBeenCalled();
+    });
+
+    test('should reject a dev mode token signed with a different secret', async () => {
+      process.env.OAUTH_PROVIDER = 'dev';
+      process.env.NODE_ENV = 'development';
+      process.env.JWT_SECRET = 'test-secret';
+      const token = jwt.sign({ sub: 'user-1' }, 'other-secret', { expiresIn: '1h' });
+      mockReq.headers = { authorization: `Bearer ${token}` };
+
+      await authMiddleware(mockReq as Request, mockRes as Response, mockNext);
+
+      expect(mockRes.status).toHaveBeenCalledWith(401);
+      expect(mockNext).not.toHaveBeenCalled();
+    });
+
     test('should reject auth0 without valid token', async () => {
       process.env.OAUTH_PROVIDER = 'auth0';
       process.env.AUTH0_DOMAIN = 'test.auth0.com';
@@ -124,6 +153,126 @@ describe('Auth Middleware', () => {
     });
   });
 
+  describe('authMiddleware - token expiration', () => {
+    const nowSeconds = () => Math.floor(Date.now() / 1000);
+
+    beforeEach(() => {
+      process.env.OAUTH_PROVIDER = 'dev';
+      process.env.NODE_ENV = 'development';
+      process.env.JWT_SECRET = 'test-secret';
+    });
+
+    test('should accept a token without an exp claim', async () => {
+      const token = jwt.sign({ sub: 'user-1' }, 'test-secret');
+      mockReq.headers = { authorization: `Bearer ${token}` };
+
+      await authMiddleware(mockReq as Request, mockRes as Response, mockNext);
+
+      expect(mockNext).toHaveBeenCalled();
+      expect(mockRes.status).not.toHaveBeenCalled();
+    });
+
+    test('should reject a token with a non-numeric exp claim', async () => {
+      // jwt.sign refuses a non-numeric exp, so sign this one by hand
+      const encode = (part: object) => Buffer.from(JSON.stringify(part)).toString('base64url');
+      const unsigned = `${encode({ alg: 'HS256', typ: 'JWT' })}.${encode({ sub: 'user-1', exp: 'tomorrow' })}`;
+      const signature = createHmac('sha256', 'test-secret').update(unsigned).digest('base64url');
+      const token = `${unsigned}.${signature}`;
+      mockReq.headers = { authorization: `Bearer ${token}` };
+
+      await authMiddleware(mockReq as Request, mockRes as Response, mockNext);
+
+      expect(mockRes.status).toHaveBeenCalledWith(401);
+      expect(mockNext).not.toHaveBeenCalled();
+    });
+
+    test('should reject a token whose exp is the current second', async () => {
+      const token = jwt.sign({ sub: 'user-1', exp: nowSeconds() }, 'test-secret');
+      mockReq.headers = { authorization: `Bearer ${token}` };
+
+      await authMiddleware(mockReq as Request, mockRes as Response, mockNext);
+
+      expect(mockRes.status).toHaveBeenCalledWith(401);
+      expect(mockNext).not.toHaveBeenCalled();
+    });
+
+    test('should accept a token whose exp is in the future', async () => {
+      const token = jwt.sign({ sub: 'user-1', exp: nowSeconds() + 60 }, 'test-secret');
+      mockReq.headers = { authorization: `Bearer ${token}` };
+
+      await authMiddleware(mockReq as Request, mockRes as Response, mockNext);
+
+      expect(mockNext).toHaveBeenCalled();
+      expect(mockRes.status).not.toHaveBeenCalled();
+    });
+  });
+
+  describe('authMiddleware - verified token cache', () => {
+    // A structurally valid JWT; the provider's signature check is stubbed below
+    const makeToken = (sub: string) => jwt.sign({ sub }, 'unused-secret');
+
+    beforeEach(() => {
+      process.env.OAUTH_PROVIDER = 'auth0';
+      process.env.AUTH0_DOMAIN = 'test.auth0.com';
+    });
+
+    afterEach(() => {
+      jest.restoreAllMocks();
+      cleanupAuthMiddleware();
+    });
+
+    const stubProviderVerify = (payload: Record<string, any>) =>
+      jest.spyOn(jwt, 'verify').mockImplementation(((...args: any[]) => {
+        const callback = args[args.length - 1];
+        callback(null, payload);
+      }) as any);
+
+    test('should skip provider verification for a cached token', async () => {
+      const verify = stubProviderVerify({ sub: 'user-cache', exp: Math.floor(Date.now() / 1000) + 300 });
+      mockReq.headers = { authorization: `Bearer ${makeToken('user-cache')}` };
+
+      await authMiddleware(mockReq as Request, mockRes as Response, mockNext);
+      await authMiddleware(mockReq as Request, mockRes as Response, mockNext);
+
+      expect(verify).toHaveBeenCalledTimes(1);
+      expect(mockNext).toHaveBeenCalledTimes(2);
+    });
+
+    test('should reject a cached token once it has expired', async () => {
+      const now = Date.now();
+      const verify = stubProviderVerify({ sub: 'user-expiring', exp: Math.floor(now / 1000) + 30 });
+      mockReq.headers = { authorization: `Bearer ${makeToken('user-expiring')}` };
+
+      await authMiddleware(mockReq as Request, mockRes as Response, mockNext);
+      // Still inside the cache TTL, but past the token's own exp
+      jest.spyOn(Date, 'now').mockReturnValue(now + 31000);
+      await authMiddleware(mockReq as Request, mockRes as Response, mockNext);
+
+      expect(verify).toHaveBeenCalledTimes(1);
+      expect(mockNext).toHaveBeenCalledTimes(1);
+      expect(mockRes.status).toHaveBeenCalledWith(401);
+      expect(mockRes.json).toHaveBeenCalledWith({ error: 'Token has expired' });
+    });
+
+    test('should verify dev tokens on every request', async () => {
+      process.env.OAUTH_PROVIDER = 'dev';
+      process.env.NODE_ENV = 'development';
+      process.env.JWT_SECRET = 'test-secret';
+      const verify = jest.spyOn(jwt, 'verify');
+      const token = jwt.sign({ sub: 'user-dev' }, 'test-secret', { expiresIn: '1h' });
+      mockReq.headers = { authorization: `Bearer ${token}` };
+
+      await authMiddleware(mockReq as Request, mockRes as Response, mockNext);
+      // A rotated secret takes effect immediately
+      process.env.JWT_SECRET = 'rotated-secret';
+      await authMiddleware(mockReq as Request, mockRes as Response, mockNext);
+
+      expect(verify).toHaveBeenCalledTimes(2);
+      expect(mockNext).toHaveBeenCalledTimes(1);
+      expect(mockRes.status).toHaveBeenCalledWith(401);
+    });
+  });
+
   describe('cleanupAuthMiddleware', () => {
     test('should clean up resources without errors', () => {
       expect(() => cleanupAuthMiddleware()).not.toThrow();
@@ -0,0 +1,238 @@
+import { describe, expect, test, jest, beforeAll, afterAll, beforeEach } from '@jest/globals';
+import express from 'express';
+import http from 'http';
+import { AddressInfo } from 'net';
+import { createSkillsRouter } from '../../server/skills-endpoints.js';
+import type { SkillsManager } from '../../skills/manager.js';
+
+describe('Skills endpoints - idempotent execution', () => {
+  const executeSkill = jest.fn<(skill: string, params: any) => Promise<any>>();
+  let server: http.Server;
+  let baseUrl: string;
+  let currentUser: string | undefined;
+
+  beforeAll(async () => {
+    const app = express();
+    app.use(express.json());
+    app.use((req, _res, next) => {
+      if (currentUser) {
+        (req as any).user = { sub: currentUser };
+      }
+      next();
+    });
+    app.use('/api/v1/skills', createSkillsRouter({ executeSkill } as unknown as SkillsManager));
+
+    server = http.createServer(app);
+    await new Promise<void>((resolve) => server.listen(0, '127.0.0.1', resolve));
+    baseUrl = `http://127.0.0.1:${(server.address() as AddressInfo).port}/api/v1/skills`;
+  });
+
+  afterAll(async () => {
+    await new Promise<void>((resolve) => server.close(() => resolve()));
+  });
+
+  beforeEach(() => {
+    executeSkill.mockReset();
+    currentUser = 'alice';
+  });
+
+  const execute = (body: Record<string, any>, idempotencyKey?: string) =>
+    fetch(`${baseUrl}/execute`, {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+        ...(idempotencyKey ? { 'Idempotency-Key': idempotencyKey } : {})
+      },
+      body: JSON.stringify(body)
+    });
+
+  test('should replay the original result for a repeated key', async () => {
+    executeSkill.mockResolvedValue({ success: true, message: 'done', data: { count: 1 } });
+
+    const first = await execute({ skill: 'device-search', parameters: { query: 'mac' } }, 'key-replay');
+    const second = await execute({ skill: 'device-search', parameters: { query: 'mac' } }, 'key-replay');
+
+    expect(executeSkill).toHaveBeenCalledTimes(1);
+    expect(first.headers.get('idempotent-replayed')).toBeNull();
+    expect(second.headers.get('idempotent-replayed')).toBe('true');
+    expect(await second.json()).toEqual(await first.json());
+  });
+
+  test('should share one run between concurrent requests with the same key', async () => {
+    let finish: (value: any) => void = () => {};
+    executeSkill.mockReturnValue(new Promise(resolve => { finish = resolve; }));
+
+    const requests = Promise.all([
+      execute({ skill: 'device-search', parameters: {} }, 'key-inflight'),
+      execute({ skill: 'device-search', parameters: {} }, 'key-inflight')
+    ]);
+    // Let both requests reach the handler before the skill completes
+    await new Promise(resolve => setTimeout(resolve, 50));
+    finish({ success: true, message: 'done' });
+    const responses = await requests;
+
+    expect(executeSkill).toHaveBeenCalledTimes(1);
+    expect(responses.map(r => r.status)).toEqual([200, 200]);
+  });
+
+  test('should run the skill again after a failed result', async () => {
+    executeSkill
+      .mockResolvedValueOnce({ success: false, message: 'Jamf unavailable' })
+      .mockResolvedValueOnce({ success: true, message: 'done' });
+
+    await execute({ skill: 'device-search', parameters: {} }, 'key-failed');
+    const retry = await execute({ skill: 'device-search', parameters: {} }, 'key-failed');
+
+    expect(executeSkill).toHaveBeenCalledTimes(2);
+    expect(retry.headers.get('idempotent-replayed')).toBeNull();
+    expect((await retry.json()).success).toBe(true);
+  });
+
+  test('should reject a repeated key with different parameters', async () => {
+    executeSkill.mockResolvedValue({ success: true, message: 'done' });
+
+    await execute({ skill: 'device-search', parameters: { query: 'mac' } }, 'key-mismatch');
+    const mismatch = await execute({ skill: 'device-search', parameters: { query: 'ipad' } }, 'key-mismatch');
+
+    expect(mismatch.status).toBe(422);
+    expect(executeSkill).toHaveBeenCalledTimes(1);
+  });
+
+  test('should not replay another caller\'s result', async () => {
+    executeSkill.mockResolvedValue({ success: true, message: 'done' });
+
+    await execute({ skill: 'device-search', parameters: {} }, 'key-caller');
+    currentUser = 'bob';
+    const other = await execute({ skill: 'device-search', parameters: {} }, 'key-caller');
+
+    expect(executeSkill).toHaveBeenCalledTimes(2);
+    expect(other.headers.get('idempotent-replayed')).toBeNull();
+  });
+
+  test('should treat parameters with reordered keys as the same request', async () => {
+    executeSkill.mockResolvedValue({ success: true, message: 'done' });
+
+    await execute({ skill: 'device-search', parameters: { query: 'mac', limit: 5 } }, 'key-order');
+    const second = await execute({ skill: 'device-search', parameters: { limit: 5, query: 'mac' } }, 'key-order');
+
+    expect(second.status).toBe(200);
+    expect(second.headers.get('idempotent-replayed')).toBe('true');
+    expect(executeSkill).toHaveBeenCalledTimes(1);
+  });
+
+  test('should reject an idempotency key from an unauthenticated caller', async () => {
+    executeSkill.mockResolvedValue({ success: true, message: 'done' });
+    currentUser = undefined;
+
+    const response = await execute({ skill: 'device-search', parameters: {} }, 'key-anonymous');
+
+    expect(response.status).toBe(400);
+    expect(executeSkill).not.toHaveBeenCalled();
+  });
+
+  test('should run unauthenticated requests without an idempotency key', async () => {
+    executeSkill.mockResolvedValue({ success: true, message: 'done' });
+    currentUser = undefined;
+
+    const response = await execute({ skill: 'device-search', parameters: {} });
+
+    expect(response.status).toBe(200);
+    expect(executeSkill).toHaveBeenCalledTimes(1);
+  });
+});
+
+describe('Skills endpoints - deferred execution', () => {
+  const executeSkill = jest.fn<(skill: string, params: any) => Promise<any>>();
+  let server: http.Server;
+  let origin: string;
+  let currentUser: string | undefined;
+
+  beforeAll(async () => {
+    const app = express();
+    app.use(express.json());
+    app.use((req, _res, next) => {
+      if (currentUser) {
+        (req as any).user = { sub: currentUser };
+      }
+      next();
+    });
+    app.use('/api/v1/skills', createSkillsRouter({ executeSkill } as unknown as SkillsManager));
+
+    server = http.createServer(app);
+    await new Promise<void>((resolve) => server.listen(0, '127.0.0.1', resolve));
+    origin = `http://127.0.0.1:${(server.address() as AddressInfo).port}`;
+  });
+
+  afterAll(async () => {
+    await new Promise<void>((resolve) => server.close(() => resolve()));
+  });
+
+  beforeEach(() => {
+    executeSkill.mockReset();
+    currentUser = 'alice';
+  });
+
+  const executeAsync = (body: Record<string, any>) =>
+    fetch(`${origin}/api/v1/skills/execute`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json', 'Prefer': 'respond-async' },
+      body: JSON.stringify(body)
+    });
+
+  test('should answer 202 with a Location to poll', async () => {
+    executeSkill.mockReturnValue(new Promise(() => {}));
+
+    const response = await executeAsync({ skill: 'device-search', parameters: {} });
+    const body = await response.json();
+
+    expect(response.status).toBe(202);
+    expect(body.status).toBe('running');
+    expect(body.statusUrl).toBe(`/api/v1/skills/executions/${body.executionId}`);
+    expect(response.headers.get('location')).toBe(body.statusUrl);
+  });
+
+  test('should report the result once the execution completes', async () => {
+    let finish: (value: any) => void = () => {};
+    executeSkill.mockReturnValue(new Promise(resolve => { finish = resolve; }));
+
+    const { statusUrl } = await (await executeAsync({ skill: 'device-search', parameters: {} })).json();
+    const running = await (await fetch(`${origin}${statusUrl}`)).json();
+    finish({ success: true, message: 'done', data: { count: 2 } });
+    await new Promise(resolve => setImmediate(resolve));
+    const completed = await (await fetch(`${origin}${statusUrl}`)).json();
+
+    expect(running.status).toBe('running');
+    expect(completed).toMatchObject({
+      skill: 'device-search',
+      status: 'completed',
+      result: { success: true, message: 'done', data: { count: 2 } }
+    });
+    expect(completed.caller).toBeUndefined();
+  });
+
+  test('should report a failed execution', async () => {
+    executeSkill.mockRejectedValue(new Error('Jamf unavailable'));
+
+    const { statusUrl } = await (await executeAsync({ skill: 'device-search', parameters: {} })).json();
+    await new Promise(resolve => setImmediate(resolve));
+    const failed = await (await fetch(`${origin}${statusUrl}`)).json();
+
+    expect(failed).toMatchObject({ status: 'failed', error: 'Jamf unavailable' });
+  });
+
+  test('should return 404 for an unknown execution id', async () => {
+    const response = await fetch(`${origin}/api/v1/skills/executions/does-not-exist`);
+
+    expect(response.status).toBe(404);
+  });
+
+  test('should not let another caller poll an execution', async () => {
+    executeSkill.mockReturnValue(new Promise(() => {}));
+
+    const { statusUrl } = await (await executeAsync({ skill: 'device-search', parameters: {} })).json();
+    currentUser = 'bob';
+    const response = await fetch(`${origin}${statusUrl}`);
+
+    expect(response.status).toBe(404);
+  });
+});
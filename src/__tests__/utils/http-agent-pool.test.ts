@@ -0,0 +1,73 @@
+import http from 'http';
+import { AddressInfo } from 'net';
+import { AgentPool } from '../../utils/http-agent-pool.js';
+
+describe('AgentPool keep-alive timeout', () => {
+  let server: http.Server;
+  let port: number;
+  let keepAliveHeader: string | null;
+
+  beforeAll(async () => {
+    server = http.createServer((_req, res) => {
+      if (keepAliveHeader) {
+        res.setHeader('Keep-Alive', keepAliveHeader);
+      }
+      res.end('ok');
+    });
+    // Don't let Node's server advertise its own default Keep-Alive hint
+    server.keepAliveTimeout = 0;
+    await new Promise<void>((resolve) => server.listen(0, '127.0.0.1', resolve));
+    port = (server.address() as AddressInfo).port;
+  });
+
+  afterAll(async () => {
+    AgentPool.getInstance().destroy();
+    await new Promise<void>((resolve) => server.close(() => resolve()));
+  });
+
+  // Make one request and return the pooled socket left behind, if any
+  const requestAndGetFreeSocket = async (agent: http.Agent): Promise<any> => {
+    await new Promise<void>((resolve, reject) => {
+      http.get({ host: '127.0.0.1', port, agent }, (res) => {
+        res.resume();
+        res.on('end', resolve);
+      }).on('error', reject);
+    });
+    // The socket is returned to the pool after the response ends
+    await new Promise((resolve) => setImmediate(resolve));
+    const free = Object.values(agent.freeSockets).flat();
+    return free[0];
+  };
+
+  it('applies the pool idle timeout when the server sends no hint', async () => {
+    keepAliveHeader = null;
+    const agent = AgentPool.getInstance({ timeout: 60000, keepAliveTimeout: 30000 }).getHttpAgent();
+
+    const socket = await requestAndGetFreeSocket(agent);
+
+    expect(socket).toBeDefined();
+    expect(socket.timeout).toBe(30000);
+    agent.destroy();
+  });
+
+  it('keeps a shorter server Keep-Alive hint instead of raising it', async () => {
+    keepAliveHeader = 'timeout=5';
+    const agent = AgentPool.getInstance().getHttpAgent();
+
+    const socket = await requestAndGetFreeSocket(agent);
+
+    expect(socket).toBeDefined();
+    expect(socket.timeout).toBe(4000);
+    agent.destroy();
+  });
+
+  it('does not pool a socket the server will close within a second', async () => {
+    keepAliveHeader = 'timeout=1';
+    const agent = AgentPool.getInstance().getHttpAgent();
+
+    const socket = await requestAndGetFreeSocket(agent);
+
+    expect(socket).toBeUndefined();
+    agent.destroy();
+  });
+});
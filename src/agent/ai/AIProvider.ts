@@ -34,12 +34,23 @@ export type AIMessage = AIRequest['messages'][0];
 export type AITool = NonNullable<AIRequest['tools']>[0];
 export type AIToolCall = NonNullable<AIResponse['toolCalls']>[0];
 
+export interface AIStreamHandlers {
+  onText?: (delta: string) => void;
+  onToolCall?: (toolCall: AIToolCall) => void;
+  /** A streamed tool call that could not be used (e.g. truncated arguments) */
+  onToolCallError?: (name: string, error: Error) => void;
+}
+
 export interface AIProviderConfig {
   apiKey?: string;
   model?: string;
   baseUrl?: string;
   temperature?: number;
   maxTokens?: number;
+  latency?: 'standard' | 'optimized';
+  promptCaching?: boolean;
+  requestTimeout?: number; // ms per model request
+  maxAttempts?: number; // Bedrock only: total attempts including retries
   awsRegion?: string;
   awsAccessKeyId?: string;
   awsSecretAccessKey?: string;
@@ -54,7 +65,29 @@ export abstract class AIProvider {
   }
 
   abstract complete(request: AIRequest): Promise<AIResponse>;
+
+  /**
+   * Stream a completion, surfacing text deltas and each tool call as soon as
+   * its block is complete. Providers without native streaming fall back to
+   * complete() and replay the final response through the handlers.
+   */
+  async completeStream(request: AIRequest, handlers: AIStreamHandlers): Promise<AIResponse> {
+    const response = await this.complete(request);
+    if (response.content) {
+      handlers.onText?.(response.content);
+    }
+    response.toolCalls?.forEach(toolCall => handlers.onToolCall?.(toolCall));
+    return response;
+  }
   
+  /**
+   * Whether requests carry prompt-cache breakpoints. Callers should then keep
+   * the cached prefix (tool list, static system prompt) identical across turns.
+   */
+  usesPromptCaching(): boolean {
+    return false;
+  }
+
   abstract validateConfig(): Promise<boolean>;
   
   abstract getModelName(): string;
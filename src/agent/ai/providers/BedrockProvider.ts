@@ -1,9 +1,14 @@
-import { AIProvider, AIRequest, AIResponse, AIToolCall, AIProviderConfig } from '../AIProvider.js';
+import { AIProvider, AIRequest, AIResponse, AITool, AIToolCall, AIProviderConfig, AIStreamHandlers } from '../AIProvider.js';
 import { 
   BedrockRuntimeClient, 
   InvokeModelCommand,
-  InvokeModelCommandInput 
+  InvokeModelCommandInput,
+  InvokeModelWithResponseStreamCommand,
+  InvokeModelWithResponseStreamCommandInput
 } from '@aws-sdk/client-bedrock-runtime';
+import { NodeHttpHandler } from '@smithy/node-http-handler';
+import { createHash } from 'crypto';
+import https from 'https';
 
 interface BedrockConfig extends AIProviderConfig {
   awsRegion?: string;
@@ -12,6 +17,12 @@ interface BedrockConfig extends AIProviderConfig {
   awsSessionToken?: string;
 }
 
+interface BedrockClientCredentials {
+  accessKeyId: string;
+  secretAccessKey: string;
+  sessionToken?: string;
+}
+
 interface ClaudeMessage {
   role: 'user' | 'assistant';
   content: string;
@@ -39,40 +50,114 @@ interface ClaudeResponse {
   };
 }
 
+// Keep-alive pool shared by every Bedrock client so each turn reuses a warm TLS connection
+const bedrockHttpsAgent = new https.Agent({
+  keepAlive: true,
+  maxSockets: 50,
+});
+
+const responseDecoder = new TextDecoder();
+
+const DEFAULT_REQUEST_TIMEOUT = 120000;
+const DEFAULT_MAX_ATTEMPTS = 3;
+
+// One client per region/credential set (and timeout/retry settings), shared
+// across provider instances
+const sharedClients = new Map<string, BedrockRuntimeClient>();
+
+function getSharedClient(
+  region: string,
+  credentials: BedrockClientCredentials | undefined,
+  requestTimeout: number,
+  maxAttempts: number
+): BedrockRuntimeClient {
+  // The secret is part of the key (hashed, never stored) so a corrected or
+  // rotated secret for the same key id gets its own client
+  const secretHash = credentials
+    ? createHash('sha256').update(credentials.secretAccessKey).digest('hex')
+    : undefined;
+  const key = [region, credentials?.accessKeyId, secretHash, credentials?.sessionToken, requestTimeout, maxAttempts].join('|');
+  let client = sharedClients.get(key);
+  if (!client) {
+    client = new BedrockRuntimeClient({
+      region,
+      credentials,
+      maxAttempts,
+      retryMode: 'adaptive',
+      // An explicit HTTP/1.1 handler: the client's default may be the HTTP/2
+      // handler (used for bidirectional streams), which ignores httpsAgent.
+      // InvokeModel and InvokeModelWithResponseStream are plain HTTP/1.1
+      // requests, so both go through the keep-alive pool.
+      requestHandler: new NodeHttpHandler({
+        httpsAgent: bedrockHttpsAgent,
+        connectionTimeout: 3000,
+        requestTimeout,
+      }),
+    });
+    sharedClients.set(key, client);
+  }
+  return client;
+}
+
+// Tool definitions are long-lived (static planner tools, per-session MCP tools),
+// so each one is converted to the Claude format only once
+const claudeToolCache = new WeakMap<AITool, object>();
+
+function toClaudeTool(tool: AITool): object {
+  let claudeTool = claudeToolCache.get(tool);
+  if (!claudeTool) {
+    claudeTool = {
+      name: tool.name,
+      description: tool.description,
+      input_schema: {
+        type: 'object',
+        properties: tool.parameters.properties || tool.parameters || {},
+        required: tool.parameters.required || [],
+      },
+    };
+    claudeToolCache.set(tool, claudeTool);
+  }
+  return claudeTool;
+}
+
 export class BedrockProvider extends AIProvider {
   private client: BedrockRuntimeClient;
   private model: string;
   private region: string;
+  private latency: 'standard' | 'optimized';
+  private promptCaching: boolean;
 
   constructor(config: BedrockConfig) {
     super(config);
     
     this.region = config.awsRegion || process.env.AWS_REGION || 'us-east-1';
     this.model = config.model || 'anthropic.claude-3-sonnet-20240229-v1:0';
+    // Latency-optimized inference is only offered for some models/regions, so it is opt-in
+    this.latency = config.latency || (process.env.AGENT_AI_LATENCY === 'optimized' ? 'optimized' : 'standard');
+    // Prompt caching is likewise model-dependent
+    this.promptCaching = config.promptCaching ?? process.env.AGENT_AI_PROMPT_CACHE === 'true';
+    // Interactive use wants a shorter timeout and fewer retries than batch planning
+    const requestTimeout = config.requestTimeout ??
+      (Number(process.env.AGENT_AI_REQUEST_TIMEOUT_MS) || DEFAULT_REQUEST_TIMEOUT);
+    const maxAttempts = config.maxAttempts ??
+      (Number(process.env.AGENT_AI_MAX_ATTEMPTS) || DEFAULT_MAX_ATTEMPTS);
     
-    // Configure AWS client
-    const clientConfig: any = {
-      region: this.region,
-    };
-
     // Use explicit credentials if provided
-    if (config.awsAccessKeyId && config.awsSecretAccessKey) {
-      clientConfig.credentials = {
-        accessKeyId: config.awsAccessKeyId,
-        secretAccessKey: config.awsSecretAccessKey,
-        sessionToken: config.awsSessionToken,
-      };
-    }
+    const credentials = config.awsAccessKeyId && config.awsSecretAccessKey
+      ? {
+          accessKeyId: config.awsAccessKeyId,
+          secretAccessKey: config.awsSecretAccessKey,
+          sessionToken: config.awsSessionToken,
+        }
+      : undefined;
     // Otherwise, SDK will use default credential chain (env vars, IAM role, etc.)
 
-    this.client = new BedrockRuntimeClient(clientConfig);
+    this.client = getSharedClient(this.region, credentials, requestTimeout, maxAttempts);
   }
 
   async complete(request: AIRequest): Promise<AIResponse> {
-    const messages = this.convertMessages(request.messages);
-    
     // Build the request based on the model type
-    const modelRequest = this.buildModelRequest(messages, request);
+    const modelRequest = this.buildModelRequest(request);
     
     const input: InvokeModelCommandInput = {
       modelId: this.model,
@@ -81,21 +166,135 @@ export class BedrockProvider extends AIProvider {
       body: JSON.stringify(modelRequest),
     };
 
+    if (this.latency === 'optimized') {
+      input.performanceConfigLatency = 'optimized';
+    }
+
     try {
       const command = new InvokeModelCommand(input);
       const response = await this.client.send(command);
       
-      const responseBody = JSON.parse(new TextDecoder().decode(response.body));
+      const responseBody = JSON.parse(responseDecoder.decode(response.body));
       return this.parseModelResponse(responseBody);
     } catch (error: any) {
-      if (error.name === 'ResourceNotFoundException') {
-        throw new Error(`Model ${this.model} not found in region ${this.region}. Check model availability.`);
-      }
-      if (error.name === 'AccessDeniedException') {
-        throw new Error('Access denied to Bedrock. Check IAM permissions for bedrock:InvokeModel.');
+      throw this.toProviderError(error);
+    }
+  }
+
+  async completeStream(request: AIRequest, handlers: AIStreamHandlers): Promise<AIResponse> {
+    // Only the Claude 3 messages API has a structured event stream we can demultiplex
+    if (!this.model.includes('claude-3')) {
+      return super.completeStream(request, handlers);
+    }
+
+    const modelRequest = this.buildModelRequest(request);
+
+    const input: InvokeModelWithResponseStreamCommandInput = {
+      modelId: this.model,
+      contentType: 'application/json',
+      accept: 'application/json',
+      body: JSON.stringify(modelRequest),
+    };
+
+    if (this.latency === 'optimized') {
+      input.performanceConfigLatency = 'optimized';
+    }
+
+    try {
+      const command = new InvokeModelWithResponseStreamCommand(input);
+      const response = await this.client.send(command);
+
+      let textContent = '';
+      const toolCalls: AIToolCall[] = [];
+      const pendingToolUses = new Map<number, { id: string; name: string; json: string }>();
+      let promptTokens = 0;
+      let completionTokens = 0;
+
+      for await (const event of response.body ?? []) {
+        if (!event.chunk?.bytes) continue;
+        const chunk = JSON.parse(responseDecoder.decode(event.chunk.bytes));
+
+        switch (chunk.type) {
+          case 'message_start':
+            promptTokens = chunk.message?.usage?.input_tokens ?? 0;
+            break;
+          case 'content_block_start':
+            if (chunk.content_block?.type === 'tool_use') {
+              pendingToolUses.set(chunk.index, {
+                id: chunk.content_block.id,
+                name: chunk.content_block.name,
+                json: '',
+              });
+            }
+            break;
+          case 'content_block_delta':
+            if (chunk.delta?.type === 'text_delta') {
+              textContent += chunk.delta.text;
+              handlers.onText?.(chunk.delta.text);
+            } else if (chunk.delta?.type === 'input_json_delta') {
+              const toolUse = pendingToolUses.get(chunk.index);
+              if (toolUse) toolUse.json += chunk.delta.partial_json;
+            }
+            break;
+          case 'content_block_stop': {
+            // A tool call is usable as soon as its own block closes
+            const toolUse = pendingToolUses.get(chunk.index);
+            if (toolUse) {
+              pendingToolUses.delete(chunk.index);
+              let args: Record<string, any>;
+              try {
+                args = toolUse.json ? JSON.parse(toolUse.json) : {};
+              } catch {
+                // Fail only this call; others from the same reply may already be running
+                const error = new Error(`Malformed arguments streamed for tool ${toolUse.name}`);
+                if (!handlers.onToolCallError) {
+                  throw error;
+                }
+                handlers.onToolCallError(toolUse.name, error);
+                break;
+              }
+              const toolCall: AIToolCall = {
+                id: toolUse.id,
+                name: toolUse.name,
+                arguments: args,
+              };
+              toolCalls.push(toolCall);
+              handlers.onToolCall?.(toolCall);
+            }
+            break;
+          }
+          case 'message_delta':
+            completionTokens = chunk.usage?.output_tokens ?? completionTokens;
+            break;
+        }
       }
-      throw new Error(`Bedrock API error: ${error.message}`);
+
+      return {
+        content: textContent,
+        toolCalls: toolCalls.length > 0 ? toolCalls : undefined,
+        usage: {
+          promptTokens,
+          completionTokens,
+          totalTokens: promptTokens + completionTokens,
+        },
+      };
+    } catch (error: any) {
+      throw this.toProviderError(error);
+    }
+  }
+
+  usesPromptCaching(): boolean {
+    return this.promptCaching && this.model.includes('claude-3');
+  }
+
+  private toProviderError(error: any): Error {
+    if (error.name === 'ResourceNotFoundException') {
+      return new Error(`Model ${this.model} not found in region ${this.region}. Check model availability.`);
+    }
+    if (error.name === 'AccessDeniedException') {
+      return new Error('Access denied to Bedrock. Check IAM permissions for bedrock:InvokeModel.');
     }
+    return new Error(`Bedrock API error: ${error.message}`);
   }
 
   private convertMessages(messages: AIRequest['messages']): ClaudeMessage[] {
@@ -152,32 +351,53 @@ export class BedrockProvider extends AIProvider {
     return claudeMessages;
   }
 
-  private buildModelRequest(messages: ClaudeMessage[], request: AIRequest): any {
+  private buildModelRequest(request: AIRequest): any {
     // Claude 3 format
     if (this.model.includes('claude-3')) {
+      // The messages API takes system prompts as a separate field instead of
+      // folding them into the first user turn
+      const systemPrompts = request.messages
+        .filter(m => m.role === 'system')
+        .map(m => m.content);
+
       const modelRequest: any = {
         anthropic_version: 'bedrock-2023-05-31',
-        messages: messages,
+        messages: this.convertMessages(request.messages.filter(m => m.role !== 'system')),
         max_tokens: request.maxTokens || this.config.maxTokens || 4000,
         temperature: request.temperature ?? this.config.temperature ?? 0.7,
       };
 
+      // Bedrock caches the prompt prefix in the order tools -> system ->
+      // messages, so a hit needs the same tool list in the same order on every
+      // turn. The breakpoint on the last tool caches the tool definitions (the
+      // bulk of the prefix); the one on the first system message, where callers
+      // put their static instructions, extends it over those. Prefixes shorter
+      // than the model's minimum (1024 tokens for most Claude 3 models) are
+      // simply not cached.
+      if (systemPrompts.length > 0) {
+        modelRequest.system = this.promptCaching
+          ? systemPrompts.map((text, i) => (i === 0
+            ? { type: 'text', text, cache_control: { type: 'ephemeral' } }
+            : { type: 'text', text }))
+          : systemPrompts.join('\n\n');
+      }
+
       // Add tools if provided
       if (request.tools && request.tools.length > 0) {
-        modelRequest.tools = request.tools.map(tool => ({
-          name: tool.name,
-          description: tool.description,
-          input_schema: {
-            type: 'object',
-            properties: tool.parameters.properties || tool.parameters || {},
-            required: tool.parameters.required || [],
-          },
-        }));
+        modelRequest.tools = request.tools.map(toClaudeTool);
+        if (this.promptCaching) {
+          const last = modelRequest.tools.length - 1;
+          // Copy: the converted definitions are shared across requests
+          modelRequest.tools[last] = { ...modelRequest.tools[last], cache_control: { type: 'ephemeral' } };
+        }
       }
 
       return modelRequest;
     }
     
+    // Legacy prompt formats fold system messages into the first user turn
+    const messages = this.convertMessages(request.messages);
+
     // Claude 2 format (legacy)
     if (this.model.includes('claude-v2')) {
       let prompt = '';
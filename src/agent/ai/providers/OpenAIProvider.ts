@@ -1,5 +1,12 @@
 import { AIProvider, AIRequest, AIResponse, AIToolCall, AIProviderConfig } from '../AIProvider.js';
 import axios, { AxiosInstance } from 'axios';
+import https from 'https';
+
+// Shared keep-alive pool so consecutive completions skip the TCP/TLS handshake
+const openAIHttpsAgent = new https.Agent({
+  keepAlive: true,
+  maxSockets: 50,
+});
 
 interface OpenAIMessage {
   role: 'system' | 'user' | 'assistant';
@@ -64,6 +71,8 @@ export class OpenAIProvider extends AIProvider {
         'Authorization': `Bearer ${config.apiKey}`,
         'Content-Type': 'application/json',
       },
+      httpsAgent: openAIHttpsAgent,
+      timeout: config.requestTimeout ?? (Number(process.env.AGENT_AI_REQUEST_TIMEOUT_MS) || 0),
     });
   }
 
@@ -4,7 +4,8 @@ export const AgentConfigSchema = z.object({
   mcpServer: z.object({
     host: z.string().default('localhost'),
     port: z.number().default(3000),
-    transport: z.enum(['stdio', 'http', 'websocket']).default('stdio'),
+    transport: z.enum(['stdio', 'http', 'websocket', 'uds', 'inproc']).default('stdio'),
+    socketPath: z.string().default('/tmp/jamf-mcp.sock'),
   }),
   aiProvider: z.object({
     type: z.enum(['openai', 'anthropic', 'local', 'mock', 'bedrock']).default('openai'),
@@ -12,6 +13,10 @@ export const AgentConfigSchema = z.object({
     model: z.string().optional(),
     temperature: z.number().min(0).max(2).default(0.7),
     maxTokens: z.number().default(4000),
+    latency: z.enum(['standard', 'optimized']).optional(),
+    promptCaching: z.boolean().optional(),
+    requestTimeout: z.number().int().positive().optional(),
+    maxAttempts: z.number().int().min(1).optional(),
     awsRegion: z.string().optional(),
     awsAccessKeyId: z.string().optional(),
     awsSecretAccessKey: z.string().optional(),
@@ -49,20 +54,30 @@ export class AgentConfigManager {
   private loadFromEnvironment(): any {
     const config: any = {};
     
-    if (process.env.AGENT_MCP_HOST || process.env.AGENT_MCP_PORT || process.env.AGENT_MCP_TRANSPORT) {
+    if (process.env.AGENT_MCP_HOST || process.env.AGENT_MCP_PORT || process.env.AGENT_MCP_TRANSPORT || process.env.AGENT_MCP_SOCKET_PATH) {
       config.mcpServer = {};
       if (process.env.AGENT_MCP_HOST) config.mcpServer.host = process.env.AGENT_MCP_HOST;
       if (process.env.AGENT_MCP_PORT) config.mcpServer.port = parseInt(process.env.AGENT_MCP_PORT);
       if (process.env.AGENT_MCP_TRANSPORT) config.mcpServer.transport = process.env.AGENT_MCP_TRANSPORT;
+      if (process.env.AGENT_MCP_SOCKET_PATH) config.mcpServer.socketPath = process.env.AGENT_MCP_SOCKET_PATH;
+    }
+
+    if (process.env.JAMF_MCP_INPROC === '1') {
+      config.mcpServer = { ...config.mcpServer, transport: 'inproc' };
     }
     
     if (process.env.AGENT_AI_PROVIDER || process.env.AGENT_AI_API_KEY || process.env.AGENT_AI_MODEL || process.env.AGENT_AI_TEMPERATURE ||
-        process.env.AWS_ACCESS_KEY_ID || process.env.AWS_SECRET_ACCESS_KEY || process.env.AWS_REGION) {
+        process.env.AGENT_AI_LATENCY || process.env.AGENT_AI_PROMPT_CACHE !== undefined ||
+        process.env.AGENT_AI_REQUEST_TIMEOUT_MS || process.env.AGENT_AI_MAX_ATTEMPTS || process.env.AWS_ACCESS_KEY_ID || process.env.AWS_SECRET_ACCESS_KEY || process.env.AWS_REGION) {
       config.aiProvider = {};
       if (process.env.AGENT_AI_PROVIDER) config.aiProvider.type = process.env.AGENT_AI_PROVIDER;
       if (process.env.AGENT_AI_API_KEY) config.aiProvider.apiKey = process.env.AGENT_AI_API_KEY;
       if (process.env.AGENT_AI_MODEL) config.aiProvider.model = process.env.AGENT_AI_MODEL;
       if (process.env.AGENT_AI_TEMPERATURE) config.aiProvider.temperature = parseFloat(process.env.AGENT_AI_TEMPERATURE);
+      if (process.env.AGENT_AI_LATENCY) config.aiProvider.latency = process.env.AGENT_AI_LATENCY;
+      if (process.env.AGENT_AI_PROMPT_CACHE !== undefined) config.aiProvider.promptCaching = process.env.AGENT_AI_PROMPT_CACHE === 'true';
+      if (process.env.AGENT_AI_REQUEST_TIMEOUT_MS) config.aiProvider.requestTimeout = parseInt(process.env.AGENT_AI_REQUEST_TIMEOUT_MS);
+      if (process.env.AGENT_AI_MAX_ATTEMPTS) config.aiProvider.maxAttempts = parseInt(process.env.AGENT_AI_MAX_ATTEMPTS);
       if (process.env.AWS_REGION) config.aiProvider.awsRegion = process.env.AWS_REGION;
       if (process.env.AWS_ACCESS_KEY_ID) config.aiProvider.awsAccessKeyId = process.env.AWS_ACCESS_KEY_ID;
       if (process.env.AWS_SECRET_ACCESS_KEY) config.aiProvider.awsSecretAccessKey = process.env.AWS_SECRET_ACCESS_KEY;
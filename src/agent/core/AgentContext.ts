@@ -100,8 +100,11 @@ export class AgentContext {
       throw new Error(`Task ${taskId} not found`);
     }
 
-    const endTime = new Date().toISOString();
-    const duration = new Date(endTime).getTime() - new Date(task.startTime).getTime();
+    // Read the clock once and derive both fields from it instead of parsing the
+    // ISO string just produced back into a Date
+    const now = Date.now();
+    const endTime = new Date(now).toISOString();
+    const duration = now - Date.parse(task.startTime);
 
     this.taskHistory.set(taskId, {
       ...task,
@@ -1,14 +1,32 @@
 import { EventEmitter } from 'events';
 import { AgentConfig, AgentConfigManager } from './AgentConfig.js';
 import { AgentContext } from './AgentContext.js';
-import { TaskExecutor } from './TaskExecutor.js';
-import { MCPClient, MCPConnectionOptions } from '../mcp/MCPClient.js';
+import { TaskExecutor, PlanExecutionResult } from './TaskExecutor.js';
+import { MCPClient, MCPConnectionOptions, toolCallKey } from '../mcp/MCPClient.js';
 import { AIProvider } from '../ai/AIProvider.js';
 import { OpenAIProvider } from '../ai/providers/OpenAIProvider.js';
 import { TaskPlanner, TaskPlan } from '../tasks/TaskPlanner.js';
 import { SafetyChecker } from '../safety/SafetyRules.js';
 import { AuditLogger } from '../safety/AuditLogger.js';
 
+// A failed read-only plan is re-planned at most this many times
+const MAX_REPLAN_ATTEMPTS = 2;
+const MAX_FAILURE_SUMMARY_LENGTH = 200;
+
+// Process-local counter: cheaper than clock-based ids and unique even when two
+// agents start in the same millisecond
+let sessionCounter = 0;
+
+/**
+ * Thrown when a re-plan repeats a tool call that already failed with the same arguments.
+ */
+export class AgentLoopDetectedError extends Error {
+  constructor(public readonly toolName: string) {
+    super(`Agent loop detected: plan repeats failed call to ${toolName}`);
+    this.name = 'AgentLoopDetectedError';
+  }
+}
+
 export interface AgentOptions {
   config?: Partial<AgentConfig>;
   mcpConnection?: MCPConnectionOptions;
@@ -31,6 +49,14 @@ export class JamfAgent extends EventEmitter {
   private safetyChecker: SafetyChecker;
   private auditLogger: AuditLogger;
   private initialized: boolean = false;
+  private initializing: Promise<void> | null = null;
+  private taskCounter = 0;
+
+  /**
+   * Stable for the agent's lifetime. Reuse one JamfAgent across turns so every
+   * task of a conversation shares this session (and its provider-side caches).
+   */
+  readonly sessionId = `s-${process.pid}-${++sessionCounter}`;
 
   constructor(options: AgentOptions = {}) {
     super();
@@ -54,6 +80,8 @@ export class JamfAgent extends EventEmitter {
     return {
       command: 'node',
       args: ['./dist/index.js'],
+      socketPath: config.transport === 'uds' ? config.socketPath : undefined,
+      inProcess: config.transport === 'inproc',
       env: {
         JAMF_URL: process.env.JAMF_URL || '',
         JAMF_CLIENT_ID: process.env.JAMF_CLIENT_ID || '',
@@ -120,9 +148,22 @@ export class JamfAgent extends EventEmitter {
     });
   }
 
+  /**
+   * Build the provider and planner and connect once; concurrent callers share
+   * the same in-flight initialization.
+   */
   async initialize(): Promise<void> {
     if (this.initialized) return;
 
+    if (!this.initializing) {
+      this.initializing = this.doInitialize().finally(() => {
+        this.initializing = null;
+      });
+    }
+    return this.initializing;
+  }
+
+  private async doInitialize(): Promise<void> {
     console.log('Initializing Jamf Agent...');
     
     // Create AI provider
@@ -148,7 +189,7 @@ export class JamfAgent extends EventEmitter {
       await this.initialize();
     }
 
-    const taskId = `task-${Date.now()}`;
+    const taskId = `${this.sessionId}-task-${++this.taskCounter}`;
     this.auditLogger.logUserRequest(taskId, userRequest);
     
     try {
@@ -158,27 +199,50 @@ export class JamfAgent extends EventEmitter {
         throw new Error('Task planner not initialized');
       }
       
-      const plan = await this.taskPlanner.planTask(userRequest);
-      this.emit('task:planCreated', { taskId, plan });
-      
-      const validationErrors = this.taskPlanner.validatePlan(plan);
-      if (validationErrors.length > 0) {
-        throw new Error(`Plan validation failed: ${validationErrors.join(', ')}`);
-      }
+      // Tool calls that already failed, so a re-plan cannot loop on them
+      const failedCalls = new Set<string>();
+      let plan = await this.taskPlanner.planTask(userRequest);
+      let executionResult: PlanExecutionResult;
 
-      if (plan.requiresConfirmation && this.configManager.requiresConfirmation()) {
-        this.emit('task:confirmationRequired', { taskId, plan });
+      for (let attempt = 0; ; attempt++) {
+        this.emit('task:planCreated', { taskId, plan });
         
-        const confirmed = await this.waitForConfirmation(30000);
-        if (!confirmed) {
-          throw new Error('Task execution cancelled by user');
+        const validationErrors = this.taskPlanner.validatePlan(plan);
+        if (validationErrors.length > 0) {
+          throw new Error(`Plan validation failed: ${validationErrors.join(', ')}`);
         }
-      }
 
-      const executionResult = await this.taskExecutor.executePlan(plan, {
-        continueOnError: false,
-        parallel: true,
-      });
+        const repeated = plan.steps.find(step =>
+          failedCalls.has(toolCallKey({ name: step.toolName, arguments: step.arguments }))
+        );
+        if (repeated) {
+          throw new AgentLoopDetectedError(repeated.toolName);
+        }
+
+        if (plan.requiresConfirmation && this.configManager.requiresConfirmation()) {
+          this.emit('task:confirmationRequired', { taskId, plan });
+          
+          const confirmed = await this.waitForConfirmation(30000);
+          if (!confirmed) {
+            throw new Error('Task execution cancelled by user');
+          }
+        }
+
+        executionResult = await this.taskExecutor.executePlan(plan, {
+          continueOnError: false,
+          parallel: true,
+        });
+
+        // Only re-plan read-only work; retrying a partially applied change is not safe
+        if (executionResult.success || attempt >= MAX_REPLAN_ATTEMPTS ||
+            !plan.steps.every(step => this.mcpClient.isReadOnlyTool(step.toolName))) {
+          break;
+        }
+
+        const failureSummary = this.summarizeFailures(plan, executionResult, failedCalls);
+        this.emit('task:replanning', { taskId, attempt: attempt + 1, failureSummary });
+        plan = await this.taskPlanner.planTask(userRequest, failureSummary);
+      }
 
       const result: TaskExecutionResult = {
         success: executionResult.success,
@@ -208,6 +272,27 @@ export class JamfAgent extends EventEmitter {
     }
   }
 
+  /**
+   * Record the failed calls of a plan and describe them in a few lines for re-planning.
+   */
+  private summarizeFailures(
+    plan: TaskPlan,
+    executionResult: PlanExecutionResult,
+    failedCalls: Set<string>
+  ): string {
+    const lines: string[] = [];
+    for (const stepId of executionResult.failedSteps) {
+      const step = plan.steps.find(s => s.id === stepId);
+      if (!step) continue;
+
+      failedCalls.add(toolCallKey({ name: step.toolName, arguments: step.arguments }));
+      const error = (executionResult.results.get(stepId)?.error || 'unknown error')
+        .slice(0, MAX_FAILURE_SUMMARY_LENGTH);
+      lines.push(`- ${step.toolName} ${JSON.stringify(step.arguments)}: ${error}`);
+    }
+    return lines.join('\n');
+  }
+
   async scheduleTask(schedule: {
     type: string;
     schedule: string;
@@ -253,8 +338,7 @@ export class JamfAgent extends EventEmitter {
   }
 
   async getAvailableTools(): Promise<string[]> {
-    const tools = await this.mcpClient.listTools();
-    return tools.map(t => t.name);
+    return this.mcpClient.getAllTools().map(t => t.name);
   }
 
   async getAvailableResources(): Promise<string[]> {
@@ -1,8 +1,121 @@
 import { EventEmitter } from 'events';
-import { MCPClient } from '../mcp/MCPClient.js';
-import { AIProvider } from '../ai/AIProvider.js';
+import { Tool } from '@modelcontextprotocol/sdk/types.js';
+import { MCPClient, MCPBatchResult } from '../mcp/MCPClient.js';
+import { AIProvider, AIResponse, AITool } from '../ai/AIProvider.js';
 import { AgentConfig } from './AgentConfig.js';
 
+// Static so the prompt is byte-identical across turns. It is too short to cache
+// on its own; with prompt caching it extends the cached tool-definition prefix.
+// Tool definitions are sent separately through the request's tools field.
+const SYSTEM_PROMPT = `You are a Jamf device management assistant. Convert natural language requests into MCP tool calls.
+
+Instructions:
+1. Understand what the user wants
+2. Pick the most appropriate tool
+3. Generate the correct arguments
+4. For searches, the searchDevices tool takes a "query" parameter
+5. Keep it simple - use the fewest tool calls that answer the request
+6. When the request needs several independent lookups (e.g. details for multiple device IDs),
+   return all of those tool calls at once - they are executed concurrently
+7. Before calling tools, say in one short sentence what you are about to look up
+
+Examples:
+- "show jane's computer" → searchDevices with query="jane"
+- "get details for device 759" → getDeviceDetails with deviceId="759"
+- "list all policies" → listPolicies
+`;
+
+const MAX_PROMPT_TOOLS = 40;
+
+// Streamed text arrives a few tokens at a time; buffer it and write at most this often
+const TEXT_FLUSH_INTERVAL_MS = 50;
+
+function tokenize(text: string): string[] {
+  return text
+    .replace(/([a-z])([A-Z])/g, '$1 $2')
+    .toLowerCase()
+    .split(/[^a-z0-9]+/)
+    .filter(word => word.length > 2)
+    .map(word => (word.length > 3 && word.endsWith('s') ? word.slice(0, -1) : word));
+}
+
+// Tool objects live for the whole MCP session, so their keywords are computed once
+const toolKeywords = new WeakMap<Tool, { name: Set<string>; description: Set<string> }>();
+
+function getToolKeywords(tool: Tool): { name: Set<string>; description: Set<string> } {
+  let keywords = toolKeywords.get(tool);
+  if (!keywords) {
+    keywords = {
+      name: new Set(tokenize(tool.name)),
+      description: new Set(tokenize(tool.description || '')),
+    };
+    toolKeywords.set(tool, keywords);
+  }
+  return keywords;
+}
+
+const toolDefinitions = new WeakMap<Tool, AITool>();
+
+/**
+ * Convert an MCP tool to the provider-neutral definition once per session, so
+ * every request reuses the same objects (and providers can cache their own
+ * conversions of them).
+ */
+function toAITool(tool: Tool): AITool {
+  let definition = toolDefinitions.get(tool);
+  if (!definition) {
+    definition = {
+      name: tool.name,
+      description: tool.description || '',
+      parameters: tool.inputSchema || {}
+    };
+    toolDefinitions.set(tool, definition);
+  }
+  return definition;
+}
+
+/**
+ * Pick the tools most relevant to a request by keyword overlap with the tool
+ * name and description, capped at MAX_PROMPT_TOOLS. The selection is returned
+ * in the server's order.
+ */
+function selectTools(userInput: string, tools: Tool[]): Tool[] {
+  if (tools.length <= MAX_PROMPT_TOOLS) {
+    return tools;
+  }
+
+  const words = new Set(tokenize(userInput));
+  return tools
+    .map((tool, index) => {
+      const keywords = getToolKeywords(tool);
+      let score = 0;
+      for (const word of words) {
+        if (keywords.name.has(word)) score += 3;
+        else if (keywords.description.has(word)) score += 1;
+      }
+      return { tool, index, score };
+    })
+    .sort((a, b) => b.score - a.score || a.index - b.index)
+    .slice(0, MAX_PROMPT_TOOLS)
+    .sort((a, b) => a.index - b.index)
+    .map(({ tool }) => tool);
+}
+
+/**
+ * Pretty-print a tool's text payload. Most tools already return indented JSON,
+ * so only compact single-line JSON is parsed and re-serialized.
+ */
+function formatToolText(text: string): string {
+  if (text.includes('\n')) {
+    return text;
+  }
+  try {
+    return JSON.stringify(JSON.parse(text), null, 2);
+  } catch {
+    return text;
+  }
+}
+
 export class SimpleAgent extends EventEmitter {
   private mcpClient: MCPClient;
   private aiProvider: AIProvider;
@@ -33,78 +146,109 @@ export class SimpleAgent extends EventEmitter {
       throw new Error('Agent not initialized');
     }
 
-    // Get available tools
-    const tools = await this.mcpClient.listTools();
-    
-    // Create a simple prompt for Claude
-    const systemPrompt = `You are a Jamf device management assistant. Convert natural language requests into MCP tool calls.
+    // Only offer the tools relevant to this request; every tool definition is
+    // sent as input tokens on each turn. With prompt caching the full list is
+    // sent instead: it is the cached prefix, so it must not vary per request.
+    const allTools = this.mcpClient.getAllTools();
+    const tools = this.aiProvider.usesPromptCaching() ? allTools : selectTools(userInput, allTools);
 
-Available tools:
-${tools.map(t => `- ${t.name}: ${t.description}`).join('\n')}
+    // Stream the response: print Claude's text as it arrives and start each tool
+    // call as soon as its block closes instead of waiting for the whole reply
+    const pendingCalls: Promise<MCPBatchResult>[] = [];
+    let streamingText = false;
+    let textBuffer = '';
+    let flushTimer: NodeJS.Timeout | null = null;
 
-Instructions:
-1. Understand what the user wants
-2. Pick the most appropriate tool
-3. Generate the correct arguments
-4. For searches, the searchDevices tool takes a "query" parameter
-5. Keep it simple - one tool call per request
-
-Examples:
-- "show jane's computer" → searchDevices with query="jane"
-- "get details for device 759" → getDeviceDetails with deviceId="759"
-- "list all policies" → listPolicies
-`;
+    const flushText = () => {
+      if (flushTimer) {
+        clearTimeout(flushTimer);
+        flushTimer = null;
+      }
+      if (textBuffer) {
+        process.stdout.write(textBuffer);
+        textBuffer = '';
+      }
+    };
 
-    // Ask Claude to generate the tool call
-    const response = await this.aiProvider.complete({
-      messages: [
-        { role: 'system', content: systemPrompt },
-        { role: 'user', content: userInput }
-      ],
-      tools: tools.map(t => ({
-        name: t.name,
-        description: t.description || '',
-        parameters: t.inputSchema || {}
-      }))
-    });
-
-    // Execute the tool call if Claude generated one
-    if (response.toolCalls && response.toolCalls.length > 0) {
-      const toolCall = response.toolCalls[0];
-      
-      console.log(`\n🔧 Calling tool: ${toolCall.name}`);
-      console.log(`📊 Arguments:`, toolCall.arguments);
-      
-      try {
-        const result = await this.mcpClient.callTool({
-          name: toolCall.name,
-          arguments: toolCall.arguments
-        });
-        
-        // Display the result
-        if (result.content && result.content[0]) {
-          const content = result.content[0];
-          if (content.type === 'text') {
-            try {
-              const data = JSON.parse(content.text);
-              console.log('\n📋 Results:');
-              console.log(JSON.stringify(data, null, 2));
-            } catch {
-              console.log('\n📋 Results:');
-              console.log(content.text);
-            }
+    let response: AIResponse;
+    try {
+      response = await this.aiProvider.completeStream({
+        messages: [
+          { role: 'system', content: SYSTEM_PROMPT },
+          { role: 'user', content: userInput }
+        ],
+        tools: tools.map(toAITool)
+      }, {
+        onText: (delta) => {
+          if (!streamingText) {
+            textBuffer += '\n💬 ';
+            streamingText = true;
+          }
+          textBuffer += delta;
+          if (!flushTimer) {
+            flushTimer = setTimeout(flushText, TEXT_FLUSH_INTERVAL_MS);
           }
+        },
+        onToolCall: (toolCall) => {
+          flushText();
+          console.log(`\n🔧 Calling tool: ${toolCall.name}`);
+          console.log(`📊 Arguments:`, toolCall.arguments);
+          pendingCalls.push(this.mcpClient.callToolSettled({
+            name: toolCall.name,
+            arguments: toolCall.arguments
+          }));
+        },
+        onToolCallError: (name, error) => {
+          pendingCalls.push(Promise.resolve({ name, success: false, error: error.message }));
         }
-        
-        return result;
-      } catch (error: any) {
-        console.error(`\n❌ Tool execution failed: ${error.message}`);
-        throw error;
+      });
+    } catch (error) {
+      // Tool calls dispatched before the stream failed still run (and may have
+      // written to Jamf); report what they did before surfacing the error
+      flushText();
+      if (pendingCalls.length > 0) {
+        this.reportToolResults(await Promise.all(pendingCalls));
+      }
+      throw error;
+    } finally {
+      flushText();
+    }
+
+    if (pendingCalls.length === 0) {
+      if (streamingText) {
+        process.stdout.write('\n');
       }
-    } else {
-      console.log('\n💬 Response:', response.content);
       return response;
     }
+
+    // Independent tool calls have been running concurrently since they streamed in
+    const results = await Promise.all(pendingCalls);
+
+    this.reportToolResults(results);
+
+    if (results.every(r => !r.success)) {
+      throw new Error(results.map(r => `${r.name}: ${r.error}`).join('; '));
+    }
+
+    return results.length === 1 ? results[0].result : results;
+  }
+
+  private reportToolResults(results: MCPBatchResult[]): void {
+    for (const { name, success, result, error } of results) {
+      if (!success) {
+        console.error(`\n❌ Tool execution failed (${name}): ${error}`);
+        continue;
+      }
+
+      // Display the result
+      if (result?.content && result.content[0]) {
+        const content = result.content[0];
+        if (content.type === 'text') {
+          console.log('\n📋 Results:');
+          console.log(formatToolText(content.text));
+        }
+      }
+    }
   }
 
   async shutdown(): Promise<void> {
@@ -28,6 +28,8 @@ export interface PlanExecutionResult {
   duration: number;
 }
 
+let stepRunCounter = 0;
+
 export class TaskExecutor extends EventEmitter {
   constructor(
     private mcpClient: MCPClient,
@@ -81,7 +83,8 @@ export class TaskExecutor extends EventEmitter {
     options: TaskExecutionOptions = {}
   ): Promise<StepExecutionResult> {
     const startTime = Date.now();
-    const taskId = `${step.id}-${Date.now()}`;
+    // Plans reuse step ids (step1, step2, ...), so a counter keeps runs distinct
+    const taskId = `${step.id}-${++stepRunCounter}`;
 
     this.emit('stepStart', { step, taskId });
     this.context.startTask(taskId, step.toolName, step.arguments);
@@ -140,10 +143,14 @@ export class TaskExecutor extends EventEmitter {
         timestamp: new Date().toISOString(),
       });
 
-      // Log the result for debugging
-      if (result.result?.content?.length > 0) {
-        console.log(`\nStep ${step.id} results:`, 
-          JSON.stringify(result.result.content[0], null, 2).substring(0, 500) + '...');
+      // Log a preview of the result for debugging. Slice the text payload directly
+      // instead of re-serializing what may be a multi-MB inventory response.
+      const firstContent = toolResult.content?.[0];
+      if (firstContent) {
+        const preview = firstContent.type === 'text'
+          ? firstContent.text.substring(0, 500)
+          : JSON.stringify(firstContent).substring(0, 500);
+        console.log(`\nStep ${step.id} results:`, preview + '...');
       }
       
       this.emit('stepComplete', result);
@@ -220,7 +227,9 @@ export class TaskExecutor extends EventEmitter {
     failedSteps: string[],
     options: TaskExecutionOptions
   ): Promise<void> {
-    const executing = new Set<string>();
+    // Track every in-flight step so each wake-up races all of them, not just
+    // the ones started in the latest round.
+    const executing = new Map<string, Promise<void>>();
     
     while (completedSteps.length + failedSteps.length < steps.length) {
       const ready = steps.filter(step => 
@@ -233,23 +242,25 @@ export class TaskExecutor extends EventEmitter {
         break;
       }
 
-      const promises = ready.map(async (step) => {
-        executing.add(step.id);
-        try {
-          const result = await this.executeStep(step, options);
-          results.set(step.id, result);
-          
-          if (result.success) {
-            completedSteps.push(step.id);
-          } else {
-            failedSteps.push(step.id);
+      for (const step of ready) {
+        const promise = (async () => {
+          try {
+            const result = await this.executeStep(step, options);
+            results.set(step.id, result);
+            
+            if (result.success) {
+              completedSteps.push(step.id);
+            } else {
+              failedSteps.push(step.id);
+            }
+          } finally {
+            executing.delete(step.id);
           }
-        } finally {
-          executing.delete(step.id);
-        }
-      });
+        })();
+        executing.set(step.id, promise);
+      }
 
-      await Promise.race(promises);
+      await Promise.race(executing.values());
     }
   }
 
@@ -1,4 +1,4 @@
-export { JamfAgent } from './core/AgentCore.js';
+export { JamfAgent, AgentLoopDetectedError } from './core/AgentCore.js';
 export type { AgentOptions, TaskExecutionResult } from './core/AgentCore.js';
 export { AgentConfigSchema, AgentConfigManager } from './core/AgentConfig.js';
 export type { AgentConfig } from './core/AgentConfig.js';
@@ -7,11 +7,11 @@ export type { TaskResult, ConversationMessage, TaskHistoryItem } from './core/Ag
 export { TaskExecutor } from './core/TaskExecutor.js';
 export type { TaskExecutionOptions, PlanExecutionResult, StepExecutionResult } from './core/TaskExecutor.js';
 
-export { MCPClient } from './mcp/MCPClient.js';
-export type { MCPConnectionOptions, MCPToolCall } from './mcp/MCPClient.js';
+export { MCPClient, toolCallKey } from './mcp/MCPClient.js';
+export type { MCPConnectionOptions, MCPToolCall, MCPBatchOptions, MCPBatchResult } from './mcp/MCPClient.js';
 
 export { AIProvider } from './ai/AIProvider.js';
-export type { AIRequest, AIResponse, AIMessage, AITool, AIToolCall, AIProviderConfig } from './ai/AIProvider.js';
+export type { AIRequest, AIResponse, AIMessage, AITool, AIToolCall, AIProviderConfig, AIStreamHandlers } from './ai/AIProvider.js';
 export { OpenAIProvider } from './ai/providers/OpenAIProvider.js';
 export { BedrockProvider } from './ai/providers/BedrockProvider.js';
 
@@ -3,6 +3,7 @@
 import * as readline from 'readline';
 import { JamfAgent } from '../core/AgentCore.js';
 import { TaskPlan } from '../tasks/TaskPlanner.js';
+import { registerShutdownHandler } from '../../utils/shutdown-manager.js';
 
 export class AgentCLI {
   private agent: JamfAgent;
@@ -175,6 +176,9 @@ export class AgentCLI {
       process.exit(1);
     }
 
+    // Close the MCP session (and the spawned server) on SIGINT/SIGTERM
+    registerShutdownHandler('agent-cli', () => this.agent.shutdown(), 20, 5000);
+
     this.running = true;
     this.rl.prompt();
 
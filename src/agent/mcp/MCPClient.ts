@@ -8,12 +8,53 @@ import {
   ListToolsResult,
   ListResourcesResult,
 } from '@modelcontextprotocol/sdk/types.js';
+import { RequestOptions } from '@modelcontextprotocol/sdk/shared/protocol.js';
+import { Transport } from '@modelcontextprotocol/sdk/shared/transport.js';
+import { InMemoryTransport } from '@modelcontextprotocol/sdk/inMemory.js';
+import type { Server } from '@modelcontextprotocol/sdk/server/index.js';
+import type { JamfApiClientHybrid } from '../../jamf-client-hybrid.js';
 import { EventEmitter } from 'events';
+import { SocketClientTransport } from './SocketClientTransport.js';
+import { ConcurrencyLimiter } from '../../utils/throttle.js';
+import { LRUCache } from '../../utils/lru-cache.js';
+import { stableStringify } from '../../utils/stable-stringify.js';
+
+const DEFAULT_BATCH_CONCURRENCY = 8;
+const RESULT_CACHE_SIZE = 200;
+
+// Results of read-only tools (per the server's readOnlyHint annotation) are
+// cached briefly: searches and listings for longer, per-object lookups and
+// reports only long enough to absorb duplicate calls within one turn. Any
+// other call may change Jamf state and invalidates them.
+const SEARCH_RESULT_TTL = 30_000;
+const DETAIL_RESULT_TTL = 5_000;
+
+// Read-only tools that are never cached: their answer changes from one call to
+// the next (logs, histories) or is a credential
+const UNCACHED_READ_TOOLS = /^getLocalAdminPassword|History$|Logs$/;
+
+interface CachedToolResult {
+  result: CallToolResult;
+  expiresAt: number;
+}
+
+/**
+ * Identity of a tool call: the tool name plus its arguments with sorted keys.
+ */
+export function toolCallKey(toolCall: MCPToolCall): string {
+  return `${toolCall.name}:${stableStringify(toolCall.arguments ?? {})}`;
+}
 
 export interface MCPConnectionOptions {
   command: string;
   args: string[];
   env?: Record<string, string>;
+  /** Connect to an already-running server on this Unix domain socket instead of spawning `command` */
+  socketPath?: string;
+  /** Briefly reuse results of identical read-only tool calls (default: true) */
+  cacheToolResults?: boolean;
+  /** Run the Jamf MCP server inside this process and talk to it over an in-memory transport */
+  inProcess?: boolean;
 }
 
 export interface MCPToolCall {
@@ -21,31 +62,75 @@ export interface MCPToolCall {
   arguments: Record<string, any>;
 }
 
+export interface MCPBatchOptions {
+  maxConcurrent?: number;
+  stopOnError?: boolean;
+}
+
+export interface MCPBatchResult {
+  name: string;
+  success: boolean;
+  result?: CallToolResult;
+  error?: string;
+}
+
 export class MCPClient extends EventEmitter {
   private client: Client | null = null;
-  private transport: StdioClientTransport | null = null;
+  private transport: Transport | null = null;
+  private inProcessServer: Server | null = null;
+  // Kept across reconnects: it holds the Jamf token, response cache and pooled
+  // connections, which a fresh client would have to rebuild
+  private inProcessJamfClient: JamfApiClientHybrid | null = null;
   private connected: boolean = false;
+  private connecting: Promise<void> | null = null;
   private tools: Map<string, Tool> = new Map();
   private resources: Map<string, Resource> = new Map();
+  private resultCache = new LRUCache<CachedToolResult>({ maxSize: RESULT_CACHE_SIZE });
+  // Bumped whenever a write starts or settles, so a read that was already in
+  // flight does not cache a result from before the write
+  private resultCacheGeneration = 0;
+  // Bounds how many tool calls are in flight at once, however they were dispatched
+  private toolCallLimiter = new ConcurrencyLimiter(DEFAULT_BATCH_CONCURRENCY);
 
   constructor(private options: MCPConnectionOptions) {
     super();
   }
 
+  /**
+   * Spawn (or dial) the MCP server and keep the session open until disconnect().
+   * Concurrent callers share a single in-flight connection attempt.
+   */
   async connect(): Promise<void> {
     if (this.connected) {
       throw new Error('Already connected to MCP server');
     }
 
+    if (!this.connecting) {
+      this.connecting = this.establishConnection().finally(() => {
+        this.connecting = null;
+      });
+    }
+    return this.connecting;
+  }
+
+  private async establishConnection(): Promise<void> {
     try {
-      console.error('Starting MCP server process...');
-      
-      // StdioClientTransport expects command and args in its constructor
-      this.transport = new StdioClientTransport({
-        command: this.options.command,
-        args: this.options.args,
-        env: { ...process.env, ...this.options.env },
-      } as any);
+      if (this.options.inProcess) {
+        console.error('Starting in-process MCP server...');
+        this.transport = await this.createInProcessTransport();
+      } else if (this.options.socketPath) {
+        console.error(`Connecting to MCP server at ${this.options.socketPath}...`);
+        this.transport = new SocketClientTransport(this.options.socketPath);
+      } else {
+        console.error('Starting MCP server process...');
+
+        // StdioClientTransport expects command and args in its constructor
+        this.transport = new StdioClientTransport({
+          command: this.options.command,
+          args: this.options.args,
+          env: { ...process.env, ...this.options.env },
+        } as any);
+      }
 
       this.client = new Client(
         {
@@ -66,11 +151,47 @@ export class MCPClient extends EventEmitter {
       await this.discoverCapabilities();
     } catch (error) {
       console.error('Failed to connect to MCP server:', error);
-      this.disconnect();
+      await this.disconnect();
       throw error;
     }
   }
 
+  /**
+   * Build the Jamf MCP server in this process and link it with an in-memory
+   * transport: JSON-RPC messages are handed over as objects, with no child
+   * process, pipe writes or JSON (de)serialization on either side.
+   */
+  private async createInProcessTransport(): Promise<Transport> {
+    const [{ createMcpServer }, { JamfApiClientHybrid }, { SkillsManager }] = await Promise.all([
+      import('../../server/mcp-server.js'),
+      import('../../jamf-client-hybrid.js'),
+      import('../../skills/manager.js'),
+    ]);
+
+    if (!this.inProcessJamfClient) {
+      const env: Record<string, string | undefined> = { ...process.env, ...this.options.env };
+      if (!env.JAMF_URL) {
+        throw new Error('JAMF_URL is required for the in-process MCP server');
+      }
+
+      this.inProcessJamfClient = new JamfApiClientHybrid({
+        baseUrl: env.JAMF_URL,
+        clientId: env.JAMF_CLIENT_ID || undefined,
+        clientSecret: env.JAMF_CLIENT_SECRET || undefined,
+        username: env.JAMF_USERNAME || undefined,
+        password: env.JAMF_PASSWORD || undefined,
+        readOnlyMode: env.JAMF_READ_ONLY === 'true',
+        rejectUnauthorized: env.JAMF_ALLOW_INSECURE !== 'true',
+      });
+    }
+
+    const [clientTransport, serverTransport] = InMemoryTransport.createLinkedPair();
+    this.inProcessServer = createMcpServer(this.inProcessJamfClient, new SkillsManager());
+    await this.inProcessServer.connect(serverTransport);
+
+    return clientTransport;
+  }
+
   async disconnect(): Promise<void> {
     if (this.client) {
       await this.client.close();
@@ -82,9 +203,15 @@ export class MCPClient extends EventEmitter {
       this.transport = null;
     }
 
+    if (this.inProcessServer) {
+      await this.inProcessServer.close();
+      this.inProcessServer = null;
+    }
+
     this.connected = false;
     this.tools.clear();
     this.resources.clear();
+    this.resultCache.clear();
     
     this.emit('disconnected');
   }
@@ -127,7 +254,7 @@ export class MCPClient extends EventEmitter {
     return result.resources;
   }
 
-  async callTool(toolCall: MCPToolCall): Promise<CallToolResult> {
+  async callTool(toolCall: MCPToolCall, options?: RequestOptions): Promise<CallToolResult> {
     if (!this.client) throw new Error('Not connected to MCP server');
     
     const tool = this.tools.get(toolCall.name);
@@ -135,21 +262,112 @@ export class MCPClient extends EventEmitter {
       throw new Error(`Unknown tool: ${toolCall.name}`);
     }
 
+    const readOnly = this.isReadOnlyTool(toolCall.name);
+    const ttl = readOnly ? this.resultCacheTTL(toolCall.name) : 0;
+    const cacheKey = toolCallKey(toolCall);
+    if (ttl > 0) {
+      const cached = this.resultCache.get(cacheKey);
+      if (cached && cached.expiresAt > Date.now()) {
+        console.error(`Using cached result: ${toolCall.name}`);
+        // A copy, so one caller mutating its result cannot change another's
+        return structuredClone(cached.result);
+      }
+    }
+    if (!readOnly) {
+      // A call that may change Jamf state makes earlier reads stale
+      this.invalidateResultCache();
+    }
+    const generation = this.resultCacheGeneration;
+
     console.error(`Calling tool: ${toolCall.name}`, toolCall.arguments);
     
     try {
       const result = await this.client.callTool({
         name: toolCall.name,
         arguments: toolCall.arguments,
-      });
+      }, undefined, options) as CallToolResult;
+
+      if (ttl > 0 && !result.isError && generation === this.resultCacheGeneration) {
+        this.resultCache.set(cacheKey, { result: structuredClone(result), expiresAt: Date.now() + ttl });
+      }
       
-      return result as CallToolResult;
+      return result;
     } catch (error) {
       console.error(`Tool call failed: ${toolCall.name}`, error);
       throw error;
+    } finally {
+      if (!readOnly) {
+        // Reads that ran alongside the write may have cached pre-write state
+        this.invalidateResultCache();
+      }
     }
   }
 
+  /**
+   * How long a tool's result may be reused; 0 means never cached.
+   */
+  private resultCacheTTL(toolName: string): number {
+    if (this.options.cacheToolResults === false || UNCACHED_READ_TOOLS.test(toolName)) {
+      return 0;
+    }
+    return /^(search|list)/.test(toolName) ? SEARCH_RESULT_TTL : DETAIL_RESULT_TTL;
+  }
+
+  private invalidateResultCache(): void {
+    this.resultCacheGeneration++;
+    this.resultCache.clear();
+  }
+
+  /**
+   * Call a tool through the concurrency limiter, capturing failures in the
+   * result instead of throwing.
+   */
+  async callToolSettled(toolCall: MCPToolCall, options?: RequestOptions): Promise<MCPBatchResult> {
+    try {
+      const result = await this.toolCallLimiter.run(() => this.callTool(toolCall, options));
+      return { name: toolCall.name, success: true, result };
+    } catch (error) {
+      return {
+        name: toolCall.name,
+        success: false,
+        error: error instanceof Error ? error.message : String(error),
+      };
+    }
+  }
+
+  /**
+   * Execute independent tool calls concurrently, at most `maxConcurrent` of
+   * this batch at a time and within the client-wide limit. Results are
+   * returned in the same order as the calls. With `stopOnError`, the first
+   * failure aborts in-flight calls and skips those not yet started.
+   */
+  async callTools(calls: MCPToolCall[], options: MCPBatchOptions = {}): Promise<MCPBatchResult[]> {
+    const batchLimiter = new ConcurrencyLimiter(options.maxConcurrent ?? DEFAULT_BATCH_CONCURRENCY);
+    const abortController = new AbortController();
+
+    const settled = await batchLimiter.mapSettled(calls, (call) => this.toolCallLimiter.run(async () => {
+      if (abortController.signal.aborted) {
+        throw new Error('Skipped after earlier failure in batch');
+      }
+      try {
+        return await this.callTool(call, { signal: abortController.signal });
+      } catch (error) {
+        if (options.stopOnError) {
+          abortController.abort();
+        }
+        throw error;
+      }
+    }));
+
+    return settled.map((outcome, i) => outcome.status === 'fulfilled'
+      ? { name: calls[i].name, success: true, result: outcome.value }
+      : {
+        name: calls[i].name,
+        success: false,
+        error: outcome.reason instanceof Error ? outcome.reason.message : String(outcome.reason),
+      });
+  }
+
   async readResource(uri: string): Promise<ReadResourceResult> {
     if (!this.client) throw new Error('Not connected to MCP server');
     
@@ -173,6 +391,13 @@ export class MCPClient extends EventEmitter {
     return this.tools.get(name);
   }
 
+  /**
+   * Whether the server marks a tool read-only. Unknown or unannotated tools are not.
+   */
+  isReadOnlyTool(name: string): boolean {
+    return this.tools.get(name)?.annotations?.readOnlyHint === true;
+  }
+
   getResource(uri: string): Resource | undefined {
     return this.resources.get(uri);
   }
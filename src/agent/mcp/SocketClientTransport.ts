@@ -0,0 +1,91 @@
+import * as net from 'net';
+import { Transport } from '@modelcontextprotocol/sdk/shared/transport.js';
+import { ReadBuffer, serializeMessage } from '@modelcontextprotocol/sdk/shared/stdio.js';
+import { JSONRPCMessage } from '@modelcontextprotocol/sdk/types.js';
+
+/**
+ * MCP client transport over a Unix domain socket.
+ *
+ * Uses the same newline-delimited JSON-RPC framing as the stdio transport, so it
+ * talks to a server started with MCP_TRANSPORT=uds without spawning a process
+ * or going through the TCP loopback stack.
+ */
+export class SocketClientTransport implements Transport {
+  private socket: net.Socket | null = null;
+  private readBuffer = new ReadBuffer();
+
+  onclose?: () => void;
+  onerror?: (error: Error) => void;
+  onmessage?: (message: JSONRPCMessage) => void;
+
+  constructor(private socketPath: string) {}
+
+  async start(): Promise<void> {
+    if (this.socket) {
+      throw new Error('SocketClientTransport already started');
+    }
+
+    await new Promise<void>((resolve, reject) => {
+      const socket = net.createConnection(this.socketPath);
+
+      const onConnectError = (error: Error) => reject(error);
+      socket.once('error', onConnectError);
+      socket.once('connect', () => {
+        socket.off('error', onConnectError);
+        socket.setNoDelay(true);
+
+        socket.on('data', (chunk: Buffer) => {
+          this.readBuffer.append(chunk);
+          this.processReadBuffer();
+        });
+        socket.on('error', (error) => this.onerror?.(error));
+        socket.on('close', () => {
+          this.socket = null;
+          this.readBuffer.clear();
+          this.onclose?.();
+        });
+
+        this.socket = socket;
+        resolve();
+      });
+    });
+  }
+
+  private processReadBuffer(): void {
+    while (true) {
+      try {
+        const message = this.readBuffer.readMessage();
+        if (message === null) {
+          break;
+        }
+        this.onmessage?.(message);
+      } catch (error) {
+        this.onerror?.(error as Error);
+      }
+    }
+  }
+
+  async send(message: JSONRPCMessage): Promise<void> {
+    const socket = this.socket;
+    if (!socket) {
+      throw new Error('Not connected');
+    }
+
+    const json = serializeMessage(message);
+    if (!socket.write(json)) {
+      await new Promise<void>((resolve) => socket.once('drain', resolve));
+    }
+  }
+
+  async close(): Promise<void> {
+    const socket = this.socket;
+    if (!socket) {
+      return;
+    }
+
+    await new Promise<void>((resolve) => {
+      socket.once('close', () => resolve());
+      socket.end();
+    });
+  }
+}
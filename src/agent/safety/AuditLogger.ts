@@ -17,9 +17,14 @@ export class AuditLogger {
   private logPath: string;
   private buffer: AuditLogEntry[] = [];
   private flushInterval: NodeJS.Timeout | null = null;
+  // The flush timer does not hold the process open, so whatever is still
+  // buffered is written out when the event loop drains; the pending write
+  // keeps the process alive until it lands
+  private readonly flushOnExit = (): void => this.flush();
 
   constructor(private config: AgentConfig) {
     this.logPath = config.safety.auditLogPath;
+    process.on('beforeExit', this.flushOnExit);
     this.initialize();
   }
 
@@ -39,6 +44,9 @@ export class AuditLogger {
       this.flushInterval = setInterval(() => {
         this.flush();
       }, 5000);
+      // Don't keep the process alive just to flush the audit log; the
+      // beforeExit hook writes out the remainder
+      this.flushInterval.unref();
 
       this.log('info', 'audit_logger_initialized', {
         logPath: this.logPath,
@@ -80,10 +88,12 @@ export class AuditLogger {
 
     const entries = this.buffer.splice(0, this.buffer.length);
     
+    // One write per flush instead of one per entry
+    let lines = '';
     for (const entry of entries) {
-      const line = JSON.stringify(entry) + '\n';
-      this.stream.write(line);
+      lines += JSON.stringify(entry) + '\n';
     }
+    this.stream.write(lines);
   }
 
   logUserRequest(taskId: string, request: string, userId?: string): void {
@@ -180,6 +190,8 @@ export class AuditLogger {
   }
 
   async close(): Promise<void> {
+    process.off('beforeExit', this.flushOnExit);
+
     if (this.flushInterval) {
       clearInterval(this.flushInterval);
       this.flushInterval = null;
@@ -7,6 +7,7 @@ import { BedrockProvider } from './ai/providers/BedrockProvider.js';
 import { OpenAIProvider } from './ai/providers/OpenAIProvider.js';
 import { MockProvider } from './ai/providers/MockProvider.js';
 import { SimpleAgent } from './core/SimpleAgent.js';
+import { registerShutdownHandler } from '../utils/shutdown-manager.js';
 
 async function main() {
   console.log('🤖 Jamf AI Agent - Simple Natural Language Interface\n');
@@ -30,6 +31,10 @@ async function main() {
       JAMF_PASSWORD: process.env.JAMF_PASSWORD || '',
       JAMF_READ_ONLY: process.env.JAMF_READ_ONLY || 'false',
     },
+    socketPath: process.env.AGENT_MCP_TRANSPORT === 'uds'
+      ? process.env.AGENT_MCP_SOCKET_PATH || '/tmp/jamf-mcp.sock'
+      : undefined,
+    inProcess: process.env.AGENT_MCP_TRANSPORT === 'inproc' || process.env.JAMF_MCP_INPROC === '1',
   });
 
   // Create AI provider
@@ -57,6 +62,9 @@ async function main() {
   // Create simple agent
   const agent = new SimpleAgent(mcpClient, aiProvider, {} as any);
 
+  // Close the MCP session (and the spawned server) on SIGINT/SIGTERM
+  registerShutdownHandler('agent-mcp-client', () => agent.shutdown(), 20, 5000);
+
   // Set up event handlers
   mcpClient.on('connected', () => {
     console.log('✅ Connected to Jamf MCP server\n');
@@ -1,5 +1,5 @@
 import { z } from 'zod';
-import { AIProvider, AIMessage } from '../ai/AIProvider.js';
+import { AIProvider, AIMessage, AITool } from '../ai/AIProvider.js';
 import { MCPClient } from '../mcp/MCPClient.js';
 import { AgentContext } from '../core/AgentContext.js';
 
@@ -22,6 +22,85 @@ export const TaskPlanSchema = z.object({
 export type TaskStep = z.infer<typeof TaskStepSchema>;
 export type TaskPlan = z.infer<typeof TaskPlanSchema>;
 
+// Static planning guidance, kept separate from the per-request tool list and
+// context so it forms an identical prompt prefix on every call
+const PLANNING_GUIDELINES = `You are a task planning assistant for Jamf device management operations.
+
+Your job is to analyze user requests and create efficient plans using ONLY the available MCP tools listed below.
+
+Guidelines for planning:
+1. Keep plans as simple as possible - often one step is enough
+2. Each step MUST use exactly one of the available MCP tools
+3. For "show X's computer/device" requests - just use searchDevices. It returns device ID, name, and serial number which is usually sufficient
+4. Only create multi-step plans when explicitly needed (e.g., user asks for "search then get full details")
+5. Flag tasks that modify data as requiring confirmation
+
+SIMPLE REQUESTS (one step only):
+- "Show Jane's computer" → searchDevices with {"query": "jane"}
+- "Find devices with Chrome" → searchDevices with {"query": "chrome"}
+- "List all computers" → listDevices
+
+ONLY use getDeviceDetails when:
+- User provides a specific device ID: "Show details for device 123"
+- User explicitly asks for "full details" or "detailed information"
+
+IMPORTANT - Tool Usage Rules:
+1. searchDevices requires a "query" parameter, e.g., {"query": "jane"}
+2. When searching for a user's device, use only searchDevices - it will return device details
+3. Do NOT create multiple steps for simple searches - searchDevices returns enough information
+4. Only use getDeviceDetails if the user specifically asks for detailed information about a known device ID
+5. Keep plans simple - one step is often enough
+
+For common requests:
+- "Show Jane's computer" → Use searchDevices with {"query": "jane"} - this returns device ID, name, and serial number
+- "Get details for device 123" → Use getDeviceDetails with {"deviceId": "123"}
+- "List all computers" → Use listDevices with appropriate filters
+
+The results will be automatically displayed to the user.`;
+
+// Planning tool schemas are static; build them once instead of on every request
+const CREATE_TASK_PLAN_TOOL: AITool = {
+  name: 'create_task_plan',
+  description: 'Create a detailed task plan',
+  parameters: {
+    properties: {
+      goal: { type: 'string', description: 'The overall goal of the task' },
+      steps: {
+        type: 'array',
+        items: {
+          type: 'object',
+          properties: {
+            id: { type: 'string', description: 'Unique step ID' },
+            description: { type: 'string', description: 'What this step does' },
+            toolName: { type: 'string', description: 'The MCP tool to use' },
+            arguments: { type: 'object', description: 'Arguments for the tool' },
+            dependencies: { type: 'array', items: { type: 'string' }, description: 'IDs of steps this depends on' },
+            optional: { type: 'boolean', description: 'Whether this step is optional' },
+          },
+          required: ['id', 'description', 'toolName', 'arguments'],
+        },
+      },
+      estimatedDuration: { type: 'number', description: 'Estimated duration in seconds' },
+      requiresConfirmation: { type: 'boolean', description: 'Whether user confirmation is needed' },
+    },
+    required: ['goal', 'steps'],
+  },
+};
+
+const REFINE_TASK_PLAN_TOOL: AITool = {
+  name: 'refine_task_plan',
+  description: 'Refine the existing task plan',
+  parameters: {
+    properties: {
+      goal: { type: 'string' },
+      steps: { type: 'array', items: { type: 'object' } },
+      estimatedDuration: { type: 'number' },
+      requiresConfirmation: { type: 'boolean' },
+    },
+    required: ['goal', 'steps'],
+  },
+};
+
 export class TaskPlanner {
   constructor(
     private aiProvider: AIProvider,
@@ -29,45 +108,29 @@ export class TaskPlanner {
     private context: AgentContext
   ) {}
 
-  async planTask(userRequest: string): Promise<TaskPlan> {
+  /**
+   * Plan a request. After a failed attempt, pass a short summary of what failed
+   * instead of the full history so the retry prompt stays small.
+   */
+  async planTask(userRequest: string, failureSummary?: string): Promise<TaskPlan> {
     const tools = this.mcpClient.getAllTools();
-    const systemPrompt = await this.buildPlanningPrompt(tools);
     
     const messages: AIMessage[] = [
-      { role: 'system', content: systemPrompt },
-      { role: 'user', content: userRequest },
+      { role: 'system', content: PLANNING_GUIDELINES },
+      { role: 'system', content: this.buildPlanningContext(tools) },
+      {
+        role: 'user',
+        content: failureSummary
+          ? `${userRequest}\n\nA previous plan for this request failed:\n${failureSummary}\n` +
+            'Do not repeat a failed tool call with the same arguments; try a different approach.'
+          : userRequest,
+      },
     ];
 
     const response = await this.aiProvider.complete({
       messages,
       temperature: 0.5,
-      tools: [{
-        name: 'create_task_plan',
-        description: 'Create a detailed task plan',
-        parameters: {
-          properties: {
-            goal: { type: 'string', description: 'The overall goal of the task' },
-            steps: {
-              type: 'array',
-              items: {
-                type: 'object',
-                properties: {
-                  id: { type: 'string', description: 'Unique step ID' },
-                  description: { type: 'string', description: 'What this step does' },
-                  toolName: { type: 'string', description: 'The MCP tool to use' },
-                  arguments: { type: 'object', description: 'Arguments for the tool' },
-                  dependencies: { type: 'array', items: { type: 'string' }, description: 'IDs of steps this depends on' },
-                  optional: { type: 'boolean', description: 'Whether this step is optional' },
-                },
-                required: ['id', 'description', 'toolName', 'arguments'],
-              },
-            },
-            estimatedDuration: { type: 'number', description: 'Estimated duration in seconds' },
-            requiresConfirmation: { type: 'boolean', description: 'Whether user confirmation is needed' },
-          },
-          required: ['goal', 'steps'],
-        },
-      }],
+      tools: [CREATE_TASK_PLAN_TOOL],
     });
 
     if (!response.toolCalls || response.toolCalls.length === 0) {
@@ -98,19 +161,7 @@ export class TaskPlanner {
     const response = await this.aiProvider.complete({
       messages,
       temperature: 0.5,
-      tools: [{
-        name: 'refine_task_plan',
-        description: 'Refine the existing task plan',
-        parameters: {
-          properties: {
-            goal: { type: 'string' },
-            steps: { type: 'array', items: { type: 'object' } },
-            estimatedDuration: { type: 'number' },
-            requiresConfirmation: { type: 'boolean' },
-          },
-          required: ['goal', 'steps'],
-        },
-      }],
+      tools: [REFINE_TASK_PLAN_TOOL],
     });
 
     if (!response.toolCalls || response.toolCalls.length === 0) {
@@ -120,48 +171,18 @@ export class TaskPlanner {
     return TaskPlanSchema.parse(response.toolCalls[0].arguments);
   }
 
-  private async buildPlanningPrompt(tools: any[]): Promise<string> {
+  /**
+   * The per-request part of the planning prompt: the tool list and the current
+   * context. Sent after PLANNING_GUIDELINES so the static prefix stays cacheable.
+   */
+  private buildPlanningContext(tools: any[]): string {
     const toolDescriptions = tools.map(tool => 
       `- ${tool.name}: ${tool.description}`
     ).join('\n');
 
-    return `You are a task planning assistant for Jamf device management operations.
-
-Available MCP Tools (ONLY use these tools - do not create imaginary tools):
+    return `Available MCP Tools (ONLY use these tools - do not create imaginary tools):
 ${toolDescriptions}
 
-Your job is to analyze user requests and create efficient plans using ONLY the available tools listed above.
-
-Guidelines for planning:
-1. Keep plans as simple as possible - often one step is enough
-2. Each step MUST use exactly one of the MCP tools listed above
-3. For "show X's computer/device" requests - just use searchDevices. It returns device ID, name, and serial number which is usually sufficient
-4. Only create multi-step plans when explicitly needed (e.g., user asks for "search then get full details")
-5. Flag tasks that modify data as requiring confirmation
-
-SIMPLE REQUESTS (one step only):
-- "Show Jane's computer" → searchDevices with {"query": "jane"}
-- "Find devices with Chrome" → searchDevices with {"query": "chrome"}
-- "List all computers" → listDevices
-
-ONLY use getDeviceDetails when:
-- User provides a specific device ID: "Show details for device 123"
-- User explicitly asks for "full details" or "detailed information"
-
-IMPORTANT - Tool Usage Rules:
-1. searchDevices requires a "query" parameter, e.g., {"query": "jane"}
-2. When searching for a user's device, use only searchDevices - it will return device details
-3. Do NOT create multiple steps for simple searches - searchDevices returns enough information
-4. Only use getDeviceDetails if the user specifically asks for detailed information about a known device ID
-5. Keep plans simple - one step is often enough
-
-For common requests:
-- "Show Jane's computer" → Use searchDevices with {"query": "jane"} - this returns device ID, name, and serial number
-- "Get details for device 123" → Use getDeviceDetails with {"deviceId": "123"}
-- "List all computers" → Use listDevices with appropriate filters
-
-The results will be automatically displayed to the user.
-
 Current Context:
 ${this.context.getContextSummary()}
 
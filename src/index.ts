@@ -1,14 +1,13 @@
 #!/usr/bin/env node
+import * as fs from 'fs';
+import * as net from 'net';
 import { Server } from '@modelcontextprotocol/sdk/server/index.js';
 import { StdioServerTransport } from '@modelcontextprotocol/sdk/server/stdio.js';
 import { JamfApiClientHybrid } from './jamf-client-hybrid.js';
-import { registerTools } from './tools/index.js';
-import { registerResources } from './resources/index.js';
-import { registerPrompts } from './prompts/index.js';
 import { SkillsManager } from './skills/manager.js';
-import { registerSkillsAsMCPTools } from './tools/skills-mcp-integration.js';
 import { setupGlobalErrorHandlers } from './utils/error-handler.js';
 import { createLogger } from './server/logger.js';
+import { createMcpServer } from './server/mcp-server.js';
 import { registerShutdownHandler, registerCommonHandlers } from './utils/shutdown-manager.js';
 import { cleanupAuthMiddleware } from './server/auth-middleware.js';
 import { cleanupAgentPool } from './utils/http-agent-pool.js';
@@ -22,6 +21,8 @@ const JAMF_CLIENT_SECRET = process.env.JAMF_CLIENT_SECRET;
 const JAMF_USERNAME = process.env.JAMF_USERNAME;
 const JAMF_PASSWORD = process.env.JAMF_PASSWORD;
 const READ_ONLY_MODE = process.env.JAMF_READ_ONLY === 'true';
+const MCP_TRANSPORT = process.env.MCP_TRANSPORT || 'stdio';
+const MCP_SOCKET_PATH = process.env.MCP_SOCKET_PATH || '/tmp/jamf-mcp.sock';
 
 // Validate configuration
 if (!JAMF_URL) {
@@ -40,53 +41,115 @@ if (!hasOAuth2 && !hasBasicAuth) {
   process.exit(1);
 }
 
-const server = new Server(
-  {
-    name: 'jamf-mcp-server',
-    version: '1.2.0',
-  },
-  {
-    capabilities: {
-      tools: {},
-      resources: {},
-      prompts: {},
-    },
-    instructions: `You are connected to a Jamf Pro MDM server managing Apple devices (macOS, iOS, iPadOS, tvOS).
-
-## Quick Start — Common Questions
-- "How's my fleet?" → Use \`getFleetOverview\` (single call replaces 4-6 individual calls)
-- "Tell me about device X" → Use \`getDeviceFullProfile\` with name, serial, or ID
-- "What's our security posture?" → Use \`getSecurityPosture\` for encryption, compliance, OS currency
-- "How is policy X performing?" → Use \`getPolicyAnalysis\` with policy ID or name
-
-## Tool Categories (by prefix)
-- **Read-only (safe):** \`search*\`, \`list*\`, \`get*\`, \`check*\` — no side effects
-- **Write/create:** \`create*\`, \`clone*\`, \`update*\`, \`set*\` — modifies configuration
-- **Destructive (confirm required):** \`execute*\`, \`deploy*\`, \`send*\`, \`delete*\`, \`flush*\`, \`remove*\` — affects devices or deletes data
-
-## Performance Tips
-1. **Prefer compound tools** (\`getFleetOverview\`, \`getDeviceFullProfile\`, \`getSecurityPosture\`, \`getPolicyAnalysis\`) — they run parallel API calls internally
-2. **Use \`getDevicesBatch\`** instead of calling \`getDeviceDetails\` in a loop
-3. **Use resources** (jamf://reports/*) for pre-aggregated reports like compliance, encryption, OS versions
-4. **Use \`getInventorySummary\`** for fleet-wide inventory stats without fetching individual devices
-
-## Response Format
-Many tools return enriched responses with:
-- \`summary\`: Human-readable 1-2 sentence overview
-- \`suggestedNextActions\`: Array of recommended follow-up tool calls
-- \`data\`: The full API response data
-- \`metadata\`: Result count, timestamp
-
-## Important Notes
-- All destructive tools require \`confirm: true\` parameter
-- Device identifiers can be Jamf IDs, serial numbers, or device names (compound tools resolve automatically)
-- The server supports both the Jamf Pro API and Classic API with automatic fallback`,
-  }
-);
-
 // Initialize Skills Manager
 const skillsManager = new SkillsManager();
 
+/**
+ * Remove a socket file left behind by a run that did not shut down cleanly.
+ * Anything else at the path (a regular file, or a socket another instance is
+ * still listening on) is left in place and startup fails.
+ */
+async function removeStaleSocket(socketPath: string): Promise<void> {
+  let stats: fs.Stats;
+  try {
+    stats = fs.lstatSync(socketPath);
+  } catch (error: any) {
+    if (error.code === 'ENOENT') {
+      return;
+    }
+    throw error;
+  }
+
+  if (!stats.isSocket()) {
+    throw new Error(`MCP_SOCKET_PATH ${socketPath} exists and is not a socket`);
+  }
+
+  const inUse = await new Promise<boolean>((resolve, reject) => {
+    const probe = net.connect(socketPath);
+    probe.once('connect', () => {
+      probe.destroy();
+      resolve(true);
+    });
+    probe.once('error', (error: NodeJS.ErrnoException) => {
+      if (error.code === 'ECONNREFUSED') {
+        resolve(false);
+      } else {
+        reject(error);
+      }
+    });
+  });
+  if (inUse) {
+    throw new Error(`Another MCP server is already listening on ${socketPath}`);
+  }
+
+  fs.unlinkSync(socketPath);
+}
+
+/**
+ * Serve MCP over a Unix domain socket so a colocated agent (e.g. an ECS sidecar)
+ * skips process spawning and the TCP loopback stack. Each connection gets its own
+ * Server instance sharing the same Jamf client.
+ */
+async function listenOnSocket(jamfClient: JamfApiClientHybrid): Promise<void> {
+  await removeStaleSocket(MCP_SOCKET_PATH);
+
+  // Open connections and their MCP sessions, so shutdown does not wait on
+  // agents that stay connected
+  const sessions = new Map<net.Socket, Server>();
+
+  const socketServer = net.createServer((socket) => {
+    socket.setNoDelay(true);
+    const server = createMcpServer(jamfClient, skillsManager);
+    sessions.set(socket, server);
+    server.connect(new StdioServerTransport(socket, socket)).catch((error) => {
+      logger.error('Failed to attach MCP session to socket', { error });
+      socket.destroy();
+    });
+    socket.on('error', (error) => logger.warn('MCP socket error', { error: error.message }));
+    socket.on('close', () => {
+      sessions.delete(socket);
+      server.close().catch(() => {});
+    });
+  });
+
+  await new Promise<void>((resolve, reject) => {
+    socketServer.once('error', reject);
+    socketServer.listen(MCP_SOCKET_PATH, () => {
+      socketServer.off('error', reject);
+      resolve();
+    });
+  });
+  // Identifies our socket file, so shutdown never removes one that has since
+  // been replaced by another instance
+  const socketInode = fs.lstatSync(MCP_SOCKET_PATH).ino;
+
+  registerShutdownHandler('server-socket-close', async () => {
+    logger.info('Closing MCP socket server...', { connections: sessions.size });
+    const closed = new Promise<void>((resolve) => socketServer.close(() => resolve()));
+
+    // net.Server.close() only completes once every accepted socket has ended
+    await Promise.allSettled([...sessions.values()].map((server) => server.close()));
+    for (const socket of sessions.keys()) {
+      socket.destroy();
+    }
+    sessions.clear();
+    await closed;
+
+    try {
+      const stats = fs.lstatSync(MCP_SOCKET_PATH);
+      if (stats.isSocket() && stats.ino === socketInode) {
+        fs.unlinkSync(MCP_SOCKET_PATH);
+      }
+    } catch (error: any) {
+      if (error.code !== 'ENOENT') {
+        throw error;
+      }
+    }
+  }, 30, 10000);
+
+  logger.info(`Listening for MCP connections on ${MCP_SOCKET_PATH}`);
+}
+
 async function run() {
   try {
     logger.info('Starting Jamf MCP server with Skills...');
@@ -113,19 +176,18 @@ async function run() {
       rejectUnauthorized: process.env.JAMF_ALLOW_INSECURE !== 'true',
     });
 
-    // Register handlers
-    registerTools(server, jamfClient);
-    registerResources(server, jamfClient);
-    registerPrompts(server);
-    
-    // Register skills as MCP tools
-    registerSkillsAsMCPTools(server, skillsManager, jamfClient);
-
     // Start the server
-    const transport = new StdioServerTransport();
-    await server.connect(transport);
+    if (MCP_TRANSPORT === 'uds') {
+      await listenOnSocket(jamfClient);
+    } else {
+      const transport = new StdioServerTransport();
+      await createMcpServer(jamfClient, skillsManager).connect(transport);
+    }
     
     logger.info('Jamf MCP server started successfully with skills');
+
+    // Authenticate with Jamf now rather than on the first tool call
+    jamfClient.warmUp();
   } catch (error) {
     logger.error('Failed to initialize Jamf MCP server', { error });
     process.exit(1);
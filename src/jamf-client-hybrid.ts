@@ -15,6 +15,9 @@ const logger = createLogger('jamf-client-hybrid');
 const agentPool = getDefaultAgentPool();
 const apiThrottle = new ConcurrencyLimiter();
 
+// How long a Jamf Pro API endpoint that returned 403 is skipped before retrying it
+const PRO_API_FORBIDDEN_RETRY_MS = 10 * 60 * 1000;
+
 export interface JamfApiClientConfig {
   baseUrl: string;
   // OAuth2 credentials (for Jamf Pro API)
@@ -79,6 +82,10 @@ export class JamfApiClientHybrid implements IJamfApiClient {
   private cachedSearchId: number | null = null;
   private apiCache: LRUCache<any> = new LRUCache({ maxSize: 200, maxAge: 60000 });
 
+  // Jamf Pro API endpoints known to be missing or forbidden, mapped to the time
+  // until which calls skip them and go straight to the Classic API
+  private proApiUnavailableUntil: Map<string, number> = new Map();
+
   constructor(config: JamfApiClientConfig) {
     this.config = config;
     this.readOnlyMode = config.readOnlyMode ?? false;
@@ -197,6 +204,34 @@ export class JamfApiClientHybrid implements IJamfApiClient {
     return result;
   }
 
+  /**
+   * Whether a Jamf Pro API endpoint recently failed in a way that will repeat,
+   * so the caller should use the Classic API directly instead of paying for a
+   * request that is bound to fail first.
+   */
+  private isProApiUnavailable(endpoint: string): boolean {
+    const until = this.proApiUnavailableUntil.get(endpoint);
+    if (until === undefined) return false;
+    if (until > Date.now()) return true;
+    this.proApiUnavailableUntil.delete(endpoint);
+    return false;
+  }
+
+  /**
+   * Remember a Jamf Pro API failure that will repeat: 404/405 for an endpoint the
+   * server does not have (only meaningful for collection URLs, where 404 cannot
+   * mean a missing record), and 403 for missing privileges, rechecked after
+   * PRO_API_FORBIDDEN_RETRY_MS.
+   */
+  private markProApiUnavailable(endpoint: string, error: unknown, notFoundMeansMissing: boolean): void {
+    const status = getAxiosErrorStatus(error);
+    if (status === 405 || (status === 404 && notFoundMeansMissing)) {
+      this.proApiUnavailableUntil.set(endpoint, Infinity);
+    } else if (status === 403) {
+      this.proApiUnavailableUntil.set(endpoint, Date.now() + PRO_API_FORBIDDEN_RETRY_MS);
+    }
+  }
+
   /**
    * Invalidate cache entries matching a prefix
    */
@@ -398,6 +433,23 @@ export class JamfApiClientHybrid implements IJamfApiClient {
     }
   }
 
+  /**
+   * Authenticate ahead of the first request, so DNS, the TLS handshake and the
+   * token exchange are done at startup and the connection is left in the
+   * keep-alive pool. Failures are only logged; requests authenticate as usual.
+   */
+  async warmUp(): Promise<void> {
+    const start = Date.now();
+    try {
+      await this.ensureAuthenticated();
+      logger.info(`Jamf connection warmed up in ${Date.now() - start}ms`);
+    } catch (error) {
+      logger.warn('Jamf warm-up failed; authenticating on first request instead', {
+        error: getErrorMessage(error),
+      });
+    }
+  }
+
   /**
    * Transform Classic API computer to standard format
    */
@@ -462,45 +514,48 @@ export class JamfApiClientHybrid implements IJamfApiClient {
     await this.ensureAuthenticated();
 
     // Try Jamf Pro API first
-    try {
-      logger.info('Searching computers using Jamf Pro API...');
-      const params: Record<string, string | number> = {
-        'page-size': limit,
-      };
-      
-      // Only add filter if there's a query
-      if (query && query.trim() !== '') {
-        // Try simpler filter syntax
-        params.filter = `general.name=="*${query}*"`;
-      }
+    if (!this.isProApiUnavailable('computers-inventory')) {
+      try {
+        logger.info('Searching computers using Jamf Pro API...');
+        const params: Record<string, string | number> = {
+          'page-size': limit,
+        };
       
-      const response = await this.axiosInstance.get('/api/v1/computers-inventory', {
-        params,
-      });
+        // Only add filter if there's a query
+        if (query && query.trim() !== '') {
+          // Try simpler filter syntax
+          params.filter = `general.name=="*${query}*"`;
+        }
       
-      // Transform modern response
-      return response.data.results.map((computer: any) => ({
-        id: computer.id,
-        name: computer.general?.name || '',
-        udid: computer.general?.udid || '',
-        serialNumber: computer.general?.serialNumber || '',
-        lastContactTime: computer.general?.lastContactTime,
-        lastReportDate: computer.general?.lastReportDate,
-        osVersion: computer.operatingSystem?.version,
-        ipAddress: computer.general?.lastIpAddress,
-        macAddress: computer.general?.macAddress,
-        assetTag: computer.general?.assetTag,
-        modelIdentifier: computer.hardware?.modelIdentifier,
-      }));
-    } catch (error) {
-      const axiosError = error as AxiosError;
-      if (axiosError.response?.status === 403) {
-        logger.debug('Jamf Pro API search returned 403, trying Classic API...');
-      } else {
-        logger.debug('Jamf Pro API search failed, falling back to Classic API', {
-          error: error instanceof Error ? error.message : String(error),
-          status: axiosError.response?.status
+        const response = await this.axiosInstance.get('/api/v1/computers-inventory', {
+          params,
         });
+      
+        // Transform modern response
+        return response.data.results.map((computer: any) => ({
+          id: computer.id,
+          name: computer.general?.name || '',
+          udid: computer.general?.udid || '',
+          serialNumber: computer.general?.serialNumber || '',
+          lastContactTime: computer.general?.lastContactTime,
+          lastReportDate: computer.general?.lastReportDate,
+          osVersion: computer.operatingSystem?.version,
+          ipAddress: computer.general?.lastIpAddress,
+          macAddress: computer.general?.macAddress,
+          assetTag: computer.general?.assetTag,
+          modelIdentifier: computer.hardware?.modelIdentifier,
+        }));
+      } catch (error) {
+        this.markProApiUnavailable('computers-inventory', error, true);
+        const axiosError = error as AxiosError;
+        if (axiosError.response?.status === 403) {
+          logger.debug('Jamf Pro API search returned 403, trying Classic API...');
+        } else {
+          logger.debug('Jamf Pro API search failed, falling back to Classic API', {
+            error: error instanceof Error ? error.message : String(error),
+            status: axiosError.response?.status
+          });
+        }
       }
     }
     
@@ -530,22 +585,22 @@ export class JamfApiClientHybrid implements IJamfApiClient {
    */
   private async searchComputersViaAdvancedSearch(query: string, limit: number): Promise<Computer[]> {
     const searchId = await this.findBestAdvancedSearch();
+    const index = await this.getAdvancedSearchIndex(searchId);
     
-    const response = await this.axiosInstance.get(`/JSSResource/advancedcomputersearches/id/${searchId}`);
-    const allComputers = response.data.advanced_computer_search?.computers || [];
-    
-    let filteredComputers = allComputers;
+    let filteredComputers: any[] = [];
     if (query) {
       const lowerQuery = query.toLowerCase();
-      filteredComputers = allComputers.filter((c: any) => {
-        const searchableFields = [
-          c.name, c.Computer_Name, c.Serial_Number, c.IP_Address
-        ].filter(Boolean).map(f => f.toLowerCase());
-        return searchableFields.some(field => field.includes(lowerQuery));
-      });
+      for (const entry of index) {
+        if (entry.haystack.includes(lowerQuery)) {
+          filteredComputers.push(entry.computer);
+          if (filteredComputers.length >= limit) break;
+        }
+      }
+    } else {
+      filteredComputers = index.slice(0, limit).map(entry => entry.computer);
     }
     
-    return filteredComputers.slice(0, limit).map((c: any) => ({
+    return filteredComputers.map((c: any) => ({
       id: String(c.id),
       name: c.name || c.Computer_Name || '',
       udid: c.udid || '',
@@ -560,6 +615,27 @@ export class JamfApiClientHybrid implements IJamfApiClient {
     }));
   }
 
+  /**
+   * Fetch an Advanced Search's computers with their searchable fields lowercased
+   * once, so each query is a substring scan instead of a refetch. Inventory
+   * writes invalidate it along with the searchComputers entries.
+   */
+  private getAdvancedSearchIndex(searchId: number): Promise<Array<{ computer: any; haystack: string }>> {
+    return this.cachedGet(`advancedSearchIndex:${searchId}`, async () => {
+      const response = await this.axiosInstance.get(`/JSSResource/advancedcomputersearches/id/${searchId}`);
+      const allComputers = response.data.advanced_computer_search?.computers || [];
+
+      // Newline-separated so a query cannot match across two fields
+      return allComputers.map((c: any) => ({
+        computer: c,
+        haystack: [c.name, c.Computer_Name, c.Serial_Number, c.IP_Address]
+          .filter(Boolean)
+          .join('\n')
+          .toLowerCase(),
+      }));
+    });
+  }
+
   /**
    * Find the best Advanced Search to use
    */
@@ -603,18 +679,21 @@ export class JamfApiClientHybrid implements IJamfApiClient {
     await this.ensureAuthenticated();
     
     // Try Jamf Pro API first
-    try {
-      logger.info(`Getting computer details for ${id} using Jamf Pro API...`);
-      const response = await this.axiosInstance.get(`/api/v1/computers-inventory-detail/${id}`);
-      return response.data;
-    } catch (error) {
-      const axiosError = error as AxiosError;
-      logger.debug('Jamf Pro API computer details failed, falling back to Classic API', {
-        status: axiosError.response?.status,
-        error: error instanceof Error ? error.message : String(error),
-        computerId: id
-      });
-      // Fall back to Classic API for any error
+    if (!this.isProApiUnavailable('computers-inventory-detail')) {
+      try {
+        logger.info(`Getting computer details for ${id} using Jamf Pro API...`);
+        const response = await this.axiosInstance.get(`/api/v1/computers-inventory-detail/${id}`);
+        return response.data;
+      } catch (error) {
+        this.markProApiUnavailable('computers-inventory-detail', error, false);
+        const axiosError = error as AxiosError;
+        logger.debug('Jamf Pro API computer details failed, falling back to Classic API', {
+          status: axiosError.response?.status,
+          error: error instanceof Error ? error.message : String(error),
+          computerId: id
+        });
+        // Fall back to Classic API for any error
+      }
     }
     
     // Try Classic API
@@ -672,6 +751,7 @@ export class JamfApiClientHybrid implements IJamfApiClient {
       this.invalidateCache(`computerDetails:${id}`);
     }
     this.invalidateCache('searchComputers');
+    this.invalidateCache('advancedSearchIndex');
     if (this.readOnlyMode) {
       throw new Error('Cannot execute policies in read-only mode');
     }
@@ -689,6 +769,7 @@ export class JamfApiClientHybrid implements IJamfApiClient {
       this.invalidateCache(`computerDetails:${id}`);
     }
     this.invalidateCache('searchComputers');
+    this.invalidateCache('advancedSearchIndex');
     if (this.readOnlyMode) {
       throw new Error('Cannot deploy scripts in read-only mode');
     }
@@ -706,6 +787,7 @@ export class JamfApiClientHybrid implements IJamfApiClient {
   async updateInventory(deviceId: string): Promise<void> {
     this.invalidateCache(`computerDetails:${deviceId}`);
     this.invalidateCache('searchComputers');
+    this.invalidateCache('advancedSearchIndex');
     if (this.readOnlyMode) {
       throw new Error('Cannot update inventory in read-only mode');
     }
@@ -810,15 +892,18 @@ export class JamfApiClientHybrid implements IJamfApiClient {
     await this.ensureAuthenticated();
     
     // Try Jamf Pro API first
-    try {
-      logger.info('Creating policy using Jamf Pro API...');
-      logger.info('Policy data:', JSON.stringify(policyData, null, 2));
-      const response = await this.axiosInstance.post('/api/v1/policies', policyData);
-      return response.data;
-    } catch (error) {
-      logger.debug(`Jamf Pro API failed with status ${getAxiosErrorStatus(error)}, trying Classic API...`);
-      logger.debug('Error details:', getAxiosErrorData(error));
-      // Fall back to Classic API for any error
+    if (!this.isProApiUnavailable('policies:create')) {
+      try {
+        logger.info('Creating policy using Jamf Pro API...');
+        logger.info('Policy data:', JSON.stringify(policyData, null, 2));
+        const response = await this.axiosInstance.post('/api/v1/policies', policyData);
+        return response.data;
+      } catch (error) {
+        this.markProApiUnavailable('policies:create', error, true);
+        logger.debug(`Jamf Pro API failed with status ${getAxiosErrorStatus(error)}, trying Classic API...`);
+        logger.debug('Error details:', getAxiosErrorData(error));
+        // Fall back to Classic API for any error
+      }
     }
     
     // Fall back to Classic API with XML format
@@ -872,14 +957,17 @@ export class JamfApiClientHybrid implements IJamfApiClient {
     await this.ensureAuthenticated();
     
     // Try Jamf Pro API first
-    try {
-      logger.info(`Updating policy ${policyId} using Jamf Pro API...`);
-      const response = await this.axiosInstance.put(`/api/v1/policies/${policyId}`, policyData);
-      return response.data;
-    } catch (error) {
-      logger.debug(`Jamf Pro API failed with status ${getAxiosErrorStatus(error)}, trying Classic API...`);
-      logger.debug('Error details:', getAxiosErrorData(error));
-      // Fall back to Classic API for any error
+    if (!this.isProApiUnavailable('policies:update')) {
+      try {
+        logger.info(`Updating policy ${policyId} using Jamf Pro API...`);
+        const response = await this.axiosInstance.put(`/api/v1/policies/${policyId}`, policyData);
+        return response.data;
+      } catch (error) {
+        this.markProApiUnavailable('policies:update', error, false);
+        logger.debug(`Jamf Pro API failed with status ${getAxiosErrorStatus(error)}, trying Classic API...`);
+        logger.debug('Error details:', getAxiosErrorData(error));
+        // Fall back to Classic API for any error
+      }
     }
     
     // Fall back to Classic API with XML format
@@ -1356,6 +1444,7 @@ export class JamfApiClientHybrid implements IJamfApiClient {
         this.invalidateCache(`computerDetails:${id}`);
       }
       this.invalidateCache('searchComputers');
+      this.invalidateCache('advancedSearchIndex');
     }
     if (this.readOnlyMode) {
       throw new Error('Cannot deploy configuration profiles in read-only mode');
@@ -1437,6 +1526,7 @@ export class JamfApiClientHybrid implements IJamfApiClient {
         this.invalidateCache(`computerDetails:${id}`);
       }
       this.invalidateCache('searchComputers');
+      this.invalidateCache('advancedSearchIndex');
     }
     if (this.readOnlyMode) {
       throw new Error('Cannot remove configuration profiles in read-only mode');
@@ -3674,6 +3764,7 @@ export class JamfApiClientHybrid implements IJamfApiClient {
   async sendComputerMDMCommand(deviceId: string, command: string): Promise<any> {
     this.invalidateCache(`computerDetails:${deviceId}`);
     this.invalidateCache('searchComputers');
+    this.invalidateCache('advancedSearchIndex');
     if (this.readOnlyMode) {
       throw new Error('Cannot send MDM commands in read-only mode');
     }
@@ -3748,6 +3839,7 @@ export class JamfApiClientHybrid implements IJamfApiClient {
   async flushMDMCommands(deviceId: string, commandStatus: string): Promise<void> {
     this.invalidateCache(`computerDetails:${deviceId}`);
     this.invalidateCache('searchComputers');
+    this.invalidateCache('advancedSearchIndex');
     if (this.readOnlyMode) {
       throw new Error('Cannot flush MDM commands in read-only mode');
     }
@@ -4158,6 +4250,7 @@ export class JamfApiClientHybrid implements IJamfApiClient {
    */
   async createComputerExtensionAttribute(data: any): Promise<any> {
     this.invalidateCache('searchComputers');
+    this.invalidateCache('advancedSearchIndex');
     if (this.readOnlyMode) {
       throw new Error('Cannot create Extension Attributes in read-only mode');
     }
@@ -4200,6 +4293,7 @@ export class JamfApiClientHybrid implements IJamfApiClient {
   async updateComputerExtensionAttribute(attributeId: string, data: any): Promise<any> {
     this.invalidateCache('computerDetails');
     this.invalidateCache('searchComputers');
+    this.invalidateCache('advancedSearchIndex');
     if (this.readOnlyMode) {
       throw new Error('Cannot update Extension Attributes in read-only mode');
     }
@@ -4242,6 +4336,7 @@ export class JamfApiClientHybrid implements IJamfApiClient {
   async deleteComputerExtensionAttribute(attributeId: string): Promise<void> {
     this.invalidateCache('computerDetails');
     this.invalidateCache('searchComputers');
+    this.invalidateCache('advancedSearchIndex');
     if (this.readOnlyMode) {
       throw new Error('Cannot delete Extension Attributes in read-only mode');
     }
@@ -1,4 +1,5 @@
 import { Request, Response, NextFunction } from 'express';
+import { createSecretKey, KeyObject } from 'crypto';
 import jwt from 'jsonwebtoken';
 import jwksRsa from 'jwks-rsa';
 import { createLogger } from './logger.js';
@@ -18,9 +19,21 @@ const jwksClientsCache = new LRUCache<jwksRsa.JwksClient>({
   }
 });
 
+// Recently verified Auth0/Okta tokens, so a client sending the same bearer token
+// on every request skips the JWKS lookup and signature check. Entries are
+// short-lived and the expiry check in authMiddleware still runs on every hit.
+const VERIFIED_TOKEN_CACHE_SIZE = 1024;
+const VERIFIED_TOKEN_CACHE_TTL = 60000; // 1 minute
+
+const verifiedTokensCache = new LRUCache<TokenPayload>({
+  maxSize: VERIFIED_TOKEN_CACHE_SIZE,
+  maxAge: VERIFIED_TOKEN_CACHE_TTL,
+});
+
 // Periodic cleanup of expired entries
 const cleanupInterval = setInterval(() => {
   jwksClientsCache.cleanExpired();
+  verifiedTokensCache.cleanExpired();
   logger.debug('JWKS cache cleanup completed', jwksClientsCache.getStats());
 }, 300000); // Clean every 5 minutes
 
@@ -35,6 +48,20 @@ interface TokenPayload {
   [key: string]: any;
 }
 
+// Dev-mode HMAC key, derived once per secret. Passing a string makes
+// jsonwebtoken try to parse it as a public key and then build a secret key on
+// every verify.
+let devSecret: string | null = null;
+let devSecretKey: KeyObject | null = null;
+
+const getDevSecretKey = (secret: string): KeyObject => {
+  if (secret !== devSecret || !devSecretKey) {
+    devSecretKey = createSecretKey(Buffer.from(secret, 'utf8'));
+    devSecret = secret;
+  }
+  return devSecretKey;
+};
+
 // Get or create JWKS client with LRU caching
 const getJwksClient = (domain: string): jwksRsa.JwksClient => {
   const cacheKey = domain;
@@ -157,12 +184,30 @@ const validateOktaToken = async (token: string): Promise<TokenPayload> => {
 
 // Validate token based on provider
 const validateToken = async (token: string): Promise<TokenPayload> => {
-  if (!token || typeof token !== 'string') {
+  // Reject anything that is not a three-part JWT before any key lookup or crypto
+  if (!token || typeof token !== 'string' || token.split('.', 4).length !== 3) {
     throw new Error('Invalid token format');
   }
 
   const provider = process.env.OAUTH_PROVIDER || 'auth0';
-  
+  // Dev tokens are checked against the current secret every time; HMAC is cheap
+  if (provider === 'dev') {
+    return verifyToken(provider, token);
+  }
+
+  const cacheKey = `${provider}:${token}`;
+  const cached = verifiedTokensCache.get(cacheKey);
+  if (cached) {
+    return cached;
+  }
+
+  const payload = await verifyToken(provider, token);
+  verifiedTokensCache.set(cacheKey, payload);
+  return payload;
+};
+
+// Verify a token's signature and claims with the configured provider
+const verifyToken = async (provider: string, token: string): Promise<TokenPayload> => {
   try {
     switch (provider) {
       case 'auth0':
@@ -180,7 +225,7 @@ const validateToken = async (token: string): Promise<TokenPayload> => {
         if (!secret) {
           throw new Error('JWT_SECRET not configured for dev mode');
         }
-        return jwt.verify(token, secret) as TokenPayload;
+        return jwt.verify(token, getDevSecretKey(secret)) as TokenPayload;
       }
         
       default:
@@ -245,10 +290,17 @@ export const authMiddleware = async (
     // Validate token
     const decoded = await validateToken(token);
     
-    // Check token expiration
-    if (decoded.exp && decoded.exp * 1000 < Date.now()) {
-      res.status(401).json({ error: 'Token has expired' });
-      return;
+    // Check token expiration (exp is in whole seconds). This also covers tokens
+    // served from the verified-token cache.
+    if (decoded.exp !== undefined) {
+      if (typeof decoded.exp !== 'number' || !Number.isFinite(decoded.exp)) {
+        res.status(401).json({ error: 'Invalid token expiration' });
+        return;
+      }
+      if (Math.floor(Date.now() / 1000) >= decoded.exp) {
+        res.status(401).json({ error: 'Token has expired' });
+        return;
+      }
     }
     
     // Add user information to request
@@ -317,4 +369,7 @@ export const cleanupAuthMiddleware = (): void => {
   logger.info('Cleaning up auth middleware resources');
   clearInterval(cleanupInterval);
   jwksClientsCache.clear();
+  verifiedTokensCache.clear();
+  devSecret = null;
+  devSecretKey = null;
 };
\ No newline at end of file
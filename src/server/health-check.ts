@@ -36,10 +36,20 @@ export interface CheckResult {
   duration?: number;
 }
 
+let cachedVersion: string | null = null;
+
 /**
- * Get application version
+ * Get application version (read once; health probes must not hit the disk
+ * synchronously on every request)
  */
 function getVersion(): string {
+  if (cachedVersion === null) {
+    cachedVersion = readVersion();
+  }
+  return cachedVersion;
+}
+
+function readVersion(): string {
   try {
     const __filename = fileURLToPath(import.meta.url);
     const __dirname = dirname(__filename);
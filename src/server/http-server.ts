@@ -38,14 +38,95 @@ const port = parseInt(process.env.PORT || '3000', 10);
 // Initialize Skills Manager
 const skillsManager = new SkillsManager();
 
-// Initialize Jamf client for skills
-const jamfClientForSkills = new JamfApiClientHybrid({
+// One Jamf client for the whole process: it owns the auth token, the response
+// cache and the keep-alive connections, so handlers must not create their own
+const jamfClient = new JamfApiClientHybrid({
   baseUrl: process.env.JAMF_URL!,
   clientId: process.env.JAMF_CLIENT_ID,
   clientSecret: process.env.JAMF_CLIENT_SECRET,
   username: process.env.JAMF_USERNAME,
   password: process.env.JAMF_PASSWORD,
   readOnlyMode: process.env.JAMF_READ_ONLY === 'true',
+  // TLS/SSL configuration - only disable for development with self-signed certs
+  rejectUnauthorized: process.env.JAMF_ALLOW_INSECURE !== 'true',
+});
+
+// Static JSON-RPC and discovery payloads, built once instead of per request
+const RPC_INITIALIZE_RESULT = {
+  protocolVersion: '2025-03-26',
+  capabilities: {
+    tools: {
+      listTools: true
+    },
+    resources: {
+      list: true,
+      read: true
+    },
+    prompts: {
+      list: true
+    }
+  },
+  serverInfo: {
+    name: 'Jamf MCP Server',
+    version: '1.0.0'
+  }
+};
+
+const RPC_BASIC_TOOLS = [
+  {
+    name: 'search_computers',
+    description: 'Search for computers in Jamf Pro',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        query: {
+          type: 'string',
+          description: 'Search query'
+        }
+      }
+    }
+  },
+  {
+    name: 'check_compliance',
+    description: 'Check device compliance status',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        days: {
+          type: 'number',
+          description: 'Days since last check-in'
+        }
+      }
+    }
+  }
+];
+
+// Fully static responses are also serialized once
+const WELL_KNOWN_MCP_JSON = JSON.stringify({
+  "mcp_version": "1.0",
+  "name": "Jamf MCP Server",
+  "description": "MCP server for Jamf Pro device management",
+  "icon_url": null,
+  "capabilities": {
+    "authentication": {
+      "type": "oauth2",
+      "oauth2": {
+        "authorization_url": "https://glance-rosa-sec-tone.trycloudflare.com/auth/authorize",
+        "token_url": "https://glance-rosa-sec-tone.trycloudflare.com/auth/token",
+        "scopes": ["read", "write"]
+      }
+    }
+  }
+});
+
+const MCP_V1_INFO_JSON = JSON.stringify({
+  version: '1.0.0',
+  protocol: 'mcp',
+  capabilities: {
+    tools: true,
+    resources: true,
+    prompts: true
+  }
 });
 
 // Security middleware
@@ -64,7 +145,9 @@ app.use(compression());
 
 // Body parsing with size limits
 app.use(express.json({ limit: '10mb' }));
-app.use(express.urlencoded({ extended: true, limit: '10mb' }));
+// Form bodies here (OAuth token requests) are flat key/value pairs, so the
+// querystring parser is enough; qs would build nested objects and arrays
+app.use(express.urlencoded({ extended: false, limit: '10mb' }));
 
 // Request ID and security headers validation
 app.use(requestIdMiddleware);
@@ -109,13 +192,14 @@ app.use(chatGPTOptimizationMiddleware);
 app.use((req: Request, res: Response, next: NextFunction) => {
   const start = Date.now();
   
-  // Log incoming request details for debugging
-  logger.info(`Incoming request: ${req.method} ${req.url}`, {
-    headers: req.headers,
-    query: req.query,
-    body: req.body,
-    ip: req.ip
-  });
+  // Log incoming request details for debugging. Headers and bodies are not
+  // logged: they can be large and carry bearer tokens.
+  if (logger.isDebugEnabled()) {
+    logger.debug(`Incoming request: ${req.method} ${req.url}`, {
+      query: req.query,
+      ip: req.ip
+    });
+  }
   
   res.on('finish', () => {
     const duration = Date.now() - start;
@@ -125,7 +209,7 @@ app.use((req: Request, res: Response, next: NextFunction) => {
 });
 
 // Initialize skills manager for HTTP context
-initializeSkillsForHttp(skillsManager, jamfClientForSkills);
+initializeSkillsForHttp(skillsManager, jamfClient);
 
 // Mount skills router
 app.use('/api/v1/skills', createSkillsRouter(skillsManager));
@@ -152,17 +236,6 @@ if (process.env.NODE_ENV === 'development') {
   });
   
   // Simple REST endpoints for ChatGPT
-  const jamfClient = new JamfApiClientHybrid({
-    baseUrl: process.env.JAMF_URL!,
-    clientId: process.env.JAMF_CLIENT_ID,
-    clientSecret: process.env.JAMF_CLIENT_SECRET,
-    username: process.env.JAMF_USERNAME,
-    password: process.env.JAMF_PASSWORD,
-    readOnlyMode: process.env.JAMF_READ_ONLY === 'true',
-    // TLS/SSL configuration - only disable for development with self-signed certs
-    rejectUnauthorized: process.env.JAMF_ALLOW_INSECURE !== 'true',
-  });
-  
   app.get('/chatgpt/devices/search', async (req: Request, res: Response) => {
     try {
       const query = req.query.query as string || '';
@@ -257,60 +330,12 @@ app.post('/', async (req: Request, res: Response) => {
       res.json({
         jsonrpc: '2.0',
         id,
-        result: {
-          protocolVersion: '2025-03-26',
-          capabilities: {
-            tools: {
-              listTools: true
-            },
-            resources: {
-              list: true,
-              read: true
-            },
-            prompts: {
-              list: true
-            }
-          },
-          serverInfo: {
-            name: 'Jamf MCP Server',
-            version: '1.0.0'
-          }
-        }
+        result: RPC_INITIALIZE_RESULT
       });
     } else if (method === 'tools/list') {
       // List available tools including skills
-      const basicTools = [
-        {
-          name: 'search_computers',
-          description: 'Search for computers in Jamf Pro',
-          inputSchema: {
-            type: 'object',
-            properties: {
-              query: {
-                type: 'string',
-                description: 'Search query'
-              }
-            }
-          }
-        },
-        {
-          name: 'check_compliance',
-          description: 'Check device compliance status',
-          inputSchema: {
-            type: 'object',
-            properties: {
-              days: {
-                type: 'number',
-                description: 'Days since last check-in'
-              }
-            }
-          }
-        }
-      ];
-      
-      // Add skill tools
       const skillTools = getSkillTools(skillsManager);
-      const allTools = [...basicTools, ...skillTools];
+      const allTools = [...RPC_BASIC_TOOLS, ...skillTools];
       
       res.json({
         jsonrpc: '2.0',
@@ -329,15 +354,6 @@ app.post('/', async (req: Request, res: Response) => {
       logger.info(`Tool call: ${name}`, { args });
       
       try {
-        const jamfClient = new JamfApiClientHybrid({
-          baseUrl: process.env.JAMF_URL!,
-          clientId: process.env.JAMF_CLIENT_ID,
-          clientSecret: process.env.JAMF_CLIENT_SECRET,
-          username: process.env.JAMF_USERNAME,
-          password: process.env.JAMF_PASSWORD,
-          readOnlyMode: process.env.JAMF_READ_ONLY === 'true',
-        });
-        
         let result;
         if (name === 'search_computers') {
           const devices = await jamfClient.searchComputers(args.query || '');
@@ -380,7 +396,9 @@ app.post('/', async (req: Request, res: Response) => {
             content: [
               {
                 type: 'text',
-                text: JSON.stringify(result, null, 2)
+                // Compact: this text is escaped again inside the JSON-RPC body,
+                // where indentation would only add bytes
+                text: JSON.stringify(result)
               }
             ]
           }
@@ -421,32 +439,17 @@ app.post('/', async (req: Request, res: Response) => {
 
 // MCP discovery endpoint
 app.get('/.well-known/mcp', (_req: Request, res: Response) => {
-  res.json({
-    "mcp_version": "1.0",
-    "name": "Jamf MCP Server",
-    "description": "MCP server for Jamf Pro device management",
-    "icon_url": null,
-    "capabilities": {
-      "authentication": {
-        "type": "oauth2",
-        "oauth2": {
-          "authorization_url": "https://glance-rosa-sec-tone.trycloudflare.com/auth/authorize",
-          "token_url": "https://glance-rosa-sec-tone.trycloudflare.com/auth/token",
-          "scopes": ["read", "write"]
-        }
-      }
-    }
-  });
+  res.type('application/json').send(WELL_KNOWN_MCP_JSON);
 });
 
 // Health check endpoints
 app.get('/health', basicHealthCheck);
 app.get('/health/detailed', (req: Request, res: Response) => {
-  detailedHealthCheck(req, res, jamfClientForSkills);
+  detailedHealthCheck(req, res, jamfClient);
 });
 app.get('/health/live', livenessProbe);
 app.get('/health/ready', (req: Request, res: Response) => {
-  readinessProbe(req, res, jamfClientForSkills);
+  readinessProbe(req, res, jamfClient);
 });
 
 // OAuth endpoints for ChatGPT with validation
@@ -456,15 +459,7 @@ app.post('/auth/token', validateTokenRefresh, handleTokenRefresh);
 
 // MCP-specific endpoint that ChatGPT might look for
 app.get('/mcp/v1', (_req: Request, res: Response) => {
-  res.json({
-    version: '1.0.0',
-    protocol: 'mcp',
-    capabilities: {
-      tools: true,
-      resources: true,
-      prompts: true
-    }
-  });
+  res.type('application/json').send(MCP_V1_INFO_JSON);
 });
 
 // Validate environment configuration on startup
@@ -519,16 +514,6 @@ app.use('/mcp', authMiddleware, async (req: Request, res: Response) => {
       }
     );
 
-    // Initialize Jamf client with environment variables
-    const jamfClient = new JamfApiClientHybrid({
-      baseUrl: process.env.JAMF_URL!,
-      clientId: process.env.JAMF_CLIENT_ID,
-      clientSecret: process.env.JAMF_CLIENT_SECRET,
-      username: process.env.JAMF_USERNAME,
-      password: process.env.JAMF_PASSWORD,
-      readOnlyMode: process.env.JAMF_READ_ONLY === 'true',
-    });
-
     // Register handlers
     registerTools(server, jamfClient as any);
     registerResources(server, jamfClient as any);
@@ -543,14 +528,6 @@ app.use('/mcp', authMiddleware, async (req: Request, res: Response) => {
     
     logger.info(`MCP connection established for user: ${(req as any).user?.sub || 'unknown'}`);
 
-    // Handle client disconnect
-    req.on('close', () => {
-      logger.info('Client disconnected');
-      if (transport) {
-        transport.close();
-      }
-    });
-
     // Keep connection alive with periodic pings
     const pingInterval = setInterval(() => {
       if (res.writable) {
@@ -560,9 +537,18 @@ app.use('/mcp', authMiddleware, async (req: Request, res: Response) => {
       }
     }, 30000); // 30 seconds
 
-    // Clean up on connection close
+    // Handle client disconnect: stop pinging and close the session. Closing the
+    // server also closes its transport; the result is handled here so a failing
+    // close is logged rather than surfacing as an unhandled rejection.
+    const connectedServer = server;
     req.on('close', () => {
+      logger.info('Client disconnected');
       clearInterval(pingInterval);
+      connectedServer.close().catch((error) => {
+        logger.warn('Failed to close MCP session', {
+          error: error instanceof Error ? error.message : String(error),
+        });
+      });
     });
 
   } catch (error) {
@@ -579,9 +565,7 @@ app.use('/mcp', authMiddleware, async (req: Request, res: Response) => {
 // 404 handler
 app.use((req: Request, res: Response) => {
   logger.warn(`404 - Route not found: ${req.method} ${req.url}`, {
-    headers: req.headers,
-    body: req.body,
-    query: req.query
+    ip: req.ip
   });
   res.status(404).json({ 
     error: 'Not found',
@@ -627,6 +611,9 @@ try {
     logger.info(`Environment: ${process.env.NODE_ENV || 'development'}`);
     logger.info(`Health check: http://localhost:${port}/health`);
     logger.info(`MCP endpoint: http://localhost:${port}/mcp`);
+
+    // Authenticate with Jamf now rather than on the first client request
+    jamfClient.warmUp();
     
     // Register shutdown handler after server starts
     registerShutdownHandler(
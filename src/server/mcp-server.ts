@@ -0,0 +1,69 @@
+import { Server } from '@modelcontextprotocol/sdk/server/index.js';
+import { JamfApiClientHybrid } from '../jamf-client-hybrid.js';
+import { registerTools } from '../tools/index.js';
+import { registerResources } from '../resources/index.js';
+import { registerPrompts } from '../prompts/index.js';
+import { SkillsManager } from '../skills/manager.js';
+import { registerSkillsAsMCPTools } from '../tools/skills-mcp-integration.js';
+
+export const SERVER_INSTRUCTIONS = `You are connected to a Jamf Pro MDM server managing Apple devices (macOS, iOS, iPadOS, tvOS).
+
+## Quick Start — Common Questions
+- "How's my fleet?" → Use \`getFleetOverview\` (single call replaces 4-6 individual calls)
+- "Tell me about device X" → Use \`getDeviceFullProfile\` with name, serial, or ID
+- "What's our security posture?" → Use \`getSecurityPosture\` for encryption, compliance, OS currency
+- "How is policy X performing?" → Use \`getPolicyAnalysis\` with policy ID or name
+
+## Tool Categories (by prefix)
+- **Read-only (safe):** \`search*\`, \`list*\`, \`get*\`, \`check*\` — no side effects
+- **Write/create:** \`create*\`, \`clone*\`, \`update*\`, \`set*\` — modifies configuration
+- **Destructive (confirm required):** \`execute*\`, \`deploy*\`, \`send*\`, \`delete*\`, \`flush*\`, \`remove*\` — affects devices or deletes data
+
+## Performance Tips
+1. **Prefer compound tools** (\`getFleetOverview\`, \`getDeviceFullProfile\`, \`getSecurityPosture\`, \`getPolicyAnalysis\`) — they run parallel API calls internally
+2. **Use \`getDevicesBatch\`** instead of calling \`getDeviceDetails\` in a loop
+3. **Use resources** (jamf://reports/*) for pre-aggregated reports like compliance, encryption, OS versions
+4. **Use \`getInventorySummary\`** for fleet-wide inventory stats without fetching individual devices
+
+## Response Format
+Many tools return enriched responses with:
+- \`summary\`: Human-readable 1-2 sentence overview
+- \`suggestedNextActions\`: Array of recommended follow-up tool calls
+- \`data\`: The full API response data
+- \`metadata\`: Result count, timestamp
+
+## Important Notes
+- All destructive tools require \`confirm: true\` parameter
+- Device identifiers can be Jamf IDs, serial numbers, or device names (compound tools resolve automatically)
+- The server supports both the Jamf Pro API and Classic API with automatic fallback`;
+
+/**
+ * Build a fully registered Jamf MCP server (tools, resources, prompts, skills).
+ * Shared by the stdio/socket entry point and the agent's in-process transport.
+ */
+export function createMcpServer(jamfClient: JamfApiClientHybrid, skillsManager: SkillsManager): Server {
+  const server = new Server(
+    {
+      name: 'jamf-mcp-server',
+      version: '1.2.0',
+    },
+    {
+      capabilities: {
+        tools: {},
+        resources: {},
+        prompts: {},
+      },
+      instructions: SERVER_INSTRUCTIONS,
+    }
+  );
+
+  // Register handlers
+  registerTools(server, jamfClient);
+  registerResources(server, jamfClient);
+  registerPrompts(server);
+
+  // Register skills as MCP tools
+  registerSkillsAsMCPTools(server, skillsManager, jamfClient);
+
+  return server;
+}
@@ -4,11 +4,50 @@
  */
 
 import { Router, Request, Response } from 'express';
+import { createHash, randomUUID } from 'crypto';
 import { SkillsManager } from '../skills/manager.js';
 import { logger } from './logger.js';
+import { LRUCache } from '../utils/lru-cache.js';
+import { stableStringify } from '../utils/stable-stringify.js';
+
+// Clients retry skill executions they did not see complete; a retry carrying the
+// same Idempotency-Key gets the original result instead of running the skill again
+const IDEMPOTENCY_CACHE_SIZE = 500;
+const IDEMPOTENCY_CACHE_TTL = 600000; // 10 minutes
+
+interface SkillExecuteResponse {
+  success: boolean;
+  message: string;
+  data?: any;
+  nextActions?: string[];
+}
+
+// A remembered execution, with a fingerprint of the parameters it ran with
+interface IdempotentExecution {
+  parametersHash: string;
+  response: Promise<SkillExecuteResponse>;
+}
+
+// Executions started with `Prefer: respond-async`, polled by id
+interface DeferredExecution {
+  caller?: string; // `sub` of the token that started it; only that caller may poll
+  skill: string;
+  status: 'running' | 'completed' | 'failed';
+  result?: SkillExecuteResponse;
+  error?: string;
+}
 
 export function createSkillsRouter(skillsManager: SkillsManager): Router {
   const router = Router();
+  // In-flight and completed executions, so concurrent retries share one run
+  const executions = new LRUCache<IdempotentExecution>({
+    maxSize: IDEMPOTENCY_CACHE_SIZE,
+    maxAge: IDEMPOTENCY_CACHE_TTL,
+  });
+  const deferredExecutions = new LRUCache<DeferredExecution>({
+    maxSize: IDEMPOTENCY_CACHE_SIZE,
+    maxAge: IDEMPOTENCY_CACHE_TTL,
+  });
 
   /**
    * Execute a skill
@@ -28,20 +67,84 @@ export function createSkillsRouter(skillsManager: SkillsManager): Router {
       logger.info(`Executing skill: ${skill}`, { 
         skill, 
         parameters,
-        client: req.headers['user-agent']?.includes('ChatGPT') ? 'ChatGPT' : 'Unknown'
+        client: res.locals.isChatGPT ? 'ChatGPT' : 'Unknown'
       });
 
-      const result = await skillsManager.executeSkill(skill, parameters || {});
+      const idempotencyKey = req.get('Idempotency-Key');
+      let cacheKey: string | null = null;
+      let parametersHash = '';
+      let remembered: IdempotentExecution | undefined;
+      let execution: Promise<SkillExecuteResponse>;
 
-      // Format response for ChatGPT compatibility
-      const response = {
-        success: result.success,
-        message: result.message,
-        data: result.data,
-        nextActions: result.nextActions
-      };
+      if (idempotencyKey) {
+        // Keys are scoped to the caller, so one client cannot replay another's
+        // result; without an authenticated identity there is no such scope
+        const caller = (req as any).user?.sub;
+        if (!caller) {
+          return res.status(400).json({
+            success: false,
+            error: 'Idempotency-Key requires an authenticated caller'
+          });
+        }
+        cacheKey = `${caller}:${skill}:${idempotencyKey}`;
+        parametersHash = createHash('sha256')
+          .update(stableStringify(parameters || {}))
+          .digest('hex');
+        remembered = executions.get(cacheKey);
+      }
 
-      res.json(response);
+      if (remembered) {
+        if (remembered.parametersHash !== parametersHash) {
+          return res.status(422).json({
+            success: false,
+            error: 'Idempotency-Key was already used with different parameters'
+          });
+        }
+        logger.info('Replaying skill result for idempotency key', { skill });
+        res.setHeader('Idempotent-Replayed', 'true');
+        execution = remembered.response;
+      } else {
+        execution = skillsManager.executeSkill(skill, parameters || {}).then(result => ({
+          // Format response for ChatGPT compatibility
+          success: result.success,
+          message: result.message,
+          data: result.data,
+          nextActions: result.nextActions
+        }));
+        if (cacheKey) {
+          const key = cacheKey;
+          executions.set(key, { parametersHash, response: execution });
+          // A failed execution may be retried with the same key
+          execution.then(
+            response => { if (!response.success) executions.delete(key); },
+            () => executions.delete(key)
+          );
+        }
+      }
+
+      // Long-running skills can outlast the client's request timeout; with
+      // `Prefer: respond-async` the client gets 202 and polls for the result
+      if (/\brespond-async\b/i.test(req.get('Prefer') || '')) {
+        const executionId = randomUUID();
+        const deferred: DeferredExecution = { caller: (req as any).user?.sub, skill, status: 'running' };
+        deferredExecutions.set(executionId, deferred);
+        execution.then(
+          result => {
+            deferred.status = 'completed';
+            deferred.result = result;
+          },
+          (error: any) => {
+            deferred.status = 'failed';
+            deferred.error = error?.message || String(error);
+          }
+        );
+
+        const statusUrl = `${req.baseUrl}/executions/${executionId}`;
+        res.status(202).location(statusUrl).json({ executionId, status: deferred.status, statusUrl });
+        return;
+      }
+
+      res.json(await execution);
     } catch (error: any) {
       logger.error('Skill execution error', { error: error.message });
       res.status(500).json({
@@ -52,6 +155,24 @@ export function createSkillsRouter(skillsManager: SkillsManager): Router {
     }
   });
 
+  /**
+   * Get the status or result of a deferred skill execution
+   * GET /api/v1/skills/executions/:executionId
+   */
+  router.get('/executions/:executionId', (req: Request, res: Response) => {
+    const deferred = deferredExecutions.get(req.params.executionId);
+    // Another caller's execution is reported as missing rather than forbidden
+    if (!deferred || deferred.caller !== (req as any).user?.sub) {
+      return res.status(404).json({
+        success: false,
+        error: 'Execution not found or expired'
+      });
+    }
+
+    const { caller: _caller, ...execution } = deferred;
+    res.json({ executionId: req.params.executionId, ...execution });
+  });
+
   /**
    * Get skills catalog
    * GET /api/v1/skills/catalog
@@ -153,8 +274,10 @@ export function createSkillsRouter(skillsManager: SkillsManager): Router {
  */
 export function chatGPTOptimizationMiddleware(req: Request, res: Response, next: () => void): void {
   const userAgent = req.headers['user-agent'] || '';
+  // Detected once per request; handlers read res.locals instead of the header
+  res.locals.isChatGPT = userAgent.includes('ChatGPT');
   
-  if (userAgent.includes('ChatGPT')) {
+  if (res.locals.isChatGPT) {
     // Add ChatGPT-specific headers
     res.setHeader('X-ChatGPT-Compatible', 'true');
     
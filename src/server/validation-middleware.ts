@@ -4,27 +4,32 @@ import { createLogger } from './logger.js';
 
 const logger = createLogger('validation');
 
+// Headers that can be used to spoof the requested host or path
+const SUSPICIOUS_HEADERS = [
+  'x-forwarded-host',
+  'x-original-url',
+  'x-rewrite-url',
+];
+
+const ACCEPTED_POST_TYPES = ['application/json', 'application/x-www-form-urlencoded'];
+
 // Security headers validation
 export const validateSecurityHeaders = (req: Request, res: Response, next: NextFunction): void => {
   // Check for suspicious headers
-  const suspiciousHeaders = [
-    'x-forwarded-host',
-    'x-original-url',
-    'x-rewrite-url',
-  ];
-
-  for (const header of suspiciousHeaders) {
-    if (req.headers[header]) {
+  const headers = req.headers;
+  for (const header of SUSPICIOUS_HEADERS) {
+    const value = headers[header];
+    if (value) {
       logger.warn('Suspicious header detected', {
         header,
-        value: req.headers[header],
+        value,
         ip: req.ip,
       });
     }
   }
 
-  // Validate content-type for POST requests
-  if (req.method === 'POST' && !req.is('application/json') && !req.is('application/x-www-form-urlencoded')) {
+  // Validate content-type for POST requests (one content-type parse for both types)
+  if (req.method === 'POST' && !req.is(ACCEPTED_POST_TYPES)) {
     res.status(415).json({ error: 'Unsupported media type' });
     return;
   }
@@ -32,7 +32,17 @@ function extractNameFromPossessive(query: string): string {
  * Prioritized device search
  */
 async function searchDevicesByPriority(context: SkillContext, userQuery: string): Promise<any[]> {
-  const results = [];
+  const results: any[] = [];
+  const seenIds = new Set<string>();
+  const addDevices = (devices: any[]) => {
+    for (const device of devices) {
+      const id = String(device.id);
+      if (!seenIds.has(id)) {
+        seenIds.add(id);
+        results.push(device);
+      }
+    }
+  };
   
   // Priority 1: Search IT devices (most likely for IT staff)
   try {
@@ -41,7 +51,7 @@ async function searchDevicesByPriority(context: SkillContext, userQuery: string)
       limit: 20
     });
     if (itResult.data?.devices) {
-      results.push(...itResult.data.devices);
+      addDevices(itResult.data.devices);
     }
   } catch (error) {
     context.logger?.warn('Failed to search IT devices', error);
@@ -54,7 +64,7 @@ async function searchDevicesByPriority(context: SkillContext, userQuery: string)
       limit: 20
     });
     if (admResult.data?.devices) {
-      results.push(...admResult.data.devices);
+      addDevices(admResult.data.devices);
     }
   } catch (error) {
     context.logger?.warn('Failed to search ADM devices', error);
@@ -68,7 +78,7 @@ async function searchDevicesByPriority(context: SkillContext, userQuery: string)
         limit: 20
       });
       if (generalResult.data?.devices) {
-        results.push(...generalResult.data.devices);
+        addDevices(generalResult.data.devices);
       }
     } catch (error) {
       context.logger?.warn('Failed general search', error);
@@ -108,6 +118,7 @@ export async function deviceSearchOptimized(
         context.logger?.info(`Checking ${candidateDevices.length} devices for user assignments`);
         
         // Check devices one by one with timeout handling
+        const queryLower = cleanQuery.toLowerCase();
         const devicesWithUsers = [];
         for (const device of candidateDevices.slice(0, Math.min(candidateDevices.length, 30))) {
           try {
@@ -121,10 +132,10 @@ export async function deviceSearchOptimized(
               const username = details.userAndLocation.username || '';
               const realName = details.userAndLocation.realName || details.userAndLocation.realname || '';
               const email = details.userAndLocation.email || '';
+              const usernameLower = username.toLowerCase();
               
               // Check if query matches
-              const queryLower = cleanQuery.toLowerCase();
-              if (username.toLowerCase().includes(queryLower) ||
+              if (usernameLower.includes(queryLower) ||
                   realName.toLowerCase().includes(queryLower) ||
                   email.toLowerCase().includes(queryLower)) {
                 device.assignedUser = username;
@@ -134,7 +145,7 @@ export async function deviceSearchOptimized(
                 devicesWithUsers.push(device);
                 
                 // If we found the user's device, we can stop
-                if (username.toLowerCase() === queryLower) {
+                if (usernameLower === queryLower) {
                   context.logger?.info(`Found exact match for user "${cleanQuery}"`);
                   break;
                 }
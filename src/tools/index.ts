@@ -656,2365 +656,2367 @@ const GetWebhookDetailsSchema = z.object({
   webhookId: z.string().describe('The webhook ID'),
 });
 
-export function registerTools(server: Server, jamfClient: IJamfApiClient): void {
-  server.setRequestHandler(ListToolsRequestSchema, async () => {
-    const tools: Tool[] = [
-      // ==========================================
-      // Compound Tools (prefer these for common questions)
-      // ==========================================
-      {
-        name: 'getFleetOverview',
-        description: 'Get a comprehensive fleet overview in a single call. Returns inventory counts, compliance rates, and mobile device summary. Use this FIRST for fleet overview questions like "How is my fleet?" or "Give me a summary."',
-        inputSchema: {
-          type: 'object',
-          properties: {},
-        },
-        annotations: { readOnlyHint: true, destructiveHint: false },
-      },
-      {
-        name: 'getDeviceFullProfile',
-        description: 'Get a complete device profile by name, serial number, or Jamf ID. Resolves the identifier automatically and fetches details, policy logs, and history in parallel. Use for "Tell me about device X" questions.',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            identifier: {
-              type: 'string',
-              description: 'Device name, serial number, or Jamf ID',
-            },
-            includePolicyLogs: {
-              type: 'boolean',
-              description: 'Include recent policy execution logs',
-              default: false,
-            },
-            includeHistory: {
-              type: 'boolean',
-              description: 'Include device history events',
-              default: false,
-            },
-          },
-          required: ['identifier'],
-        },
-        annotations: { readOnlyHint: true, destructiveHint: false },
-      },
-      {
-        name: 'getSecurityPosture',
-        description: 'Analyze fleet security posture: FileVault encryption rates, compliance status, and OS version currency. Samples devices in parallel for efficiency. Use for "What is our security posture?" questions.',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            sampleSize: {
-              type: 'number',
-              description: 'Number of devices to sample for encryption check',
-              default: 20,
-            },
-            complianceDays: {
-              type: 'number',
-              description: 'Number of days for compliance check-in window',
-              default: 30,
-            },
-          },
-        },
-        annotations: { readOnlyHint: true, destructiveHint: false },
-      },
-      {
-        name: 'getPolicyAnalysis',
-        description: 'Analyze a policy by ID or name: configuration, scope, compliance, and performance. Resolves policy name automatically. Use for "How is policy X performing?" questions.',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            policyId: {
-              type: 'string',
-              description: 'The Jamf policy ID to analyze',
-            },
-            policyName: {
-              type: 'string',
-              description: 'Policy name to search for (used if policyId not provided)',
-            },
-          },
-        },
-        annotations: { readOnlyHint: true, destructiveHint: false },
-      },
-      // ==========================================
-      // Device Tools
-      // ==========================================
-      {
-        name: 'searchDevices',
-        description: 'Search for computers in Jamf Pro by name, serial number, IP address, username, or other criteria. For full details on a result, follow up with getDeviceDetails or getDeviceFullProfile. For batch details, use getDevicesBatch.',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            query: {
-              type: 'string',
-              description: 'Search query to find devices',
-            },
-            limit: {
-              type: 'number',
-              description: 'Maximum number of results to return',
-              default: 50,
-            },
-          },
-          required: ['query'],
-        },
-        annotations: { readOnlyHint: true, destructiveHint: false },
-      },
-      {
-        name: 'getDeviceDetails',
-        description: 'Get detailed information about a specific computer including hardware, software, storage, and user details. Requires a Jamf device ID. For lookup by name or serial, use getDeviceFullProfile instead.',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            deviceId: {
-              type: 'string',
-              description: 'The Jamf device ID',
-            },
-          },
-          required: ['deviceId'],
-        },
-        annotations: { readOnlyHint: true, destructiveHint: false },
-      },
-      {
-        name: 'updateInventory',
-        description: 'Force an inventory update on a specific device. This sends an MDM command to the device.',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            deviceId: {
-              type: 'string',
-              description: 'The device ID to update inventory for',
-            },
-          },
-          required: ['deviceId'],
+// Tool definitions are static, so they are built once at module load and shared
+// by every server instance instead of being rebuilt on each tools/list request
+const TOOL_DEFINITIONS: Tool[] = [
+  // ==========================================
+  // Compound Tools (prefer these for common questions)
+  // ==========================================
+  {
+    name: 'getFleetOverview',
+    description: 'Get a comprehensive fleet overview in a single call. Returns inventory counts, compliance rates, and mobile device summary. Use this FIRST for fleet overview questions like "How is my fleet?" or "Give me a summary."',
+    inputSchema: {
+      type: 'object',
+      properties: {},
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'getDeviceFullProfile',
+    description: 'Get a complete device profile by name, serial number, or Jamf ID. Resolves the identifier automatically and fetches details, policy logs, and history in parallel. Use for "Tell me about device X" questions.',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        identifier: {
+          type: 'string',
+          description: 'Device name, serial number, or Jamf ID',
         },
-        annotations: { readOnlyHint: false, destructiveHint: false },
-      },
-      {
-        name: 'checkDeviceCompliance',
-        description: 'Check which devices have not reported within a specified number of days. Use this FIRST for fleet overview questions. For security-focused analysis, use getSecurityPosture instead.',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            days: {
-              type: 'number',
-              description: 'Number of days to check for compliance',
-              default: 30,
-            },
-            includeDetails: {
-              type: 'boolean',
-              description: 'Include detailed device list in response',
-              default: false,
-            },
-          },
-        },
-        annotations: { readOnlyHint: true, destructiveHint: false },
-      },
-      {
-        name: 'getDevicesBatch',
-        description: 'Get details for multiple devices in a single request. Use INSTEAD of calling getDeviceDetails in a loop. Pass an array of device IDs.',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            deviceIds: {
-              type: 'array',
-              items: {
-                type: 'string',
-              },
-              description: 'Array of device IDs to fetch details for',
-            },
-            includeBasicOnly: {
-              type: 'boolean',
-              description: 'Return only basic info to reduce response size',
-              default: false,
-            },
-          },
-          required: ['deviceIds'],
+        includePolicyLogs: {
+          type: 'boolean',
+          description: 'Include recent policy execution logs',
+          default: false,
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
-      },
-      // ==========================================
-      // Policy Tools
-      // ==========================================
-      {
-        name: 'listPolicies',
-        description: 'List all policies in Jamf Pro. For policy performance analysis, use getPolicyAnalysis instead. Use searchPolicies to find by name.',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            limit: {
-              type: 'number',
-              description: 'Maximum number of policies to return',
-              default: 100,
-            },
-            category: {
-              type: 'string',
-              description: 'Filter by policy category',
-            },
-          },
+        includeHistory: {
+          type: 'boolean',
+          description: 'Include device history events',
+          default: false,
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      {
-        name: 'getPolicyDetails',
-        description: 'Get detailed information about a specific policy including scope, scripts, and packages. For a full analysis with compliance data, use getPolicyAnalysis instead.',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            policyId: {
-              type: 'string',
-              description: 'The Jamf policy ID',
-            },
-            includeScriptContent: {
-              type: 'boolean',
-              description: 'Include full script content for scripts in the policy',
-              default: false,
-            },
-          },
-          required: ['policyId'],
+      required: ['identifier'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'getSecurityPosture',
+    description: 'Analyze fleet security posture: FileVault encryption rates, compliance status, and OS version currency. Samples devices in parallel for efficiency. Use for "What is our security posture?" questions.',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        sampleSize: {
+          type: 'number',
+          description: 'Number of devices to sample for encryption check',
+          default: 20,
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
-      },
-      {
-        name: 'searchPolicies',
-        description: 'Search for policies by name or description. Returns matching policy IDs and names.',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            query: {
-              type: 'string',
-              description: 'Search query for policy name or description',
-            },
-            limit: {
-              type: 'number',
-              description: 'Maximum number of results',
-              default: 50,
-            },
-          },
-          required: ['query'],
+        complianceDays: {
+          type: 'number',
+          description: 'Number of days for compliance check-in window',
+          default: 30,
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      {
-        name: 'executePolicy',
-        description: 'Execute a Jamf policy on one or more devices. DESTRUCTIVE: requires confirm=true. Use getPolicyDetails first to verify the policy configuration.',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            policyId: {
-              type: 'string',
-              description: 'The Jamf policy ID to execute',
-            },
-            deviceIds: {
-              type: 'array',
-              items: {
-                type: 'string',
-              },
-              description: 'Array of device IDs to execute the policy on',
-            },
-            confirm: {
-              type: 'boolean',
-              description: 'Confirmation flag for policy execution',
-              default: false,
-            },
-          },
-          required: ['policyId', 'deviceIds'],
-        },
-        annotations: { readOnlyHint: false, destructiveHint: true },
-      },
-      {
-        name: 'deployScript',
-        description: 'Deploy and execute a Jamf script on one or more devices. DESTRUCTIVE: requires confirm=true.',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            scriptId: {
-              type: 'string',
-              description: 'The Jamf script ID to deploy',
-            },
-            deviceIds: {
-              type: 'array',
-              items: {
-                type: 'string',
-              },
-              description: 'Array of device IDs to deploy the script to',
-            },
-            confirm: {
-              type: 'boolean',
-              description: 'Confirmation flag for script deployment',
-              default: false,
-            },
-          },
-          required: ['scriptId', 'deviceIds'],
-        },
-        annotations: { readOnlyHint: false, destructiveHint: true },
-      },
-      {
-        name: 'getScriptDetails',
-        description: 'Get detailed information about a specific script including its content, parameters, and metadata',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            scriptId: {
-              type: 'string',
-              description: 'The Jamf script ID',
-            },
-          },
-          required: ['scriptId'],
-        },
-        annotations: { readOnlyHint: true, destructiveHint: false },
-      },
-      // ==========================================
-      // Configuration Profile Tools
-      // ==========================================
-      {
-        name: 'listConfigurationProfiles',
-        description: 'List all configuration profiles in Jamf Pro (computer or mobile device)',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            type: {
-              type: 'string',
-              enum: ['computer', 'mobiledevice'],
-              description: 'Type of configuration profiles to list',
-              default: 'computer',
-            },
-          },
-        },
-        annotations: { readOnlyHint: true, destructiveHint: false },
-      },
-      {
-        name: 'getConfigurationProfileDetails',
-        description: 'Get detailed information about a specific configuration profile',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            profileId: {
-              type: 'string',
-              description: 'The configuration profile ID',
-            },
-            type: {
-              type: 'string',
-              enum: ['computer', 'mobiledevice'],
-              description: 'Type of configuration profile',
-              default: 'computer',
-            },
-          },
-          required: ['profileId'],
-        },
-        annotations: { readOnlyHint: true, destructiveHint: false },
-      },
-      {
-        name: 'searchConfigurationProfiles',
-        description: 'Search for configuration profiles by name',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            query: {
-              type: 'string',
-              description: 'Search query to find configuration profiles by name',
-            },
-            type: {
-              type: 'string',
-              enum: ['computer', 'mobiledevice'],
-              description: 'Type of configuration profiles to search',
-              default: 'computer',
-            },
-          },
-          required: ['query'],
-        },
-        annotations: { readOnlyHint: true, destructiveHint: false },
-      },
-      {
-        name: 'deployConfigurationProfile',
-        description: 'Deploy a configuration profile to one or more devices (requires confirmation)',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            profileId: {
-              type: 'string',
-              description: 'The configuration profile ID to deploy',
-            },
-            deviceIds: {
-              type: 'array',
-              items: {
-                type: 'string',
-              },
-              description: 'Array of device IDs to deploy the profile to',
-            },
-            type: {
-              type: 'string',
-              enum: ['computer', 'mobiledevice'],
-              description: 'Type of configuration profile',
-              default: 'computer',
-            },
-            confirm: {
-              type: 'boolean',
-              description: 'Confirmation flag for profile deployment',
-              default: false,
-            },
-          },
-          required: ['profileId', 'deviceIds'],
-        },
-        annotations: { readOnlyHint: false, destructiveHint: true },
-      },
-      {
-        name: 'removeConfigurationProfile',
-        description: 'Remove a configuration profile from one or more devices (requires confirmation)',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            profileId: {
-              type: 'string',
-              description: 'The configuration profile ID to remove',
-            },
-            deviceIds: {
-              type: 'array',
-              items: {
-                type: 'string',
-              },
-              description: 'Array of device IDs to remove the profile from',
-            },
-            type: {
-              type: 'string',
-              enum: ['computer', 'mobiledevice'],
-              description: 'Type of configuration profile',
-              default: 'computer',
-            },
-            confirm: {
-              type: 'boolean',
-              description: 'Confirmation flag for profile removal',
-              default: false,
-            },
-          },
-          required: ['profileId', 'deviceIds'],
-        },
-        annotations: { readOnlyHint: false, destructiveHint: true },
-      },
-      {
-        name: 'deleteConfigurationProfile',
-        description: 'Delete a configuration profile from Jamf Pro (requires confirmation)',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            profileId: {
-              type: 'string',
-              description: 'The configuration profile ID to delete',
-            },
-            type: {
-              type: 'string',
-              enum: ['computer', 'mobiledevice'],
-              description: 'Type of configuration profile',
-              default: 'computer',
-            },
-            confirm: {
-              type: 'boolean',
-              description: 'Confirmation flag for configuration profile deletion',
-              default: false,
-            },
-          },
-          required: ['profileId'],
-        },
-        annotations: { readOnlyHint: false, destructiveHint: true },
-      },
-      {
-        name: 'listComputerGroups',
-        description: 'List computer groups in Jamf Pro (smart groups, static groups, or all)',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            type: {
-              type: 'string',
-              enum: ['smart', 'static', 'all'],
-              description: 'Type of computer groups to list',
-              default: 'all',
-            },
-          },
-        },
-        annotations: { readOnlyHint: true, destructiveHint: false },
-      },
-      {
-        name: 'getComputerGroupDetails',
-        description: 'Get detailed information about a specific computer group including membership and criteria',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            groupId: {
-              type: 'string',
-              description: 'The computer group ID',
-            },
-          },
-          required: ['groupId'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'getPolicyAnalysis',
+    description: 'Analyze a policy by ID or name: configuration, scope, compliance, and performance. Resolves policy name automatically. Use for "How is policy X performing?" questions.',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        policyId: {
+          type: 'string',
+          description: 'The Jamf policy ID to analyze',
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
-      },
-      {
-        name: 'searchComputerGroups',
-        description: 'Search for computer groups by name',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            query: {
-              type: 'string',
-              description: 'Search query to find computer groups by name',
-            },
-          },
-          required: ['query'],
+        policyName: {
+          type: 'string',
+          description: 'Policy name to search for (used if policyId not provided)',
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      {
-        name: 'getComputerGroupMembers',
-        description: 'Get all members of a specific computer group',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            groupId: {
-              type: 'string',
-              description: 'The computer group ID to get members for',
-            },
-          },
-          required: ['groupId'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  // ==========================================
+  // Device Tools
+  // ==========================================
+  {
+    name: 'searchDevices',
+    description: 'Search for computers in Jamf Pro by name, serial number, IP address, username, or other criteria. For full details on a result, follow up with getDeviceDetails or getDeviceFullProfile. For batch details, use getDevicesBatch.',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        query: {
+          type: 'string',
+          description: 'Search query to find devices',
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
-      },
-      {
-        name: 'createStaticComputerGroup',
-        description: 'Create a new static computer group with specified members (requires confirmation)',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            name: {
-              type: 'string',
-              description: 'Name for the new static computer group',
-            },
-            computerIds: {
-              type: 'array',
-              items: {
-                type: 'string',
-              },
-              description: 'Array of computer IDs to add to the group',
-            },
-            confirm: {
-              type: 'boolean',
-              description: 'Confirmation flag for group creation',
-              default: false,
-            },
-          },
-          required: ['name', 'computerIds'],
+        limit: {
+          type: 'number',
+          description: 'Maximum number of results to return',
+          default: 50,
         },
-        annotations: { readOnlyHint: false, destructiveHint: false },
       },
-      {
-        name: 'updateStaticComputerGroup',
-        description: 'Update the membership of a static computer group (requires confirmation)',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            groupId: {
-              type: 'string',
-              description: 'The static computer group ID to update',
-            },
-            computerIds: {
-              type: 'array',
-              items: {
-                type: 'string',
-              },
-              description: 'Array of computer IDs to set as the group membership',
-            },
-            confirm: {
-              type: 'boolean',
-              description: 'Confirmation flag for group update',
-              default: false,
-            },
-          },
-          required: ['groupId', 'computerIds'],
+      required: ['query'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'getDeviceDetails',
+    description: 'Get detailed information about a specific computer including hardware, software, storage, and user details. Requires a Jamf device ID. For lookup by name or serial, use getDeviceFullProfile instead.',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        deviceId: {
+          type: 'string',
+          description: 'The Jamf device ID',
         },
-        annotations: { readOnlyHint: false, destructiveHint: false },
       },
-      {
-        name: 'deleteComputerGroup',
-        description: 'Delete a computer group (requires confirmation)',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            groupId: {
-              type: 'string',
-              description: 'The computer group ID to delete',
-            },
-            confirm: {
-              type: 'boolean',
-              description: 'Confirmation flag for group deletion',
-              default: false,
-            },
-          },
-          required: ['groupId'],
+      required: ['deviceId'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'updateInventory',
+    description: 'Force an inventory update on a specific device. This sends an MDM command to the device.',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        deviceId: {
+          type: 'string',
+          description: 'The device ID to update inventory for',
         },
-        annotations: { readOnlyHint: false, destructiveHint: true },
       },
-      {
-        name: 'createAdvancedComputerSearch',
-        description: 'Create an advanced computer search with custom criteria and display fields (requires confirmation)',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            searchData: {
-              type: 'object',
-              description: 'Advanced computer search configuration',
-              properties: {
-                name: {
-                  type: 'string',
-                  description: 'Name for the advanced computer search',
-                },
-                criteria: {
-                  type: 'array',
-                  description: 'Search criteria',
-                  items: {
-                    type: 'object',
-                    properties: {
-                      name: {
-                        type: 'string',
-                        description: 'Criterion name (e.g., "Last Check-in")',
-                      },
-                      priority: {
-                        type: 'number',
-                        description: 'Criterion priority (0 = first)',
-                      },
-                      and_or: {
-                        type: 'string',
-                        enum: ['and', 'or'],
-                        description: 'Logical operator for combining criteria',
-                      },
-                      search_type: {
-                        type: 'string',
-                        description: 'Search type (e.g., "more than x days ago")',
-                      },
-                      value: {
-                        type: 'string',
-                        description: 'Search value',
-                      },
-                    },
-                    required: ['name', 'priority', 'and_or', 'search_type', 'value'],
-                  },
-                },
-                display_fields: {
-                  type: 'array',
-                  description: 'Fields to display in search results',
-                  items: {
-                    type: 'string',
-                  },
-                },
-              },
-              required: ['name'],
-            },
-            confirm: {
-              type: 'boolean',
-              description: 'Confirmation flag for search creation',
-              default: false,
-            },
-          },
-          required: ['searchData'],
+      required: ['deviceId'],
+    },
+    annotations: { readOnlyHint: false, destructiveHint: false },
+  },
+  {
+    name: 'checkDeviceCompliance',
+    description: 'Check which devices have not reported within a specified number of days. Use this FIRST for fleet overview questions. For security-focused analysis, use getSecurityPosture instead.',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        days: {
+          type: 'number',
+          description: 'Number of days to check for compliance',
+          default: 30,
         },
-        annotations: { readOnlyHint: false, destructiveHint: false },
-      },
-      {
-        name: 'listAdvancedComputerSearches',
-        description: 'List all advanced computer searches in Jamf Pro to see their names and IDs',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            limit: {
-              type: 'number',
-              description: 'Maximum number of searches to return',
-              default: 100,
-            },
-          },
+        includeDetails: {
+          type: 'boolean',
+          description: 'Include detailed device list in response',
+          default: false,
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      {
-        name: 'getAdvancedComputerSearchDetails',
-        description: 'Get detailed information about a specific advanced computer search including its configured fields',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            searchId: {
-              type: 'string',
-              description: 'The ID of the advanced computer search',
-            },
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'getDevicesBatch',
+    description: 'Get details for multiple devices in a single request. Use INSTEAD of calling getDeviceDetails in a loop. Pass an array of device IDs.',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        deviceIds: {
+          type: 'array',
+          items: {
+            type: 'string',
           },
-          required: ['searchId'],
+          description: 'Array of device IDs to fetch details for',
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
-      },
-      {
-        name: 'deleteAdvancedComputerSearch',
-        description: 'Delete an advanced computer search from Jamf Pro (requires confirmation)',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            searchId: {
-              type: 'string',
-              description: 'The ID of the advanced computer search to delete',
-            },
-            confirm: {
-              type: 'boolean',
-              description: 'Must be true to confirm deletion',
-            },
-          },
-          required: ['searchId', 'confirm'],
+        includeBasicOnly: {
+          type: 'boolean',
+          description: 'Return only basic info to reduce response size',
+          default: false,
         },
-        annotations: { readOnlyHint: false, destructiveHint: true },
       },
-      {
-        name: 'searchMobileDevices',
-        description: 'Search for mobile devices in Jamf Pro by name, serial number, UDID, or other criteria',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            query: {
-              type: 'string',
-              description: 'Search query to find mobile devices',
-            },
-            limit: {
-              type: 'number',
-              description: 'Maximum number of results to return',
-              default: 50,
-            },
-          },
-          required: ['query'],
+      required: ['deviceIds'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  // ==========================================
+  // Policy Tools
+  // ==========================================
+  {
+    name: 'listPolicies',
+    description: 'List all policies in Jamf Pro. For policy performance analysis, use getPolicyAnalysis instead. Use searchPolicies to find by name.',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        limit: {
+          type: 'number',
+          description: 'Maximum number of policies to return',
+          default: 100,
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
-      },
-      {
-        name: 'getMobileDeviceDetails',
-        description: 'Get detailed information about a specific mobile device including hardware, OS, battery, and management status',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            deviceId: {
-              type: 'string',
-              description: 'The mobile device ID',
-            },
-          },
-          required: ['deviceId'],
+        category: {
+          type: 'string',
+          description: 'Filter by policy category',
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      {
-        name: 'listMobileDevices',
-        description: 'List all mobile devices in Jamf Pro with basic information',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            limit: {
-              type: 'number',
-              description: 'Maximum number of mobile devices to return',
-              default: 50,
-            },
-          },
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'getPolicyDetails',
+    description: 'Get detailed information about a specific policy including scope, scripts, and packages. For a full analysis with compliance data, use getPolicyAnalysis instead.',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        policyId: {
+          type: 'string',
+          description: 'The Jamf policy ID',
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
-      },
-      {
-        name: 'listMobileDeviceApplications',
-        description: 'List all mobile device applications configured for delivery in Jamf Pro',
-        inputSchema: {
-          type: 'object',
-          properties: {},
+        includeScriptContent: {
+          type: 'boolean',
+          description: 'Include full script content for scripts in the policy',
+          default: false,
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      {
-        name: 'getMobileDeviceApplicationDetails',
-        description: 'Get detailed information about a mobile device application configured for delivery in Jamf Pro',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            applicationId: {
-              type: 'string',
-              description: 'The mobile device application ID',
-            },
-          },
-          required: ['applicationId'],
+      required: ['policyId'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'searchPolicies',
+    description: 'Search for policies by name or description. Returns matching policy IDs and names.',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        query: {
+          type: 'string',
+          description: 'Search query for policy name or description',
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
-      },
-      {
-        name: 'updateMobileDeviceInventory',
-        description: 'Force an inventory update on a specific mobile device',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            deviceId: {
-              type: 'string',
-              description: 'The mobile device ID to update inventory for',
-            },
-          },
-          required: ['deviceId'],
+        limit: {
+          type: 'number',
+          description: 'Maximum number of results',
+          default: 50,
         },
-        annotations: { readOnlyHint: false, destructiveHint: false },
       },
-      {
-        name: 'sendMDMCommand',
-        description: 'Send an MDM command to a mobile device (e.g., lock, wipe, clear passcode) - requires confirmation for destructive actions',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            deviceId: {
-              type: 'string',
-              description: 'The mobile device ID to send command to',
-            },
-            command: {
-              type: 'string',
-              description: 'The MDM command to send',
-              enum: [
-                'DeviceLock',
-                'EraseDevice',
-                'ClearPasscode',
-                'RestartDevice',
-                'ShutDownDevice',
-                'EnableLostMode',
-                'DisableLostMode',
-                'PlayLostModeSound',
-                'UpdateInventory',
-                'ClearRestrictionsPassword',
-                'SettingsEnableBluetooth',
-                'SettingsDisableBluetooth',
-                'SettingsEnableWiFi',
-                'SettingsDisableWiFi',
-                'SettingsEnableDataRoaming',
-                'SettingsDisableDataRoaming',
-                'SettingsEnableVoiceRoaming',
-                'SettingsDisableVoiceRoaming',
-                'SettingsEnablePersonalHotspot',
-                'SettingsDisablePersonalHotspot',
-              ],
-            },
-            confirm: {
-              type: 'boolean',
-              description: 'Confirmation flag for destructive commands',
-              default: false,
-            },
-          },
-          required: ['deviceId', 'command'],
+      required: ['query'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'executePolicy',
+    description: 'Execute a Jamf policy on one or more devices. DESTRUCTIVE: requires confirm=true. Use getPolicyDetails first to verify the policy configuration.',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        policyId: {
+          type: 'string',
+          description: 'The Jamf policy ID to execute',
         },
-        annotations: { readOnlyHint: false, destructiveHint: true },
-      },
-      {
-        name: 'listMobileDeviceGroups',
-        description: 'List mobile device groups in Jamf Pro (smart groups, static groups, or all)',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            type: {
-              type: 'string',
-              enum: ['smart', 'static', 'all'],
-              description: 'Type of mobile device groups to list',
-              default: 'all',
-            },
+        deviceIds: {
+          type: 'array',
+          items: {
+            type: 'string',
           },
+          description: 'Array of device IDs to execute the policy on',
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
-      },
-      {
-        name: 'getMobileDeviceGroupDetails',
-        description: 'Get detailed information about a specific mobile device group including membership and criteria',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            groupId: {
-              type: 'string',
-              description: 'The mobile device group ID',
-            },
-          },
-          required: ['groupId'],
+        confirm: {
+          type: 'boolean',
+          description: 'Confirmation flag for policy execution',
+          default: false,
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      {
-        name: 'listPackages',
-        description: 'List all packages in Jamf Pro',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            limit: {
-              type: 'number',
-              description: 'Maximum number of packages to return',
-              default: 100,
-            },
-          },
+      required: ['policyId', 'deviceIds'],
+    },
+    annotations: { readOnlyHint: false, destructiveHint: true },
+  },
+  {
+    name: 'deployScript',
+    description: 'Deploy and execute a Jamf script on one or more devices. DESTRUCTIVE: requires confirm=true.',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        scriptId: {
+          type: 'string',
+          description: 'The Jamf script ID to deploy',
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
-      },
-      {
-        name: 'searchPackages',
-        description: 'Search for packages by name',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            query: {
-              type: 'string',
-              description: 'Search query for package name',
-            },
-            limit: {
-              type: 'number',
-              description: 'Maximum number of results',
-              default: 50,
-            },
+        deviceIds: {
+          type: 'array',
+          items: {
+            type: 'string',
           },
-          required: ['query'],
+          description: 'Array of device IDs to deploy the script to',
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
-      },
-      {
-        name: 'getPackageDetails',
-        description: 'Get detailed information about a specific package',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            packageId: {
-              type: 'string',
-              description: 'The Jamf package ID',
-            },
-          },
-          required: ['packageId'],
+        confirm: {
+          type: 'boolean',
+          description: 'Confirmation flag for script deployment',
+          default: false,
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      {
-        name: 'getPackageDeploymentHistory',
-        description: 'Get deployment history for a specific package',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            packageId: {
-              type: 'string',
-              description: 'The Jamf package ID',
-            },
-            limit: {
-              type: 'number',
-              description: 'Maximum number of deployment records to return',
-              default: 50,
-            },
-          },
-          required: ['packageId'],
+      required: ['scriptId', 'deviceIds'],
+    },
+    annotations: { readOnlyHint: false, destructiveHint: true },
+  },
+  {
+    name: 'getScriptDetails',
+    description: 'Get detailed information about a specific script including its content, parameters, and metadata',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        scriptId: {
+          type: 'string',
+          description: 'The Jamf script ID',
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      {
-        name: 'getPoliciesUsingPackage',
-        description: 'Find all policies that use a specific package',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            packageId: {
-              type: 'string',
-              description: 'The Jamf package ID',
-            },
-          },
-          required: ['packageId'],
+      required: ['scriptId'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  // ==========================================
+  // Configuration Profile Tools
+  // ==========================================
+  {
+    name: 'listConfigurationProfiles',
+    description: 'List all configuration profiles in Jamf Pro (computer or mobile device)',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        type: {
+          type: 'string',
+          enum: ['computer', 'mobiledevice'],
+          description: 'Type of configuration profiles to list',
+          default: 'computer',
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      {
-        name: 'createPolicy',
-        description: 'Create a new policy with configuration (requires confirmation)',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            policyData: {
-              type: 'object',
-              description: 'Policy configuration data',
-              properties: {
-                general: {
-                  type: 'object',
-                  description: 'General policy settings',
-                  properties: {
-                    name: { type: 'string', description: 'Policy name' },
-                    enabled: { type: 'boolean', description: 'Whether the policy is enabled' },
-                    trigger: { type: 'string', description: 'Policy trigger type' },
-                    trigger_checkin: { type: 'boolean', description: 'Trigger on check-in' },
-                    trigger_enrollment_complete: { type: 'boolean', description: 'Trigger on enrollment complete' },
-                    trigger_login: { type: 'boolean', description: 'Trigger on login' },
-                    trigger_logout: { type: 'boolean', description: 'Trigger on logout' },
-                    trigger_network_state_changed: { type: 'boolean', description: 'Trigger on network state change' },
-                    trigger_startup: { type: 'boolean', description: 'Trigger on startup' },
-                    trigger_other: { type: 'string', description: 'Custom trigger name' },
-                    frequency: { type: 'string', description: 'Execution frequency' },
-                    category: { type: 'string', description: 'Policy category' },
-                  },
-                  required: ['name'],
-                },
-                scope: {
-                  type: 'object',
-                  description: 'Policy scope settings',
-                  properties: {
-                    all_computers: { type: 'boolean', description: 'Apply to all computers' },
-                    computers: {
-                      type: 'array',
-                      items: { type: 'object', properties: { id: { type: 'number' } } },
-                      description: 'Specific computers',
-                    },
-                    computer_groups: {
-                      type: 'array',
-                      items: { type: 'object', properties: { id: { type: 'number' } } },
-                      description: 'Computer groups',
-                    },
-                  },
-                },
-                package_configuration: {
-                  type: 'object',
-                  description: 'Package configuration',
-                  properties: {
-                    packages: {
-                      type: 'array',
-                      items: {
-                        type: 'object',
-                        properties: {
-                          id: { type: 'number', description: 'Package ID' },
-                          action: { type: 'string', description: 'Install action' },
-                        },
-                        required: ['id'],
-                      },
-                    },
-                  },
-                },
-                scripts: {
-                  type: 'array',
-                  description: 'Scripts to run',
-                  items: {
-                    type: 'object',
-                    properties: {
-                      id: { type: 'number', description: 'Script ID' },
-                      priority: { type: 'string', description: 'Script priority (Before, After)' },
-                    },
-                    required: ['id'],
-                  },
-                },
-              },
-              required: ['general'],
-            },
-            confirm: {
-              type: 'boolean',
-              description: 'Confirmation flag for policy creation',
-              default: false,
-            },
-          },
-          required: ['policyData'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'getConfigurationProfileDetails',
+    description: 'Get detailed information about a specific configuration profile',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        profileId: {
+          type: 'string',
+          description: 'The configuration profile ID',
         },
-        annotations: { readOnlyHint: false, destructiveHint: false },
-      },
-      {
-        name: 'updatePolicy',
-        description: 'Update an existing policy configuration (requires confirmation)',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            policyId: {
-              type: 'string',
-              description: 'The policy ID to update',
-            },
-            policyData: {
-              type: 'object',
-              description: 'Policy configuration data to update',
-              properties: {
-                general: {
-                  type: 'object',
-                  description: 'General policy settings to update',
-                  properties: {
-                    name: { type: 'string', description: 'Policy name' },
-                    enabled: { type: 'boolean', description: 'Whether the policy is enabled' },
-                    trigger: { type: 'string', description: 'Policy trigger type' },
-                    frequency: { type: 'string', description: 'Execution frequency' },
-                    category: { type: 'string', description: 'Policy category' },
-                  },
-                },
-                scope: {
-                  type: 'object',
-                  description: 'Policy scope settings to update',
-                },
-                package_configuration: {
-                  type: 'object',
-                  description: 'Package configuration to update',
-                },
-                scripts: {
-                  type: 'array',
-                  description: 'Scripts to run',
-                },
-              },
-            },
-            confirm: {
-              type: 'boolean',
-              description: 'Confirmation flag for policy update',
-              default: false,
-            },
-          },
-          required: ['policyId', 'policyData'],
+        type: {
+          type: 'string',
+          enum: ['computer', 'mobiledevice'],
+          description: 'Type of configuration profile',
+          default: 'computer',
         },
-        annotations: { readOnlyHint: false, destructiveHint: false },
       },
-      {
-        name: 'clonePolicy',
-        description: 'Clone an existing policy with a new name (requires confirmation)',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            sourcePolicyId: {
-              type: 'string',
-              description: 'The source policy ID to clone',
-            },
-            newName: {
-              type: 'string',
-              description: 'Name for the cloned policy',
-            },
-            confirm: {
-              type: 'boolean',
-              description: 'Confirmation flag for policy cloning',
-              default: false,
-            },
-          },
-          required: ['sourcePolicyId', 'newName'],
+      required: ['profileId'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'searchConfigurationProfiles',
+    description: 'Search for configuration profiles by name',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        query: {
+          type: 'string',
+          description: 'Search query to find configuration profiles by name',
+        },
+        type: {
+          type: 'string',
+          enum: ['computer', 'mobiledevice'],
+          description: 'Type of configuration profiles to search',
+          default: 'computer',
         },
-        annotations: { readOnlyHint: false, destructiveHint: false },
       },
-      {
-        name: 'setPolicyEnabled',
-        description: 'Enable or disable a policy (requires confirmation)',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            policyId: {
-              type: 'string',
-              description: 'The policy ID',
-            },
-            enabled: {
-              type: 'boolean',
-              description: 'Whether to enable or disable the policy',
-            },
-            confirm: {
-              type: 'boolean',
-              description: 'Confirmation flag for enabling/disabling policy',
-              default: false,
-            },
+      required: ['query'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'deployConfigurationProfile',
+    description: 'Deploy a configuration profile to one or more devices (requires confirmation)',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        profileId: {
+          type: 'string',
+          description: 'The configuration profile ID to deploy',
+        },
+        deviceIds: {
+          type: 'array',
+          items: {
+            type: 'string',
           },
-          required: ['policyId', 'enabled'],
+          description: 'Array of device IDs to deploy the profile to',
+        },
+        type: {
+          type: 'string',
+          enum: ['computer', 'mobiledevice'],
+          description: 'Type of configuration profile',
+          default: 'computer',
+        },
+        confirm: {
+          type: 'boolean',
+          description: 'Confirmation flag for profile deployment',
+          default: false,
         },
-        annotations: { readOnlyHint: false, destructiveHint: false },
       },
-      {
-        name: 'updatePolicyScope',
-        description: 'Update policy scope by adding/removing computers and groups (requires confirmation)',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            policyId: {
-              type: 'string',
-              description: 'The policy ID to update scope for',
-            },
-            scopeUpdates: {
-              type: 'object',
-              description: 'Scope update operations',
-              properties: {
-                addComputers: {
-                  type: 'array',
-                  items: { type: 'string' },
-                  description: 'Computer IDs to add to scope',
-                },
-                removeComputers: {
-                  type: 'array',
-                  items: { type: 'string' },
-                  description: 'Computer IDs to remove from scope',
-                },
-                addComputerGroups: {
-                  type: 'array',
-                  items: { type: 'string' },
-                  description: 'Computer group IDs to add to scope',
-                },
-                removeComputerGroups: {
-                  type: 'array',
-                  items: { type: 'string' },
-                  description: 'Computer group IDs to remove from scope',
-                },
-                replaceComputers: {
-                  type: 'array',
-                  items: { type: 'string' },
-                  description: 'Replace all computers in scope with these IDs',
-                },
-                replaceComputerGroups: {
-                  type: 'array',
-                  items: { type: 'string' },
-                  description: 'Replace all computer groups in scope with these IDs',
-                },
-              },
-            },
-            confirm: {
-              type: 'boolean',
-              description: 'Confirmation flag for scope update',
-              default: false,
-            },
+      required: ['profileId', 'deviceIds'],
+    },
+    annotations: { readOnlyHint: false, destructiveHint: true },
+  },
+  {
+    name: 'removeConfigurationProfile',
+    description: 'Remove a configuration profile from one or more devices (requires confirmation)',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        profileId: {
+          type: 'string',
+          description: 'The configuration profile ID to remove',
+        },
+        deviceIds: {
+          type: 'array',
+          items: {
+            type: 'string',
           },
-          required: ['policyId', 'scopeUpdates'],
+          description: 'Array of device IDs to remove the profile from',
+        },
+        type: {
+          type: 'string',
+          enum: ['computer', 'mobiledevice'],
+          description: 'Type of configuration profile',
+          default: 'computer',
+        },
+        confirm: {
+          type: 'boolean',
+          description: 'Confirmation flag for profile removal',
+          default: false,
         },
-        annotations: { readOnlyHint: false, destructiveHint: false },
       },
-      {
-        name: 'deletePolicy',
-        description: 'Delete a policy from Jamf Pro (requires confirmation)',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            policyId: {
-              type: 'string',
-              description: 'The policy ID to delete',
-            },
-            confirm: {
-              type: 'boolean',
-              description: 'Confirmation flag for policy deletion',
-              default: false,
-            },
-          },
-          required: ['policyId'],
+      required: ['profileId', 'deviceIds'],
+    },
+    annotations: { readOnlyHint: false, destructiveHint: true },
+  },
+  {
+    name: 'deleteConfigurationProfile',
+    description: 'Delete a configuration profile from Jamf Pro (requires confirmation)',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        profileId: {
+          type: 'string',
+          description: 'The configuration profile ID to delete',
+        },
+        type: {
+          type: 'string',
+          enum: ['computer', 'mobiledevice'],
+          description: 'Type of configuration profile',
+          default: 'computer',
+        },
+        confirm: {
+          type: 'boolean',
+          description: 'Confirmation flag for configuration profile deletion',
+          default: false,
         },
-        annotations: { readOnlyHint: false, destructiveHint: true },
       },
-      {
-        name: 'listScripts',
-        description: 'List all scripts in Jamf Pro',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            limit: {
-              type: 'number',
-              description: 'Maximum number of scripts to return',
-              default: 100,
-            },
-          },
+      required: ['profileId'],
+    },
+    annotations: { readOnlyHint: false, destructiveHint: true },
+  },
+  {
+    name: 'listComputerGroups',
+    description: 'List computer groups in Jamf Pro (smart groups, static groups, or all)',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        type: {
+          type: 'string',
+          enum: ['smart', 'static', 'all'],
+          description: 'Type of computer groups to list',
+          default: 'all',
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      {
-        name: 'searchScripts',
-        description: 'Search for scripts by name',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            query: {
-              type: 'string',
-              description: 'Search query for script name',
-            },
-            limit: {
-              type: 'number',
-              description: 'Maximum number of results',
-              default: 50,
-            },
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'getComputerGroupDetails',
+    description: 'Get detailed information about a specific computer group including membership and criteria',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        groupId: {
+          type: 'string',
+          description: 'The computer group ID',
+        },
+      },
+      required: ['groupId'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'searchComputerGroups',
+    description: 'Search for computer groups by name',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        query: {
+          type: 'string',
+          description: 'Search query to find computer groups by name',
+        },
+      },
+      required: ['query'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'getComputerGroupMembers',
+    description: 'Get all members of a specific computer group',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        groupId: {
+          type: 'string',
+          description: 'The computer group ID to get members for',
+        },
+      },
+      required: ['groupId'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'createStaticComputerGroup',
+    description: 'Create a new static computer group with specified members (requires confirmation)',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        name: {
+          type: 'string',
+          description: 'Name for the new static computer group',
+        },
+        computerIds: {
+          type: 'array',
+          items: {
+            type: 'string',
           },
-          required: ['query'],
+          description: 'Array of computer IDs to add to the group',
+        },
+        confirm: {
+          type: 'boolean',
+          description: 'Confirmation flag for group creation',
+          default: false,
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      {
-        name: 'createScript',
-        description: 'Create a new script with contents and parameters (requires confirmation)',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            scriptData: {
-              type: 'object',
-              description: 'Script configuration data',
-              properties: {
-                name: {
-                  type: 'string',
-                  description: 'Script name',
-                },
-                script_contents: {
-                  type: 'string',
-                  description: 'Script contents',
-                },
-                category: {
-                  type: 'string',
-                  description: 'Script category',
-                },
-                info: {
-                  type: 'string',
-                  description: 'Script info/description',
-                },
-                notes: {
-                  type: 'string',
-                  description: 'Script notes',
-                },
-                priority: {
-                  type: 'string',
-                  description: 'Script priority',
-                },
-                parameters: {
-                  type: 'object',
-                  description: 'Script parameter labels',
-                  properties: {
-                    parameter4: { type: 'string', description: 'Parameter 4 label' },
-                    parameter5: { type: 'string', description: 'Parameter 5 label' },
-                    parameter6: { type: 'string', description: 'Parameter 6 label' },
-                    parameter7: { type: 'string', description: 'Parameter 7 label' },
-                    parameter8: { type: 'string', description: 'Parameter 8 label' },
-                    parameter9: { type: 'string', description: 'Parameter 9 label' },
-                    parameter10: { type: 'string', description: 'Parameter 10 label' },
-                    parameter11: { type: 'string', description: 'Parameter 11 label' },
-                  },
-                },
-                os_requirements: {
-                  type: 'string',
-                  description: 'OS requirements',
-                },
-                script_contents_encoded: {
-                  type: 'boolean',
-                  description: 'Whether script contents are encoded',
-                },
-              },
-              required: ['name', 'script_contents'],
-            },
-            confirm: {
-              type: 'boolean',
-              description: 'Confirmation flag for script creation',
-              default: false,
-            },
+      required: ['name', 'computerIds'],
+    },
+    annotations: { readOnlyHint: false, destructiveHint: false },
+  },
+  {
+    name: 'updateStaticComputerGroup',
+    description: 'Update the membership of a static computer group (requires confirmation)',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        groupId: {
+          type: 'string',
+          description: 'The static computer group ID to update',
+        },
+        computerIds: {
+          type: 'array',
+          items: {
+            type: 'string',
           },
-          required: ['scriptData'],
+          description: 'Array of computer IDs to set as the group membership',
+        },
+        confirm: {
+          type: 'boolean',
+          description: 'Confirmation flag for group update',
+          default: false,
         },
-        annotations: { readOnlyHint: false, destructiveHint: false },
       },
-      {
-        name: 'updateScript',
-        description: 'Update an existing script (requires confirmation)',
-        inputSchema: {
+      required: ['groupId', 'computerIds'],
+    },
+    annotations: { readOnlyHint: false, destructiveHint: false },
+  },
+  {
+    name: 'deleteComputerGroup',
+    description: 'Delete a computer group (requires confirmation)',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        groupId: {
+          type: 'string',
+          description: 'The computer group ID to delete',
+        },
+        confirm: {
+          type: 'boolean',
+          description: 'Confirmation flag for group deletion',
+          default: false,
+        },
+      },
+      required: ['groupId'],
+    },
+    annotations: { readOnlyHint: false, destructiveHint: true },
+  },
+  {
+    name: 'createAdvancedComputerSearch',
+    description: 'Create an advanced computer search with custom criteria and display fields (requires confirmation)',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        searchData: {
           type: 'object',
+          description: 'Advanced computer search configuration',
           properties: {
-            scriptId: {
+            name: {
               type: 'string',
-              description: 'The script ID to update',
+              description: 'Name for the advanced computer search',
             },
-            scriptData: {
-              type: 'object',
-              description: 'Script configuration data to update',
-              properties: {
-                name: {
-                  type: 'string',
-                  description: 'Script name',
-                },
-                script_contents: {
-                  type: 'string',
-                  description: 'Script contents',
-                },
-                category: {
-                  type: 'string',
-                  description: 'Script category',
-                },
-                info: {
-                  type: 'string',
-                  description: 'Script info/description',
-                },
-                notes: {
-                  type: 'string',
-                  description: 'Script notes',
-                },
-                priority: {
-                  type: 'string',
-                  description: 'Script priority',
-                },
-                parameters: {
-                  type: 'object',
-                  description: 'Script parameter labels',
-                  properties: {
-                    parameter4: { type: 'string', description: 'Parameter 4 label' },
-                    parameter5: { type: 'string', description: 'Parameter 5 label' },
-                    parameter6: { type: 'string', description: 'Parameter 6 label' },
-                    parameter7: { type: 'string', description: 'Parameter 7 label' },
-                    parameter8: { type: 'string', description: 'Parameter 8 label' },
-                    parameter9: { type: 'string', description: 'Parameter 9 label' },
-                    parameter10: { type: 'string', description: 'Parameter 10 label' },
-                    parameter11: { type: 'string', description: 'Parameter 11 label' },
+            criteria: {
+              type: 'array',
+              description: 'Search criteria',
+              items: {
+                type: 'object',
+                properties: {
+                  name: {
+                    type: 'string',
+                    description: 'Criterion name (e.g., "Last Check-in")',
+                  },
+                  priority: {
+                    type: 'number',
+                    description: 'Criterion priority (0 = first)',
+                  },
+                  and_or: {
+                    type: 'string',
+                    enum: ['and', 'or'],
+                    description: 'Logical operator for combining criteria',
+                  },
+                  search_type: {
+                    type: 'string',
+                    description: 'Search type (e.g., "more than x days ago")',
+                  },
+                  value: {
+                    type: 'string',
+                    description: 'Search value',
                   },
                 },
-                os_requirements: {
-                  type: 'string',
-                  description: 'OS requirements',
-                },
-                script_contents_encoded: {
-                  type: 'boolean',
-                  description: 'Whether script contents are encoded',
-                },
+                required: ['name', 'priority', 'and_or', 'search_type', 'value'],
               },
             },
-            confirm: {
-              type: 'boolean',
-              description: 'Confirmation flag for script update',
-              default: false,
+            display_fields: {
+              type: 'array',
+              description: 'Fields to display in search results',
+              items: {
+                type: 'string',
+              },
             },
           },
-          required: ['scriptId', 'scriptData'],
+          required: ['name'],
         },
-        annotations: { readOnlyHint: false, destructiveHint: false },
-      },
-      {
-        name: 'deleteScript',
-        description: 'Delete a script (requires confirmation)',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            scriptId: {
-              type: 'string',
-              description: 'The script ID to delete',
-            },
-            confirm: {
-              type: 'boolean',
-              description: 'Confirmation flag for script deletion',
-              default: false,
-            },
-          },
-          required: ['scriptId'],
+        confirm: {
+          type: 'boolean',
+          description: 'Confirmation flag for search creation',
+          default: false,
         },
-        annotations: { readOnlyHint: false, destructiveHint: true },
       },
-      // Reporting and Analytics Tools
-      {
-        name: 'getInventorySummary',
-        description: 'Get inventory summary report including total devices, OS version distribution, and model distribution',
-        inputSchema: {
-          type: 'object',
-          properties: {},
+      required: ['searchData'],
+    },
+    annotations: { readOnlyHint: false, destructiveHint: false },
+  },
+  {
+    name: 'listAdvancedComputerSearches',
+    description: 'List all advanced computer searches in Jamf Pro to see their names and IDs',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        limit: {
+          type: 'number',
+          description: 'Maximum number of searches to return',
+          default: 100,
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      {
-        name: 'getPolicyComplianceReport',
-        description: 'Get policy compliance report showing success/failure rates, computers in scope vs completed, and last execution times',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            policyId: {
-              type: 'string',
-              description: 'The Jamf policy ID to generate compliance report for',
-            },
-          },
-          required: ['policyId'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'getAdvancedComputerSearchDetails',
+    description: 'Get detailed information about a specific advanced computer search including its configured fields',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        searchId: {
+          type: 'string',
+          description: 'The ID of the advanced computer search',
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      {
-        name: 'getPackageDeploymentStats',
-        description: 'Get package deployment statistics including policies using the package, deployment success rate, and target device count',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            packageId: {
-              type: 'string',
-              description: 'The Jamf package ID to get deployment statistics for',
-            },
-          },
-          required: ['packageId'],
+      required: ['searchId'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'deleteAdvancedComputerSearch',
+    description: 'Delete an advanced computer search from Jamf Pro (requires confirmation)',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        searchId: {
+          type: 'string',
+          description: 'The ID of the advanced computer search to delete',
+        },
+        confirm: {
+          type: 'boolean',
+          description: 'Must be true to confirm deletion',
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      {
-        name: 'getSoftwareVersionReport',
-        description: 'Get software version report showing version distribution across devices and out-of-date installations',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            softwareName: {
-              type: 'string',
-              description: 'Name of the software to search for version information',
-            },
-          },
-          required: ['softwareName'],
+      required: ['searchId', 'confirm'],
+    },
+    annotations: { readOnlyHint: false, destructiveHint: true },
+  },
+  {
+    name: 'searchMobileDevices',
+    description: 'Search for mobile devices in Jamf Pro by name, serial number, UDID, or other criteria',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        query: {
+          type: 'string',
+          description: 'Search query to find mobile devices',
+        },
+        limit: {
+          type: 'number',
+          description: 'Maximum number of results to return',
+          default: 50,
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      {
-        name: 'getDeviceComplianceSummary',
-        description: 'Get device compliance summary showing devices checking in regularly, devices with failed policies, and devices missing critical software',
-        inputSchema: {
-          type: 'object',
-          properties: {},
+      required: ['query'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'getMobileDeviceDetails',
+    description: 'Get detailed information about a specific mobile device including hardware, OS, battery, and management status',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        deviceId: {
+          type: 'string',
+          description: 'The mobile device ID',
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      // ==========================================
-      // Computer History Tools
-      // ==========================================
-      {
-        name: 'getComputerHistory',
-        description: 'Get full computer history including policy logs, MDM commands, audit events, screen sharing sessions, and user/location changes',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            deviceId: {
-              type: 'string',
-              description: 'The Jamf computer ID',
-            },
-            subset: {
-              type: 'string',
-              description: 'Optional subset: General, PolicyLogs, Commands, ScreenSharing, Audits, UserLocation, MacAppStoreApplications, CasperRemote, CasperImagingLogs',
-            },
-          },
-          required: ['deviceId'],
+      required: ['deviceId'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'listMobileDevices',
+    description: 'List all mobile devices in Jamf Pro with basic information',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        limit: {
+          type: 'number',
+          description: 'Maximum number of mobile devices to return',
+          default: 50,
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      {
-        name: 'getComputerPolicyLogs',
-        description: 'Get policy execution logs for a specific computer showing which policies ran, when, and whether they succeeded or failed',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            deviceId: {
-              type: 'string',
-              description: 'The Jamf computer ID',
-            },
-          },
-          required: ['deviceId'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'listMobileDeviceApplications',
+    description: 'List all mobile device applications configured for delivery in Jamf Pro',
+    inputSchema: {
+      type: 'object',
+      properties: {},
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'getMobileDeviceApplicationDetails',
+    description: 'Get detailed information about a mobile device application configured for delivery in Jamf Pro',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        applicationId: {
+          type: 'string',
+          description: 'The mobile device application ID',
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      {
-        name: 'getComputerMDMCommandHistory',
-        description: 'Get MDM command history for a specific computer showing commands sent, their status, and timestamps',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            deviceId: {
-              type: 'string',
-              description: 'The Jamf computer ID',
-            },
-          },
-          required: ['deviceId'],
+      required: ['applicationId'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'updateMobileDeviceInventory',
+    description: 'Force an inventory update on a specific mobile device',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        deviceId: {
+          type: 'string',
+          description: 'The mobile device ID to update inventory for',
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      // ==========================================
-      // Computer MDM Commands
-      // ==========================================
-      {
-        name: 'sendComputerMDMCommand',
-        description: 'Send an MDM command to a macOS computer (lock, wipe, restart, shutdown, enable/disable remote desktop, etc.)',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            deviceId: {
-              type: 'string',
-              description: 'The Jamf computer ID or management ID',
-            },
-            command: {
-              type: 'string',
-              description: 'MDM command: DeviceLock, EraseDevice, RestartDevice, ShutDownDevice, EnableRemoteDesktop, DisableRemoteDesktop, SetRecoveryLock, UpdateInventory, UnmanageDevice',
-            },
-            confirm: {
-              type: 'boolean',
-              description: 'Confirmation required for destructive commands',
-              default: false,
-            },
-          },
-          required: ['deviceId', 'command'],
+      required: ['deviceId'],
+    },
+    annotations: { readOnlyHint: false, destructiveHint: false },
+  },
+  {
+    name: 'sendMDMCommand',
+    description: 'Send an MDM command to a mobile device (e.g., lock, wipe, clear passcode) - requires confirmation for destructive actions',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        deviceId: {
+          type: 'string',
+          description: 'The mobile device ID to send command to',
+        },
+        command: {
+          type: 'string',
+          description: 'The MDM command to send',
+          enum: [
+            'DeviceLock',
+            'EraseDevice',
+            'ClearPasscode',
+            'RestartDevice',
+            'ShutDownDevice',
+            'EnableLostMode',
+            'DisableLostMode',
+            'PlayLostModeSound',
+            'UpdateInventory',
+            'ClearRestrictionsPassword',
+            'SettingsEnableBluetooth',
+            'SettingsDisableBluetooth',
+            'SettingsEnableWiFi',
+            'SettingsDisableWiFi',
+            'SettingsEnableDataRoaming',
+            'SettingsDisableDataRoaming',
+            'SettingsEnableVoiceRoaming',
+            'SettingsDisableVoiceRoaming',
+            'SettingsEnablePersonalHotspot',
+            'SettingsDisablePersonalHotspot',
+          ],
+        },
+        confirm: {
+          type: 'boolean',
+          description: 'Confirmation flag for destructive commands',
+          default: false,
         },
-        annotations: { readOnlyHint: false, destructiveHint: true },
       },
-      // ==========================================
-      // Command Flush
-      // ==========================================
-      {
-        name: 'flushMDMCommands',
-        description: 'Clear pending or failed MDM commands for a computer. Use this to unstick devices with stuck MDM command queues.',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            deviceId: {
-              type: 'string',
-              description: 'The Jamf computer ID',
-            },
-            commandStatus: {
-              type: 'string',
-              description: 'Status of commands to flush: Pending, Failed, or Pending+Failed',
-            },
-            confirm: {
-              type: 'boolean',
-              description: 'Confirmation required to flush commands',
-              default: false,
-            },
-          },
-          required: ['deviceId', 'commandStatus'],
+      required: ['deviceId', 'command'],
+    },
+    annotations: { readOnlyHint: false, destructiveHint: true },
+  },
+  {
+    name: 'listMobileDeviceGroups',
+    description: 'List mobile device groups in Jamf Pro (smart groups, static groups, or all)',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        type: {
+          type: 'string',
+          enum: ['smart', 'static', 'all'],
+          description: 'Type of mobile device groups to list',
+          default: 'all',
         },
-        annotations: { readOnlyHint: false, destructiveHint: true },
       },
-      // ==========================================
-      // Buildings
-      // ==========================================
-      {
-        name: 'listBuildings',
-        description: 'List all buildings defined in Jamf Pro. Buildings are used for organizational scoping in multi-site deployments.',
-        inputSchema: {
-          type: 'object',
-          properties: {},
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'getMobileDeviceGroupDetails',
+    description: 'Get detailed information about a specific mobile device group including membership and criteria',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        groupId: {
+          type: 'string',
+          description: 'The mobile device group ID',
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      {
-        name: 'getBuildingDetails',
-        description: 'Get details for a specific building including name, street address, and associated information',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            buildingId: {
-              type: 'string',
-              description: 'The Jamf building ID',
-            },
-          },
-          required: ['buildingId'],
+      required: ['groupId'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'listPackages',
+    description: 'List all packages in Jamf Pro',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        limit: {
+          type: 'number',
+          description: 'Maximum number of packages to return',
+          default: 100,
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      // ==========================================
-      // Departments
-      // ==========================================
-      {
-        name: 'listDepartments',
-        description: 'List all departments defined in Jamf Pro. Departments are used for organizational scoping and reporting.',
-        inputSchema: {
-          type: 'object',
-          properties: {},
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'searchPackages',
+    description: 'Search for packages by name',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        query: {
+          type: 'string',
+          description: 'Search query for package name',
+        },
+        limit: {
+          type: 'number',
+          description: 'Maximum number of results',
+          default: 50,
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      {
-        name: 'getDepartmentDetails',
-        description: 'Get details for a specific department',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            departmentId: {
-              type: 'string',
-              description: 'The Jamf department ID',
-            },
-          },
-          required: ['departmentId'],
+      required: ['query'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'getPackageDetails',
+    description: 'Get detailed information about a specific package',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        packageId: {
+          type: 'string',
+          description: 'The Jamf package ID',
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      // ==========================================
-      // Categories
-      // ==========================================
-      {
-        name: 'listCategories',
-        description: 'List all categories defined in Jamf Pro. Categories are used to organize policies, scripts, packages, and configuration profiles.',
-        inputSchema: {
-          type: 'object',
-          properties: {},
+      required: ['packageId'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'getPackageDeploymentHistory',
+    description: 'Get deployment history for a specific package',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        packageId: {
+          type: 'string',
+          description: 'The Jamf package ID',
+        },
+        limit: {
+          type: 'number',
+          description: 'Maximum number of deployment records to return',
+          default: 50,
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      {
-        name: 'getCategoryDetails',
-        description: 'Get details for a specific category including its name and priority',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            categoryId: {
-              type: 'string',
-              description: 'The Jamf category ID',
-            },
-          },
-          required: ['categoryId'],
+      required: ['packageId'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'getPoliciesUsingPackage',
+    description: 'Find all policies that use a specific package',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        packageId: {
+          type: 'string',
+          description: 'The Jamf package ID',
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      // ==========================================
-      // LAPS (Local Administrator Password Solution) Tools
-      // ==========================================
-      {
-        name: 'getLocalAdminPassword',
-        description: 'Retrieve the current LAPS password for a device. This is a sensitive security operation that requires confirmation.',
-        inputSchema: {
+      required: ['packageId'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'createPolicy',
+    description: 'Create a new policy with configuration (requires confirmation)',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        policyData: {
           type: 'object',
+          description: 'Policy configuration data',
           properties: {
-            clientManagementId: {
-              type: 'string',
-              description: 'The client management ID (UDID) of the device',
+            general: {
+              type: 'object',
+              description: 'General policy settings',
+              properties: {
+                name: { type: 'string', description: 'Policy name' },
+                enabled: { type: 'boolean', description: 'Whether the policy is enabled' },
+                trigger: { type: 'string', description: 'Policy trigger type' },
+                trigger_checkin: { type: 'boolean', description: 'Trigger on check-in' },
+                trigger_enrollment_complete: { type: 'boolean', description: 'Trigger on enrollment complete' },
+                trigger_login: { type: 'boolean', description: 'Trigger on login' },
+                trigger_logout: { type: 'boolean', description: 'Trigger on logout' },
+                trigger_network_state_changed: { type: 'boolean', description: 'Trigger on network state change' },
+                trigger_startup: { type: 'boolean', description: 'Trigger on startup' },
+                trigger_other: { type: 'string', description: 'Custom trigger name' },
+                frequency: { type: 'string', description: 'Execution frequency' },
+                category: { type: 'string', description: 'Policy category' },
+              },
+              required: ['name'],
             },
-            username: {
-              type: 'string',
-              description: 'The local admin account username',
+            scope: {
+              type: 'object',
+              description: 'Policy scope settings',
+              properties: {
+                all_computers: { type: 'boolean', description: 'Apply to all computers' },
+                computers: {
+                  type: 'array',
+                  items: { type: 'object', properties: { id: { type: 'number' } } },
+                  description: 'Specific computers',
+                },
+                computer_groups: {
+                  type: 'array',
+                  items: { type: 'object', properties: { id: { type: 'number' } } },
+                  description: 'Computer groups',
+                },
+              },
             },
-            confirm: {
-              type: 'boolean',
-              description: 'Confirmation required to retrieve the password',
-              default: false,
+            package_configuration: {
+              type: 'object',
+              description: 'Package configuration',
+              properties: {
+                packages: {
+                  type: 'array',
+                  items: {
+                    type: 'object',
+                    properties: {
+                      id: { type: 'number', description: 'Package ID' },
+                      action: { type: 'string', description: 'Install action' },
+                    },
+                    required: ['id'],
+                  },
+                },
+              },
+            },
+            scripts: {
+              type: 'array',
+              description: 'Scripts to run',
+              items: {
+                type: 'object',
+                properties: {
+                  id: { type: 'number', description: 'Script ID' },
+                  priority: { type: 'string', description: 'Script priority (Before, After)' },
+                },
+                required: ['id'],
+              },
             },
           },
-          required: ['clientManagementId', 'username'],
+          required: ['general'],
+        },
+        confirm: {
+          type: 'boolean',
+          description: 'Confirmation flag for policy creation',
+          default: false,
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      {
-        name: 'getLocalAdminPasswordAudit',
-        description: 'Get the audit trail of LAPS password views and rotations for a device account',
-        inputSchema: {
+      required: ['policyData'],
+    },
+    annotations: { readOnlyHint: false, destructiveHint: false },
+  },
+  {
+    name: 'updatePolicy',
+    description: 'Update an existing policy configuration (requires confirmation)',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        policyId: {
+          type: 'string',
+          description: 'The policy ID to update',
+        },
+        policyData: {
           type: 'object',
+          description: 'Policy configuration data to update',
           properties: {
-            clientManagementId: {
-              type: 'string',
-              description: 'The client management ID (UDID) of the device',
+            general: {
+              type: 'object',
+              description: 'General policy settings to update',
+              properties: {
+                name: { type: 'string', description: 'Policy name' },
+                enabled: { type: 'boolean', description: 'Whether the policy is enabled' },
+                trigger: { type: 'string', description: 'Policy trigger type' },
+                frequency: { type: 'string', description: 'Execution frequency' },
+                category: { type: 'string', description: 'Policy category' },
+              },
             },
-            username: {
-              type: 'string',
-              description: 'The local admin account username',
+            scope: {
+              type: 'object',
+              description: 'Policy scope settings to update',
             },
-          },
-          required: ['clientManagementId', 'username'],
-        },
-        annotations: { readOnlyHint: true, destructiveHint: false },
-      },
-      {
-        name: 'getLocalAdminPasswordAccounts',
-        description: 'List all LAPS-managed local admin accounts on a device',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            clientManagementId: {
-              type: 'string',
-              description: 'The client management ID (UDID) of the device',
+            package_configuration: {
+              type: 'object',
+              description: 'Package configuration to update',
+            },
+            scripts: {
+              type: 'array',
+              description: 'Scripts to run',
             },
           },
-          required: ['clientManagementId'],
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
+        confirm: {
+          type: 'boolean',
+          description: 'Confirmation flag for policy update',
+          default: false,
+        },
       },
-      // ==========================================
-      // Patch Management Tools
-      // ==========================================
-      {
-        name: 'listPatchSoftwareTitles',
-        description: 'List all patch software title configurations in Jamf Pro for tracking patch compliance',
-        inputSchema: {
-          type: 'object',
-          properties: {},
+      required: ['policyId', 'policyData'],
+    },
+    annotations: { readOnlyHint: false, destructiveHint: false },
+  },
+  {
+    name: 'clonePolicy',
+    description: 'Clone an existing policy with a new name (requires confirmation)',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        sourcePolicyId: {
+          type: 'string',
+          description: 'The source policy ID to clone',
+        },
+        newName: {
+          type: 'string',
+          description: 'Name for the cloned policy',
+        },
+        confirm: {
+          type: 'boolean',
+          description: 'Confirmation flag for policy cloning',
+          default: false,
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      {
-        name: 'getPatchSoftwareTitleDetails',
-        description: 'Get details for a specific patch software title including versions, patch definitions, and reporting data',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            titleId: {
-              type: 'string',
-              description: 'The patch software title configuration ID',
-            },
-          },
-          required: ['titleId'],
+      required: ['sourcePolicyId', 'newName'],
+    },
+    annotations: { readOnlyHint: false, destructiveHint: false },
+  },
+  {
+    name: 'setPolicyEnabled',
+    description: 'Enable or disable a policy (requires confirmation)',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        policyId: {
+          type: 'string',
+          description: 'The policy ID',
+        },
+        enabled: {
+          type: 'boolean',
+          description: 'Whether to enable or disable the policy',
+        },
+        confirm: {
+          type: 'boolean',
+          description: 'Confirmation flag for enabling/disabling policy',
+          default: false,
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      {
-        name: 'listPatchPolicies',
-        description: 'List patch policies with deployment status. Optionally filter by software title.',
-        inputSchema: {
+      required: ['policyId', 'enabled'],
+    },
+    annotations: { readOnlyHint: false, destructiveHint: false },
+  },
+  {
+    name: 'updatePolicyScope',
+    description: 'Update policy scope by adding/removing computers and groups (requires confirmation)',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        policyId: {
+          type: 'string',
+          description: 'The policy ID to update scope for',
+        },
+        scopeUpdates: {
           type: 'object',
+          description: 'Scope update operations',
           properties: {
-            titleId: {
-              type: 'string',
-              description: 'Optional software title configuration ID to filter by',
+            addComputers: {
+              type: 'array',
+              items: { type: 'string' },
+              description: 'Computer IDs to add to scope',
+            },
+            removeComputers: {
+              type: 'array',
+              items: { type: 'string' },
+              description: 'Computer IDs to remove from scope',
+            },
+            addComputerGroups: {
+              type: 'array',
+              items: { type: 'string' },
+              description: 'Computer group IDs to add to scope',
+            },
+            removeComputerGroups: {
+              type: 'array',
+              items: { type: 'string' },
+              description: 'Computer group IDs to remove from scope',
+            },
+            replaceComputers: {
+              type: 'array',
+              items: { type: 'string' },
+              description: 'Replace all computers in scope with these IDs',
+            },
+            replaceComputerGroups: {
+              type: 'array',
+              items: { type: 'string' },
+              description: 'Replace all computer groups in scope with these IDs',
             },
           },
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
+        confirm: {
+          type: 'boolean',
+          description: 'Confirmation flag for scope update',
+          default: false,
+        },
       },
-      {
-        name: 'getPatchPolicyDashboard',
-        description: 'Get patch policy compliance dashboard showing devices on latest version, pending updates, and failed patches',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            policyId: {
-              type: 'string',
-              description: 'The patch policy ID',
-            },
-          },
-          required: ['policyId'],
+      required: ['policyId', 'scopeUpdates'],
+    },
+    annotations: { readOnlyHint: false, destructiveHint: false },
+  },
+  {
+    name: 'deletePolicy',
+    description: 'Delete a policy from Jamf Pro (requires confirmation)',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        policyId: {
+          type: 'string',
+          description: 'The policy ID to delete',
+        },
+        confirm: {
+          type: 'boolean',
+          description: 'Confirmation flag for policy deletion',
+          default: false,
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      // ==========================================
-      // Extension Attributes Tools
-      // ==========================================
-      {
-        name: 'listComputerExtensionAttributes',
-        description: 'List all computer Extension Attributes defined in Jamf Pro. Extension Attributes collect custom data via scripts.',
-        inputSchema: {
-          type: 'object',
-          properties: {},
+      required: ['policyId'],
+    },
+    annotations: { readOnlyHint: false, destructiveHint: true },
+  },
+  {
+    name: 'listScripts',
+    description: 'List all scripts in Jamf Pro',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        limit: {
+          type: 'number',
+          description: 'Maximum number of scripts to return',
+          default: 100,
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      {
-        name: 'getComputerExtensionAttributeDetails',
-        description: 'Get full details for a specific Extension Attribute including script content, data type, and inventory display settings',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            attributeId: {
-              type: 'string',
-              description: 'The Extension Attribute ID',
-            },
-          },
-          required: ['attributeId'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'searchScripts',
+    description: 'Search for scripts by name',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        query: {
+          type: 'string',
+          description: 'Search query for script name',
+        },
+        limit: {
+          type: 'number',
+          description: 'Maximum number of results',
+          default: 50,
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      {
-        name: 'createComputerExtensionAttribute',
-        description: 'Create a new computer Extension Attribute for custom data collection',
-        inputSchema: {
+      required: ['query'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'createScript',
+    description: 'Create a new script with contents and parameters (requires confirmation)',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        scriptData: {
           type: 'object',
+          description: 'Script configuration data',
           properties: {
             name: {
               type: 'string',
-              description: 'Name of the Extension Attribute',
+              description: 'Script name',
+            },
+            script_contents: {
+              type: 'string',
+              description: 'Script contents',
             },
-            description: {
+            category: {
               type: 'string',
-              description: 'Description of what this EA collects',
+              description: 'Script category',
             },
-            dataType: {
+            info: {
               type: 'string',
-              description: 'Data type: String, Integer, or Date',
-              default: 'String',
+              description: 'Script info/description',
             },
-            inputType: {
+            notes: {
               type: 'string',
-              description: 'Input type: script, Text Field, or Pop-up Menu',
-              default: 'script',
+              description: 'Script notes',
             },
-            scriptContents: {
+            priority: {
               type: 'string',
-              description: 'Script content for script-type Extension Attributes',
+              description: 'Script priority',
+            },
+            parameters: {
+              type: 'object',
+              description: 'Script parameter labels',
+              properties: {
+                parameter4: { type: 'string', description: 'Parameter 4 label' },
+                parameter5: { type: 'string', description: 'Parameter 5 label' },
+                parameter6: { type: 'string', description: 'Parameter 6 label' },
+                parameter7: { type: 'string', description: 'Parameter 7 label' },
+                parameter8: { type: 'string', description: 'Parameter 8 label' },
+                parameter9: { type: 'string', description: 'Parameter 9 label' },
+                parameter10: { type: 'string', description: 'Parameter 10 label' },
+                parameter11: { type: 'string', description: 'Parameter 11 label' },
+              },
             },
-            inventoryDisplay: {
+            os_requirements: {
               type: 'string',
-              description: 'Inventory display category',
-              default: 'Extension Attributes',
+              description: 'OS requirements',
             },
-            confirm: {
+            script_contents_encoded: {
               type: 'boolean',
-              description: 'Confirmation required to create',
-              default: false,
+              description: 'Whether script contents are encoded',
             },
           },
-          required: ['name'],
+          required: ['name', 'script_contents'],
+        },
+        confirm: {
+          type: 'boolean',
+          description: 'Confirmation flag for script creation',
+          default: false,
         },
-        annotations: { readOnlyHint: false, destructiveHint: false },
       },
-      {
-        name: 'updateComputerExtensionAttribute',
-        description: 'Update an existing computer Extension Attribute definition or script',
-        inputSchema: {
+      required: ['scriptData'],
+    },
+    annotations: { readOnlyHint: false, destructiveHint: false },
+  },
+  {
+    name: 'updateScript',
+    description: 'Update an existing script (requires confirmation)',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        scriptId: {
+          type: 'string',
+          description: 'The script ID to update',
+        },
+        scriptData: {
           type: 'object',
+          description: 'Script configuration data to update',
           properties: {
-            attributeId: {
+            name: {
               type: 'string',
-              description: 'The Extension Attribute ID to update',
+              description: 'Script name',
             },
-            name: {
+            script_contents: {
               type: 'string',
-              description: 'Updated name',
+              description: 'Script contents',
             },
-            description: {
+            category: {
               type: 'string',
-              description: 'Updated description',
+              description: 'Script category',
             },
-            dataType: {
+            info: {
               type: 'string',
-              description: 'Updated data type',
+              description: 'Script info/description',
             },
-            scriptContents: {
+            notes: {
               type: 'string',
-              description: 'Updated script content',
+              description: 'Script notes',
             },
-            confirm: {
-              type: 'boolean',
-              description: 'Confirmation required to update',
-              default: false,
+            priority: {
+              type: 'string',
+              description: 'Script priority',
             },
-          },
-          required: ['attributeId'],
-        },
-        annotations: { readOnlyHint: false, destructiveHint: false },
-      },
-      {
-        name: 'deleteComputerExtensionAttribute',
-        description: 'Delete a computer Extension Attribute (requires confirmation)',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            attributeId: {
+            parameters: {
+              type: 'object',
+              description: 'Script parameter labels',
+              properties: {
+                parameter4: { type: 'string', description: 'Parameter 4 label' },
+                parameter5: { type: 'string', description: 'Parameter 5 label' },
+                parameter6: { type: 'string', description: 'Parameter 6 label' },
+                parameter7: { type: 'string', description: 'Parameter 7 label' },
+                parameter8: { type: 'string', description: 'Parameter 8 label' },
+                parameter9: { type: 'string', description: 'Parameter 9 label' },
+                parameter10: { type: 'string', description: 'Parameter 10 label' },
+                parameter11: { type: 'string', description: 'Parameter 11 label' },
+              },
+            },
+            os_requirements: {
               type: 'string',
-              description: 'The Extension Attribute ID to delete',
+              description: 'OS requirements',
             },
-            confirm: {
+            script_contents_encoded: {
               type: 'boolean',
-              description: 'Confirmation flag for extension attribute deletion',
-              default: false,
+              description: 'Whether script contents are encoded',
             },
           },
-          required: ['attributeId'],
         },
-        annotations: { readOnlyHint: false, destructiveHint: true },
+        confirm: {
+          type: 'boolean',
+          description: 'Confirmation flag for script update',
+          default: false,
+        },
       },
-
-      // ==========================================
-      // Managed Software Updates Tools
-      // ==========================================
-      {
-        name: 'listSoftwareUpdatePlans',
-        description: 'List all managed software update plans in Jamf Pro including active and completed OS update plans',
-        inputSchema: {
-          type: 'object',
-          properties: {},
+      required: ['scriptId', 'scriptData'],
+    },
+    annotations: { readOnlyHint: false, destructiveHint: false },
+  },
+  {
+    name: 'deleteScript',
+    description: 'Delete a script (requires confirmation)',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        scriptId: {
+          type: 'string',
+          description: 'The script ID to delete',
+        },
+        confirm: {
+          type: 'boolean',
+          description: 'Confirmation flag for script deletion',
+          default: false,
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      {
-        name: 'createSoftwareUpdatePlan',
-        description: 'Create a managed software update plan to deploy OS updates to specific devices (requires confirmation)',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            deviceIds: {
-              type: 'array',
-              items: { type: 'string' },
-              description: 'Array of device IDs to target for the update',
-            },
-            updateAction: {
-              type: 'string',
-              description: 'Update action: DOWNLOAD_AND_INSTALL, DOWNLOAD_ONLY, or INSTALL_IMMEDIATELY',
-            },
-            versionType: {
-              type: 'string',
-              description: 'Version type: LATEST_MAJOR, LATEST_MINOR, or SPECIFIC_VERSION',
-            },
-            specificVersion: {
-              type: 'string',
-              description: 'Specific OS version when versionType is SPECIFIC_VERSION',
-            },
-            confirm: {
-              type: 'boolean',
-              description: 'Confirmation required to create the update plan',
-              default: false,
-            },
-          },
-          required: ['deviceIds', 'updateAction', 'versionType'],
+      required: ['scriptId'],
+    },
+    annotations: { readOnlyHint: false, destructiveHint: true },
+  },
+  // Reporting and Analytics Tools
+  {
+    name: 'getInventorySummary',
+    description: 'Get inventory summary report including total devices, OS version distribution, and model distribution',
+    inputSchema: {
+      type: 'object',
+      properties: {},
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'getPolicyComplianceReport',
+    description: 'Get policy compliance report showing success/failure rates, computers in scope vs completed, and last execution times',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        policyId: {
+          type: 'string',
+          description: 'The Jamf policy ID to generate compliance report for',
         },
-        annotations: { readOnlyHint: false, destructiveHint: false },
       },
-      {
-        name: 'getSoftwareUpdatePlanDetails',
-        description: 'Get detailed status of a specific managed software update plan including target devices and progress',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            planId: {
-              type: 'string',
-              description: 'The software update plan ID',
-            },
-          },
-          required: ['planId'],
+      required: ['policyId'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'getPackageDeploymentStats',
+    description: 'Get package deployment statistics including policies using the package, deployment success rate, and target device count',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        packageId: {
+          type: 'string',
+          description: 'The Jamf package ID to get deployment statistics for',
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-
-      // ==========================================
-      // Computer Prestages Tools
-      // ==========================================
-      {
-        name: 'listComputerPrestages',
-        description: 'List all computer PreStage Enrollments in Jamf Pro for automated device enrollment configuration',
-        inputSchema: {
-          type: 'object',
-          properties: {},
+      required: ['packageId'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'getSoftwareVersionReport',
+    description: 'Get software version report showing version distribution across devices and out-of-date installations',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        softwareName: {
+          type: 'string',
+          description: 'Name of the software to search for version information',
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      {
-        name: 'getComputerPrestageDetails',
-        description: 'Get detailed configuration of a specific computer PreStage Enrollment',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            prestageId: {
-              type: 'string',
-              description: 'The computer PreStage Enrollment ID',
-            },
-          },
-          required: ['prestageId'],
+      required: ['softwareName'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'getDeviceComplianceSummary',
+    description: 'Get device compliance summary showing devices checking in regularly, devices with failed policies, and devices missing critical software',
+    inputSchema: {
+      type: 'object',
+      properties: {},
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  // ==========================================
+  // Computer History Tools
+  // ==========================================
+  {
+    name: 'getComputerHistory',
+    description: 'Get full computer history including policy logs, MDM commands, audit events, screen sharing sessions, and user/location changes',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        deviceId: {
+          type: 'string',
+          description: 'The Jamf computer ID',
+        },
+        subset: {
+          type: 'string',
+          description: 'Optional subset: General, PolicyLogs, Commands, ScreenSharing, Audits, UserLocation, MacAppStoreApplications, CasperRemote, CasperImagingLogs',
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      {
-        name: 'getComputerPrestageScope',
-        description: 'Get the list of devices assigned to a specific computer PreStage Enrollment',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            prestageId: {
-              type: 'string',
-              description: 'The computer PreStage Enrollment ID',
-            },
-          },
-          required: ['prestageId'],
+      required: ['deviceId'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'getComputerPolicyLogs',
+    description: 'Get policy execution logs for a specific computer showing which policies ran, when, and whether they succeeded or failed',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        deviceId: {
+          type: 'string',
+          description: 'The Jamf computer ID',
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-
-      // ==========================================
-      // Network Segments Tools
-      // ==========================================
-      {
-        name: 'listNetworkSegments',
-        description: 'List all network segments configured in Jamf Pro for location-based management',
-        inputSchema: {
-          type: 'object',
-          properties: {},
+      required: ['deviceId'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'getComputerMDMCommandHistory',
+    description: 'Get MDM command history for a specific computer showing commands sent, their status, and timestamps',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        deviceId: {
+          type: 'string',
+          description: 'The Jamf computer ID',
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      {
-        name: 'getNetworkSegmentDetails',
-        description: 'Get detailed information about a specific network segment including IP ranges and building assignment',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            segmentId: {
-              type: 'string',
-              description: 'The network segment ID',
-            },
-          },
-          required: ['segmentId'],
+      required: ['deviceId'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  // ==========================================
+  // Computer MDM Commands
+  // ==========================================
+  {
+    name: 'sendComputerMDMCommand',
+    description: 'Send an MDM command to a macOS computer (lock, wipe, restart, shutdown, enable/disable remote desktop, etc.)',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        deviceId: {
+          type: 'string',
+          description: 'The Jamf computer ID or management ID',
+        },
+        command: {
+          type: 'string',
+          description: 'MDM command: DeviceLock, EraseDevice, RestartDevice, ShutDownDevice, EnableRemoteDesktop, DisableRemoteDesktop, SetRecoveryLock, UpdateInventory, UnmanageDevice',
+        },
+        confirm: {
+          type: 'boolean',
+          description: 'Confirmation required for destructive commands',
+          default: false,
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-
-      // ==========================================
-      // Mobile Prestages Tools
-      // ==========================================
-      {
-        name: 'listMobilePrestages',
-        description: 'List all mobile device PreStage Enrollments in Jamf Pro for automated mobile device enrollment',
-        inputSchema: {
-          type: 'object',
-          properties: {},
+      required: ['deviceId', 'command'],
+    },
+    annotations: { readOnlyHint: false, destructiveHint: true },
+  },
+  // ==========================================
+  // Command Flush
+  // ==========================================
+  {
+    name: 'flushMDMCommands',
+    description: 'Clear pending or failed MDM commands for a computer. Use this to unstick devices with stuck MDM command queues.',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        deviceId: {
+          type: 'string',
+          description: 'The Jamf computer ID',
+        },
+        commandStatus: {
+          type: 'string',
+          description: 'Status of commands to flush: Pending, Failed, or Pending+Failed',
+        },
+        confirm: {
+          type: 'boolean',
+          description: 'Confirmation required to flush commands',
+          default: false,
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      {
-        name: 'getMobilePrestageDetails',
-        description: 'Get detailed configuration of a specific mobile device PreStage Enrollment',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            prestageId: {
-              type: 'string',
-              description: 'The mobile device PreStage Enrollment ID',
-            },
-          },
-          required: ['prestageId'],
+      required: ['deviceId', 'commandStatus'],
+    },
+    annotations: { readOnlyHint: false, destructiveHint: true },
+  },
+  // ==========================================
+  // Buildings
+  // ==========================================
+  {
+    name: 'listBuildings',
+    description: 'List all buildings defined in Jamf Pro. Buildings are used for organizational scoping in multi-site deployments.',
+    inputSchema: {
+      type: 'object',
+      properties: {},
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'getBuildingDetails',
+    description: 'Get details for a specific building including name, street address, and associated information',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        buildingId: {
+          type: 'string',
+          description: 'The Jamf building ID',
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-
-      // ==========================================
-      // Accounts Tools
-      // ==========================================
-      {
-        name: 'listAccounts',
-        description: 'List all Jamf Pro admin accounts and groups',
-        inputSchema: {
-          type: 'object',
-          properties: {},
+      required: ['buildingId'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  // ==========================================
+  // Departments
+  // ==========================================
+  {
+    name: 'listDepartments',
+    description: 'List all departments defined in Jamf Pro. Departments are used for organizational scoping and reporting.',
+    inputSchema: {
+      type: 'object',
+      properties: {},
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'getDepartmentDetails',
+    description: 'Get details for a specific department',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        departmentId: {
+          type: 'string',
+          description: 'The Jamf department ID',
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      {
-        name: 'getAccountDetails',
-        description: 'Get details of a specific Jamf Pro admin account including privileges',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            accountId: {
-              type: 'string',
-              description: 'The Jamf Pro admin account ID',
-            },
-          },
-          required: ['accountId'],
+      required: ['departmentId'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  // ==========================================
+  // Categories
+  // ==========================================
+  {
+    name: 'listCategories',
+    description: 'List all categories defined in Jamf Pro. Categories are used to organize policies, scripts, packages, and configuration profiles.',
+    inputSchema: {
+      type: 'object',
+      properties: {},
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'getCategoryDetails',
+    description: 'Get details for a specific category including its name and priority',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        categoryId: {
+          type: 'string',
+          description: 'The Jamf category ID',
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      {
-        name: 'getAccountGroupDetails',
-        description: 'Get details of a specific Jamf Pro admin group including privileges',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            groupId: {
-              type: 'string',
-              description: 'The Jamf Pro admin group ID',
-            },
-          },
-          required: ['groupId'],
+      required: ['categoryId'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  // ==========================================
+  // LAPS (Local Administrator Password Solution) Tools
+  // ==========================================
+  {
+    name: 'getLocalAdminPassword',
+    description: 'Retrieve the current LAPS password for a device. This is a sensitive security operation that requires confirmation.',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        clientManagementId: {
+          type: 'string',
+          description: 'The client management ID (UDID) of the device',
+        },
+        username: {
+          type: 'string',
+          description: 'The local admin account username',
+        },
+        confirm: {
+          type: 'boolean',
+          description: 'Confirmation required to retrieve the password',
+          default: false,
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-
-      // ==========================================
-      // Users Tools
-      // ==========================================
-      {
-        name: 'listUsers',
-        description: 'List all end-user records in Jamf Pro (not admin accounts)',
-        inputSchema: {
-          type: 'object',
-          properties: {},
+      required: ['clientManagementId', 'username'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'getLocalAdminPasswordAudit',
+    description: 'Get the audit trail of LAPS password views and rotations for a device account',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        clientManagementId: {
+          type: 'string',
+          description: 'The client management ID (UDID) of the device',
+        },
+        username: {
+          type: 'string',
+          description: 'The local admin account username',
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      {
-        name: 'getUserDetails',
-        description: 'Get detailed information about a specific end-user record',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            userId: {
-              type: 'string',
-              description: 'The user ID',
-            },
-          },
-          required: ['userId'],
+      required: ['clientManagementId', 'username'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'getLocalAdminPasswordAccounts',
+    description: 'List all LAPS-managed local admin accounts on a device',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        clientManagementId: {
+          type: 'string',
+          description: 'The client management ID (UDID) of the device',
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      {
-        name: 'searchUsers',
-        description: 'Search for end-user records by name or email address',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            query: {
-              type: 'string',
-              description: 'Search query to match users by name or email',
-            },
-          },
-          required: ['query'],
+      required: ['clientManagementId'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  // ==========================================
+  // Patch Management Tools
+  // ==========================================
+  {
+    name: 'listPatchSoftwareTitles',
+    description: 'List all patch software title configurations in Jamf Pro for tracking patch compliance',
+    inputSchema: {
+      type: 'object',
+      properties: {},
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'getPatchSoftwareTitleDetails',
+    description: 'Get details for a specific patch software title including versions, patch definitions, and reporting data',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        titleId: {
+          type: 'string',
+          description: 'The patch software title configuration ID',
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-
-      // ==========================================
-      // App Installers Tools
-      // ==========================================
-      {
-        name: 'listAppInstallers',
-        description: 'List all Jamf App Catalog installer titles',
-        inputSchema: {
-          type: 'object',
-          properties: {},
+      required: ['titleId'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'listPatchPolicies',
+    description: 'List patch policies with deployment status. Optionally filter by software title.',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        titleId: {
+          type: 'string',
+          description: 'Optional software title configuration ID to filter by',
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      {
-        name: 'getAppInstallerDetails',
-        description: 'Get detailed information about a specific Jamf App Catalog installer title',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            titleId: {
-              type: 'string',
-              description: 'The app installer title ID',
-            },
-          },
-          required: ['titleId'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'getPatchPolicyDashboard',
+    description: 'Get patch policy compliance dashboard showing devices on latest version, pending updates, and failed patches',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        policyId: {
+          type: 'string',
+          description: 'The patch policy ID',
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-
-      // ==========================================
-      // Restricted Software Tools
-      // ==========================================
-      {
-        name: 'listRestrictedSoftware',
-        description: 'List all restricted software entries configured in Jamf Pro',
-        inputSchema: {
-          type: 'object',
-          properties: {},
+      required: ['policyId'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  // ==========================================
+  // Extension Attributes Tools
+  // ==========================================
+  {
+    name: 'listComputerExtensionAttributes',
+    description: 'List all computer Extension Attributes defined in Jamf Pro. Extension Attributes collect custom data via scripts.',
+    inputSchema: {
+      type: 'object',
+      properties: {},
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'getComputerExtensionAttributeDetails',
+    description: 'Get full details for a specific Extension Attribute including script content, data type, and inventory display settings',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        attributeId: {
+          type: 'string',
+          description: 'The Extension Attribute ID',
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      {
-        name: 'getRestrictedSoftwareDetails',
-        description: 'Get detailed configuration of a specific restricted software entry',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            softwareId: {
-              type: 'string',
-              description: 'The restricted software ID',
-            },
-          },
-          required: ['softwareId'],
+      required: ['attributeId'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'createComputerExtensionAttribute',
+    description: 'Create a new computer Extension Attribute for custom data collection',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        name: {
+          type: 'string',
+          description: 'Name of the Extension Attribute',
+        },
+        description: {
+          type: 'string',
+          description: 'Description of what this EA collects',
+        },
+        dataType: {
+          type: 'string',
+          description: 'Data type: String, Integer, or Date',
+          default: 'String',
+        },
+        inputType: {
+          type: 'string',
+          description: 'Input type: script, Text Field, or Pop-up Menu',
+          default: 'script',
+        },
+        scriptContents: {
+          type: 'string',
+          description: 'Script content for script-type Extension Attributes',
+        },
+        inventoryDisplay: {
+          type: 'string',
+          description: 'Inventory display category',
+          default: 'Extension Attributes',
+        },
+        confirm: {
+          type: 'boolean',
+          description: 'Confirmation required to create',
+          default: false,
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      {
-        name: 'createRestrictedSoftware',
-        description: 'Create a new restricted software entry in Jamf Pro (requires confirmation)',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            restrictedSoftwareData: {
-              type: 'object',
-              description: 'Restricted software configuration data',
-              properties: {
-                displayName: {
-                  type: 'string',
-                  description: 'Descriptive name for the restriction',
-                },
-                processName: {
-                  type: 'string',
-                  description: 'Exact process/app name to restrict (e.g. "Chess.app")',
-                },
-                matchExactProcessName: {
-                  type: 'boolean',
-                  description: 'Match exact process name (default true)',
-                },
-                killProcess: {
-                  type: 'boolean',
-                  description: 'Kill process when found',
-                },
-                deleteExecutable: {
-                  type: 'boolean',
-                  description: 'Delete the application executable',
-                },
-                sendNotification: {
-                  type: 'boolean',
-                  description: 'Send notification to user on violation',
-                },
-              },
-              required: ['displayName', 'processName'],
-            },
-            confirm: {
-              type: 'boolean',
-              description: 'Confirmation flag for restricted software creation',
-              default: false,
-            },
-          },
-          required: ['restrictedSoftwareData'],
+      required: ['name'],
+    },
+    annotations: { readOnlyHint: false, destructiveHint: false },
+  },
+  {
+    name: 'updateComputerExtensionAttribute',
+    description: 'Update an existing computer Extension Attribute definition or script',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        attributeId: {
+          type: 'string',
+          description: 'The Extension Attribute ID to update',
+        },
+        name: {
+          type: 'string',
+          description: 'Updated name',
+        },
+        description: {
+          type: 'string',
+          description: 'Updated description',
+        },
+        dataType: {
+          type: 'string',
+          description: 'Updated data type',
+        },
+        scriptContents: {
+          type: 'string',
+          description: 'Updated script content',
+        },
+        confirm: {
+          type: 'boolean',
+          description: 'Confirmation required to update',
+          default: false,
+        },
+      },
+      required: ['attributeId'],
+    },
+    annotations: { readOnlyHint: false, destructiveHint: false },
+  },
+  {
+    name: 'deleteComputerExtensionAttribute',
+    description: 'Delete a computer Extension Attribute (requires confirmation)',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        attributeId: {
+          type: 'string',
+          description: 'The Extension Attribute ID to delete',
+        },
+        confirm: {
+          type: 'boolean',
+          description: 'Confirmation flag for extension attribute deletion',
+          default: false,
+        },
+      },
+      required: ['attributeId'],
+    },
+    annotations: { readOnlyHint: false, destructiveHint: true },
+  },
+
+  // ==========================================
+  // Managed Software Updates Tools
+  // ==========================================
+  {
+    name: 'listSoftwareUpdatePlans',
+    description: 'List all managed software update plans in Jamf Pro including active and completed OS update plans',
+    inputSchema: {
+      type: 'object',
+      properties: {},
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'createSoftwareUpdatePlan',
+    description: 'Create a managed software update plan to deploy OS updates to specific devices (requires confirmation)',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        deviceIds: {
+          type: 'array',
+          items: { type: 'string' },
+          description: 'Array of device IDs to target for the update',
+        },
+        updateAction: {
+          type: 'string',
+          description: 'Update action: DOWNLOAD_AND_INSTALL, DOWNLOAD_ONLY, or INSTALL_IMMEDIATELY',
+        },
+        versionType: {
+          type: 'string',
+          description: 'Version type: LATEST_MAJOR, LATEST_MINOR, or SPECIFIC_VERSION',
+        },
+        specificVersion: {
+          type: 'string',
+          description: 'Specific OS version when versionType is SPECIFIC_VERSION',
+        },
+        confirm: {
+          type: 'boolean',
+          description: 'Confirmation required to create the update plan',
+          default: false,
+        },
+      },
+      required: ['deviceIds', 'updateAction', 'versionType'],
+    },
+    annotations: { readOnlyHint: false, destructiveHint: false },
+  },
+  {
+    name: 'getSoftwareUpdatePlanDetails',
+    description: 'Get detailed status of a specific managed software update plan including target devices and progress',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        planId: {
+          type: 'string',
+          description: 'The software update plan ID',
+        },
+      },
+      required: ['planId'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+
+  // ==========================================
+  // Computer Prestages Tools
+  // ==========================================
+  {
+    name: 'listComputerPrestages',
+    description: 'List all computer PreStage Enrollments in Jamf Pro for automated device enrollment configuration',
+    inputSchema: {
+      type: 'object',
+      properties: {},
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'getComputerPrestageDetails',
+    description: 'Get detailed configuration of a specific computer PreStage Enrollment',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        prestageId: {
+          type: 'string',
+          description: 'The computer PreStage Enrollment ID',
+        },
+      },
+      required: ['prestageId'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'getComputerPrestageScope',
+    description: 'Get the list of devices assigned to a specific computer PreStage Enrollment',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        prestageId: {
+          type: 'string',
+          description: 'The computer PreStage Enrollment ID',
+        },
+      },
+      required: ['prestageId'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+
+  // ==========================================
+  // Network Segments Tools
+  // ==========================================
+  {
+    name: 'listNetworkSegments',
+    description: 'List all network segments configured in Jamf Pro for location-based management',
+    inputSchema: {
+      type: 'object',
+      properties: {},
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'getNetworkSegmentDetails',
+    description: 'Get detailed information about a specific network segment including IP ranges and building assignment',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        segmentId: {
+          type: 'string',
+          description: 'The network segment ID',
+        },
+      },
+      required: ['segmentId'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+
+  // ==========================================
+  // Mobile Prestages Tools
+  // ==========================================
+  {
+    name: 'listMobilePrestages',
+    description: 'List all mobile device PreStage Enrollments in Jamf Pro for automated mobile device enrollment',
+    inputSchema: {
+      type: 'object',
+      properties: {},
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'getMobilePrestageDetails',
+    description: 'Get detailed configuration of a specific mobile device PreStage Enrollment',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        prestageId: {
+          type: 'string',
+          description: 'The mobile device PreStage Enrollment ID',
+        },
+      },
+      required: ['prestageId'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+
+  // ==========================================
+  // Accounts Tools
+  // ==========================================
+  {
+    name: 'listAccounts',
+    description: 'List all Jamf Pro admin accounts and groups',
+    inputSchema: {
+      type: 'object',
+      properties: {},
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'getAccountDetails',
+    description: 'Get details of a specific Jamf Pro admin account including privileges',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        accountId: {
+          type: 'string',
+          description: 'The Jamf Pro admin account ID',
+        },
+      },
+      required: ['accountId'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'getAccountGroupDetails',
+    description: 'Get details of a specific Jamf Pro admin group including privileges',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        groupId: {
+          type: 'string',
+          description: 'The Jamf Pro admin group ID',
+        },
+      },
+      required: ['groupId'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+
+  // ==========================================
+  // Users Tools
+  // ==========================================
+  {
+    name: 'listUsers',
+    description: 'List all end-user records in Jamf Pro (not admin accounts)',
+    inputSchema: {
+      type: 'object',
+      properties: {},
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'getUserDetails',
+    description: 'Get detailed information about a specific end-user record',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        userId: {
+          type: 'string',
+          description: 'The user ID',
+        },
+      },
+      required: ['userId'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'searchUsers',
+    description: 'Search for end-user records by name or email address',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        query: {
+          type: 'string',
+          description: 'Search query to match users by name or email',
+        },
+      },
+      required: ['query'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+
+  // ==========================================
+  // App Installers Tools
+  // ==========================================
+  {
+    name: 'listAppInstallers',
+    description: 'List all Jamf App Catalog installer titles',
+    inputSchema: {
+      type: 'object',
+      properties: {},
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'getAppInstallerDetails',
+    description: 'Get detailed information about a specific Jamf App Catalog installer title',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        titleId: {
+          type: 'string',
+          description: 'The app installer title ID',
+        },
+      },
+      required: ['titleId'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+
+  // ==========================================
+  // Restricted Software Tools
+  // ==========================================
+  {
+    name: 'listRestrictedSoftware',
+    description: 'List all restricted software entries configured in Jamf Pro',
+    inputSchema: {
+      type: 'object',
+      properties: {},
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'getRestrictedSoftwareDetails',
+    description: 'Get detailed configuration of a specific restricted software entry',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        softwareId: {
+          type: 'string',
+          description: 'The restricted software ID',
         },
-        annotations: { readOnlyHint: false, destructiveHint: false },
       },
-      {
-        name: 'updateRestrictedSoftware',
-        description: 'Update an existing restricted software entry (requires confirmation)',
-        inputSchema: {
+      required: ['softwareId'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'createRestrictedSoftware',
+    description: 'Create a new restricted software entry in Jamf Pro (requires confirmation)',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        restrictedSoftwareData: {
           type: 'object',
+          description: 'Restricted software configuration data',
           properties: {
-            softwareId: {
+            displayName: {
               type: 'string',
-              description: 'The restricted software ID to update',
+              description: 'Descriptive name for the restriction',
             },
-            restrictedSoftwareData: {
-              type: 'object',
-              description: 'Restricted software fields to update',
-              properties: {
-                displayName: {
-                  type: 'string',
-                  description: 'Descriptive name for the restriction',
-                },
-                processName: {
-                  type: 'string',
-                  description: 'Exact process/app name to restrict (e.g. "Chess.app")',
-                },
-                matchExactProcessName: {
-                  type: 'boolean',
-                  description: 'Match exact process name',
-                },
-                killProcess: {
-                  type: 'boolean',
-                  description: 'Kill process when found',
-                },
-                deleteExecutable: {
-                  type: 'boolean',
-                  description: 'Delete the application executable',
-                },
-                sendNotification: {
-                  type: 'boolean',
-                  description: 'Send notification to user on violation',
-                },
-              },
+            processName: {
+              type: 'string',
+              description: 'Exact process/app name to restrict (e.g. "Chess.app")',
+            },
+            matchExactProcessName: {
+              type: 'boolean',
+              description: 'Match exact process name (default true)',
+            },
+            killProcess: {
+              type: 'boolean',
+              description: 'Kill process when found',
+            },
+            deleteExecutable: {
+              type: 'boolean',
+              description: 'Delete the application executable',
             },
-            confirm: {
+            sendNotification: {
               type: 'boolean',
-              description: 'Confirmation flag for restricted software update',
-              default: false,
+              description: 'Send notification to user on violation',
             },
           },
-          required: ['softwareId', 'restrictedSoftwareData'],
+          required: ['displayName', 'processName'],
+        },
+        confirm: {
+          type: 'boolean',
+          description: 'Confirmation flag for restricted software creation',
+          default: false,
         },
-        annotations: { readOnlyHint: false, destructiveHint: false },
       },
-      {
-        name: 'deleteRestrictedSoftware',
-        description: 'Delete a restricted software entry (requires confirmation)',
-        inputSchema: {
+      required: ['restrictedSoftwareData'],
+    },
+    annotations: { readOnlyHint: false, destructiveHint: false },
+  },
+  {
+    name: 'updateRestrictedSoftware',
+    description: 'Update an existing restricted software entry (requires confirmation)',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        softwareId: {
+          type: 'string',
+          description: 'The restricted software ID to update',
+        },
+        restrictedSoftwareData: {
           type: 'object',
+          description: 'Restricted software fields to update',
           properties: {
-            softwareId: {
+            displayName: {
+              type: 'string',
+              description: 'Descriptive name for the restriction',
+            },
+            processName: {
               type: 'string',
-              description: 'The restricted software ID to delete',
+              description: 'Exact process/app name to restrict (e.g. "Chess.app")',
+            },
+            matchExactProcessName: {
+              type: 'boolean',
+              description: 'Match exact process name',
+            },
+            killProcess: {
+              type: 'boolean',
+              description: 'Kill process when found',
+            },
+            deleteExecutable: {
+              type: 'boolean',
+              description: 'Delete the application executable',
             },
-            confirm: {
+            sendNotification: {
               type: 'boolean',
-              description: 'Confirmation flag for restricted software deletion',
-              default: false,
+              description: 'Send notification to user on violation',
             },
           },
-          required: ['softwareId'],
         },
-        annotations: { readOnlyHint: false, destructiveHint: true },
+        confirm: {
+          type: 'boolean',
+          description: 'Confirmation flag for restricted software update',
+          default: false,
+        },
       },
-
-      // ==========================================
-      // Webhooks Tools
-      // ==========================================
-      {
-        name: 'listWebhooks',
-        description: 'List all configured webhooks in Jamf Pro',
-        inputSchema: {
-          type: 'object',
-          properties: {},
+      required: ['softwareId', 'restrictedSoftwareData'],
+    },
+    annotations: { readOnlyHint: false, destructiveHint: false },
+  },
+  {
+    name: 'deleteRestrictedSoftware',
+    description: 'Delete a restricted software entry (requires confirmation)',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        softwareId: {
+          type: 'string',
+          description: 'The restricted software ID to delete',
+        },
+        confirm: {
+          type: 'boolean',
+          description: 'Confirmation flag for restricted software deletion',
+          default: false,
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-      {
-        name: 'getWebhookDetails',
-        description: 'Get detailed configuration of a specific webhook',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            webhookId: {
-              type: 'string',
-              description: 'The webhook ID',
-            },
-          },
-          required: ['webhookId'],
+      required: ['softwareId'],
+    },
+    annotations: { readOnlyHint: false, destructiveHint: true },
+  },
+
+  // ==========================================
+  // Webhooks Tools
+  // ==========================================
+  {
+    name: 'listWebhooks',
+    description: 'List all configured webhooks in Jamf Pro',
+    inputSchema: {
+      type: 'object',
+      properties: {},
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+  {
+    name: 'getWebhookDetails',
+    description: 'Get detailed configuration of a specific webhook',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        webhookId: {
+          type: 'string',
+          description: 'The webhook ID',
         },
-        annotations: { readOnlyHint: true, destructiveHint: false },
       },
-    ];
+      required: ['webhookId'],
+    },
+    annotations: { readOnlyHint: true, destructiveHint: false },
+  },
+];
 
-    return { tools };
+export function registerTools(server: Server, jamfClient: IJamfApiClient): void {
+  server.setRequestHandler(ListToolsRequestSchema, async () => {
+    return { tools: TOOL_DEFINITIONS };
   });
 
   server.setRequestHandler(CallToolRequestSchema, async (request) => {
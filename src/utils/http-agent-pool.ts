@@ -76,7 +76,7 @@ export class AgentPool {
     });
 
     // Set keep-alive timeout
-    this.setupKeepAliveTimeout(keepAliveTimeout);
+    this.setupKeepAliveTimeout(keepAliveTimeout, timeout);
 
     // Setup metrics collection if enabled
     if (enableMetrics) {
@@ -127,14 +127,31 @@ export class AgentPool {
   /**
    * Setup keep-alive timeout handling
    */
-  private setupKeepAliveTimeout(timeout: number): void {
-    // Add timeout handling to both agents
-    const httpsAgentAny = this.httpsAgent as any;
-    const httpAgentAny = this.httpAgent as any;
-    
-    // Store timeout configuration
-    httpsAgentAny.keepAliveTimeout = timeout;
-    httpAgentAny.keepAliveTimeout = timeout;
+  private setupKeepAliveTimeout(timeout: number, activeTimeout: number): void {
+    // Node's agents have no idle timeout for pooled sockets (they reuse the
+    // active socket timeout), so apply it when a socket is returned to the pool.
+    // Closing idle sockets before the server or load balancer does avoids
+    // ECONNRESET on reuse, which would otherwise force a fresh TCP+TLS handshake
+    // plus a retry.
+    for (const agent of [this.httpsAgent, this.httpAgent] as any[]) {
+      const keepSocketAlive = agent.keepSocketAlive.bind(agent);
+      const reuseSocket = agent.reuseSocket.bind(agent);
+
+      agent.keepSocketAlive = (socket: any): boolean => {
+        const keep = keepSocketAlive(socket);
+        if (keep) {
+          // Node has already clamped the timeout to the server's
+          // `Keep-Alive: timeout=N` hint; only ever lower it from there
+          socket.setTimeout(Math.min(timeout, socket.timeout || timeout));
+        }
+        return keep;
+      };
+
+      agent.reuseSocket = (socket: any, req: http.ClientRequest): void => {
+        socket.setTimeout(activeTimeout);
+        reuseSocket(socket, req);
+      };
+    }
     
     logger.debug('Keep-alive timeout configured', { timeout });
   }
@@ -0,0 +1,21 @@
+/**
+ * Deterministic JSON serialization for cache and idempotency keys
+ */
+
+/**
+ * JSON.stringify with sorted object keys, so equivalent values serialize identically.
+ * Undefined object properties are omitted, as JSON.stringify does.
+ */
+export function stableStringify(value: unknown): string {
+  if (Array.isArray(value)) {
+    return `[${value.map(stableStringify).join(',')}]`;
+  }
+  if (value && typeof value === 'object') {
+    const entries = Object.keys(value as Record<string, unknown>)
+      .filter(key => (value as Record<string, unknown>)[key] !== undefined)
+      .sort()
+      .map(key => `${JSON.stringify(key)}:${stableStringify((value as Record<string, unknown>)[key])}`);
+    return `{${entries.join(',')}}`;
+  }
+  return JSON.stringify(value) ?? 'null';
+}